@@ -6,14 +6,13 @@ default, or .env.prod.env when --prod is passed).
 """
 import argparse
 import csv
-import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 import dotenv
 
-import psycopg2
-from psycopg2 import sql
+from db.connection import connection
 
 
 def load_environment(prod=False):
@@ -25,19 +24,13 @@ def load_environment(prod=False):
     )
 
 
+@contextmanager
 def get_connection(prod=False):
-    """Build a read-only Postgres connection from env."""
+    """Borrow a pooled read-only Postgres connection from env."""
     load_environment(prod=prod)
-    conn = psycopg2.connect(
-        dbname=os.getenv("DB_NAME", "classical_sk"),
-        user=os.getenv("DB_USER", "postgres"),
-        password=os.getenv("DB_PASS", ""),
-        host=os.getenv("DB_HOST", "localhost"),
-        port=os.getenv("DB_PORT", "5432"),
-    )
     # Enforce read-only: no INSERT/UPDATE/DELETE/DDL
-    conn.set_session(readonly=True)
-    return conn
+    with connection(readonly=True) as conn:
+        yield conn
 
 
 def main():
@@ -65,24 +58,15 @@ def main():
     args = parser.parse_args()
 
     try:
-        conn = get_connection(prod=args.prod)
-    except Exception as e:
-        print(f"Connection error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    try:
-        with conn.cursor() as cur:
-            # Use sql.SQL().format(sql.Identifier(...)) only for identifiers;
-            # the query itself we pass as a string (user-provided). Read-only
-            # session already prevents writes; we do not use format for the query.
+        with get_connection(prod=args.prod) as conn, conn.cursor() as cur:
+            # The query itself we pass as a string (user-provided). The
+            # read-only session already prevents writes.
             cur.execute(args.query)
             rows = cur.fetchall()
             colnames = [d[0] for d in cur.description] if cur.description else []
     except Exception as e:
         print(f"Query error: {e}", file=sys.stderr)
         sys.exit(1)
-    finally:
-        conn.close()
 
     if args.format == "csv":
         out = csv.writer(sys.stdout)
@@ -13,7 +13,6 @@ from time import monotonic
 from typing import Any
 from urllib.parse import urlparse
 
-import psycopg2
 from psycopg2.extras import Json
 import pystache
 from dotenv import load_dotenv
@@ -25,6 +24,7 @@ from automation.codex_auth import (
     raise_for_codex_auth,
 )
 from crawlers.cities import normalize_city_key
+from db.connection import connection as get_connection
 from observability import configure_logging
 
 
@@ -36,9 +36,6 @@ DEFAULT_LIMIT: int | None = None
 DEFAULT_CONCURRENCY = 4
 DEFAULT_TIMEOUT_SECONDS = 1800
 INTERRUPT_TIMEOUT_SECONDS = 15
-POSTGRES_KEEPALIVES_IDLE_SECONDS = 60
-POSTGRES_KEEPALIVES_INTERVAL_SECONDS = 20
-POSTGRES_KEEPALIVES_COUNT = 3
 MAX_AUTOMATIC_ATTEMPTS = 3
 NO_PROGRAM_RETRY_INTERVAL_DAYS = 7
 TECHNICAL_RETRY_INTERVAL_HOURS = 1
@@ -239,20 +236,6 @@ class ConcertGroup:
     concerts: tuple[Concert, ...]
 
 
-def get_connection():
-    return psycopg2.connect(
-        dbname=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASS"),
-        host=os.getenv("DB_HOST"),
-        port=os.getenv("DB_PORT"),
-        keepalives=1,
-        keepalives_idle=POSTGRES_KEEPALIVES_IDLE_SECONDS,
-        keepalives_interval=POSTGRES_KEEPALIVES_INTERVAL_SECONDS,
-        keepalives_count=POSTGRES_KEEPALIVES_COUNT,
-    )
-
-
 def group_concerts(concerts: list[Concert]) -> list[ConcertGroup]:
     grouped: dict[tuple[str, str, str], list[Concert]] = {}
     for concert in concerts:
@@ -360,6 +343,7 @@ def select_concerts(
                 LEFT JOIN city ON city.id = c.city_id
                 LEFT JOIN concert_program_analysis a ON a.classical_concert_id = c.id
                 WHERE c.program_analysis_eligible = true
+                  AND c.missing_from_source_at IS NULL
                   AND c.date >= CURRENT_DATE
                   AND (
                     a.id IS NULL
@@ -1186,8 +1170,7 @@ def validate_and_persist_result(
     model: str,
     commit: bool,
 ) -> None:
-    conn = get_connection()
-    try:
+    with get_connection() as conn:
         validate_result(conn, concert, result)
         event_updates = validate_event_updates(conn, concert, result["event_updates"])
         location_resolution = validate_location_resolution(
@@ -1205,19 +1188,11 @@ def validate_and_persist_result(
                 event_updates,
                 location_resolution,
             )
-    finally:
-        conn.close()
 
 
 def persist_concert_error(concert: Concert, model: str, error: Exception) -> None:
-    conn = get_connection()
-    try:
+    with get_connection() as conn:
         persist_error(conn, concert, model, error)
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
 
 
 async def analyze_concert_group(
@@ -1425,83 +1400,82 @@ def run(
 ) -> int:
     if concurrency < 1:
         raise ValueError(f"concurrency must be at least 1, got {concurrency}")
-    conn = get_connection()
-    locked = False
-    selected_count = 0
-    group_count = 0
-    try:
-        if commit:
-            locked = acquire_lock(conn)
-            if not locked:
-                raise RuntimeError("Another committed concert programme analysis is already running")
-            expire_old_no_program(conn)
-        concerts = select_concerts(conn, concert_ids, limit, force, unresolved_locations)
-        selected_count = len(concerts)
-        if not concerts:
-            logger.info(
-                "No concerts eligible for programme analysis",
-                extra={"event": "programme_queue_empty"},
+    with get_connection() as conn:
+        locked = False
+        selected_count = 0
+        group_count = 0
+        try:
+            if commit:
+                locked = acquire_lock(conn)
+                if not locked:
+                    raise RuntimeError("Another committed concert programme analysis is already running")
+                expire_old_no_program(conn)
+            concerts = select_concerts(conn, concert_ids, limit, force, unresolved_locations)
+            selected_count = len(concerts)
+            if not concerts:
+                logger.info(
+                    "No concerts eligible for programme analysis",
+                    extra={"event": "programme_queue_empty"},
+                )
+                write_batch_result(
+                    result_path,
+                    status="empty",
+                    selected_count=0,
+                    group_count=0,
+                    failure_count=0,
+                )
+                return 0
+            groups = group_concerts(concerts)
+            group_count = len(groups)
+            failures = asyncio.run(
+                run_concert_groups(
+                    groups,
+                    model=model,
+                    commit=commit,
+                    timeout_seconds=timeout_seconds,
+                    concurrency=concurrency,
+                    heartbeat_path=heartbeat_path,
+                )
             )
             write_batch_result(
                 result_path,
-                status="empty",
-                selected_count=0,
-                group_count=0,
-                failure_count=0,
+                status="completed",
+                selected_count=selected_count,
+                group_count=group_count,
+                failure_count=failures,
             )
-            return 0
-        groups = group_concerts(concerts)
-        group_count = len(groups)
-        failures = asyncio.run(
-            run_concert_groups(
-                groups,
-                model=model,
-                commit=commit,
-                timeout_seconds=timeout_seconds,
-                concurrency=concurrency,
-                heartbeat_path=heartbeat_path,
+            return failures
+        except CodexAuthRequiredError as error:
+            logger.critical(
+                "Codex authentication failure stopped programme analysis",
+                extra={
+                    "event": "codex_auth_detected",
+                    "component": "programme-analyzer",
+                    "reason_code": error.reason_code,
+                },
             )
-        )
-        write_batch_result(
-            result_path,
-            status="completed",
-            selected_count=selected_count,
-            group_count=group_count,
-            failure_count=failures,
-        )
-        return failures
-    except CodexAuthRequiredError as error:
-        logger.critical(
-            "Codex authentication failure stopped programme analysis",
-            extra={
-                "event": "codex_auth_detected",
-                "component": "programme-analyzer",
-                "reason_code": error.reason_code,
-            },
-        )
-        write_batch_result(
-            result_path,
-            status="auth_required",
-            selected_count=selected_count,
-            group_count=group_count,
-            failure_count=None,
-            error=error,
-        )
-        raise
-    except Exception as error:
-        write_batch_result(
-            result_path,
-            status="fatal",
-            selected_count=selected_count,
-            group_count=group_count,
-            failure_count=None,
-            error=error,
-        )
-        raise
-    finally:
-        if locked:
-            release_lock(conn)
-        conn.close()
+            write_batch_result(
+                result_path,
+                status="auth_required",
+                selected_count=selected_count,
+                group_count=group_count,
+                failure_count=None,
+                error=error,
+            )
+            raise
+        except Exception as error:
+            write_batch_result(
+                result_path,
+                status="fatal",
+                selected_count=selected_count,
+                group_count=group_count,
+                failure_count=None,
+                error=error,
+            )
+            raise
+        finally:
+            if locked:
+                release_lock(conn)
 
 
 def scheduled_main() -> None:
@@ -2,13 +2,13 @@ import os
 import time
 import json
 import logging
-import psycopg2
 from dotenv import load_dotenv
 
 from google import genai
 from google.genai import types
 
 from analyzers.utils import generate_with_retry
+from db.connection import connection
 from observability import configure_logging
 
 load_dotenv()
@@ -65,10 +65,11 @@ def upload_classical_concerts(conn):
     
     skipped_count = 0
     for concert in concerts:
-        title, date, url = concert[1], concert[2], concert[3]
+        title, date, url, time_from = concert[1], concert[2], concert[3], concert[6]
         cursor.execute(
-            "SELECT id FROM classical_concert WHERE title = %s AND date = %s AND url = %s",
-            (title, date, url)
+            "SELECT id FROM classical_concert "
+            "WHERE title = %s AND date = %s AND url = %s AND time_from IS NOT DISTINCT FROM %s",
+            (title, date, url, time_from)
         )
         exists = cursor.fetchone()
         
@@ -98,39 +99,32 @@ def upload_classical_concerts(conn):
 def main():
     configure_logging("classical-bot")
     client = genai.Client(api_key=os.getenv('GEMINI_API_KEY'))
-    DB_NAME = os.getenv('DB_NAME')
-    DB_USER = os.getenv('DB_USER')
-    DB_PASS = os.getenv('DB_PASS')
-    DB_HOST = os.getenv('DB_HOST')
-    DB_PORT = os.getenv('DB_PORT')
-    
-    conn = psycopg2.connect(dbname=DB_NAME, user=DB_USER, password=DB_PASS, host=DB_HOST, port=DB_PORT)
-    cursor = conn.cursor()  
-    cursor.execute("SELECT id, title, url, venue, description FROM potential_event WHERE analyzed = false")
-    potential_events = cursor.fetchall()
-    column_names = [desc[0] for desc in cursor.description]
-    if len(potential_events) > 0:
-        for event in potential_events:
-            event_json = json.dumps(dict(zip(column_names, event)), ensure_ascii=False)
-            output = is_classical_music_event(client, event_json)
-            output = True if output == 'true' else False
+    with connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, title, url, venue, description FROM potential_event WHERE analyzed = false")
+        potential_events = cursor.fetchall()
+        column_names = [desc[0] for desc in cursor.description]
+        if len(potential_events) > 0:
+            for event in potential_events:
+                event_json = json.dumps(dict(zip(column_names, event)), ensure_ascii=False)
+                output = is_classical_music_event(client, event_json)
+                output = True if output == 'true' else False
+                logger.info(
+                    "Potential event analyzed",
+                    extra={
+                        "event": "potential_event_analyzed",
+                        "potential_event_id": event[0],
+                        "is_classical_concert": output,
+                    },
+                )
+                update_potential_event(conn, event[0], output)
+        else:
             logger.info(
-                "Potential event analyzed",
-                extra={
-                    "event": "potential_event_analyzed",
-                    "potential_event_id": event[0],
-                    "is_classical_concert": output,
-                },
+                "No potential events to analyze",
+                extra={"event": "potential_event_queue_empty"},
             )
-            update_potential_event(conn, event[0], output)
-    else:
-        logger.info(
-            "No potential events to analyze",
-            extra={"event": "potential_event_queue_empty"},
-        )
-        
-    upload_classical_concerts(conn)
-    conn.close()
+
+        upload_classical_concerts(conn)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 import re
 from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
@@ -8,9 +7,10 @@ from pathlib import Path
 from typing import Iterator
 from urllib.parse import urlsplit, urlunsplit
 
-import psycopg2
 from psycopg2.extras import Json, RealDictCursor
 
+from db.connection import get_pool
+
 
 DUE_STATUSES = ("pending", "retry_wait", "blocked")
 GEOGRAPHIC_SCOPES = {"unknown", "country", "multi_country"}
@@ -26,16 +26,6 @@ def identity_is_mutable(source: dict) -> bool:
     )
 
 
-def get_connection():
-    return psycopg2.connect(
-        dbname=os.getenv("DB_NAME"),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASS"),
-        host=os.getenv("DB_HOST"),
-        port=os.getenv("DB_PORT"),
-    )
-
-
 def normalize_source_url(url: str) -> str:
     value = url.strip()
     parsed = urlsplit(value if "://" in value else f"https://{value}")
@@ -88,12 +78,15 @@ def normalized_geographic_identity(
 
 class CrawlerRegistry:
     def __init__(self, connection=None) -> None:
-        self.connection = connection or get_connection()
-        self._owns_connection = connection is None
+        # A registry without an injected connection borrows one from the
+        # shared pool for its lifetime and hands it back on close().
+        self._pool = None if connection is not None else get_pool()
+        self.connection = connection if connection is not None else self._pool.getconn()
 
     def close(self) -> None:
-        if self._owns_connection:
-            self.connection.close()
+        if self._pool is not None:
+            self._pool.putconn(self.connection)
+            self._pool = None
 
     def __enter__(self) -> CrawlerRegistry:
         return self
@@ -11,6 +11,7 @@ import socket
 import time
 import urllib.error
 from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import replace
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -20,6 +21,8 @@ import pandas as pd
 
 from crawlers.base import BaseCrawler
 from crawlers.cities import clean_city_raw, normalize_city_key
+from crawlers.classical import KnownEvents
+from crawlers.replay import MODES, ReplayConfig, ReplayMissError, recording
 
 
 EMPTY_VALUES = {"", "-", "n/a", "na", "nan", "none", "null"}
@@ -185,7 +188,8 @@ def validate_records(records: Any) -> list[dict[str, Any]]:
 
 
 def runtime_failure_kind(error: BaseException) -> str:
-    if isinstance(error, (TimeoutError, socket.gaierror, urllib.error.URLError)):
+    # A replay miss means the recording is stale, not that the crawler is broken.
+    if isinstance(error, (TimeoutError, socket.gaierror, urllib.error.URLError, ReplayMissError)):
         return "inconclusive_runtime"
     name = f"{type(error).__module__}.{type(error).__name__}".casefold()
     message = str(error).casefold()
@@ -207,15 +211,28 @@ def runtime_failure_kind(error: BaseException) -> str:
     )
 
 
-def validate_crawler(crawler_directory: Path) -> dict[str, Any]:
+def validate_crawler(crawler_directory: Path, http_mode: str | None = None) -> dict[str, Any]:
+    """Scrape one crawler and check its records.
+
+    ``http_mode`` overrides ``CRAWLER_HTTP_MODE``: ``record`` saves the
+    crawler's HTTP traffic and ``replay`` validates against a saved
+    recording without touching the network.
+    """
     started = time.monotonic()
     captured = io.StringIO()
     try:
+        replay_config = ReplayConfig.from_environment()
+        if http_mode:
+            replay_config = replace(replay_config, mode=http_mode)
         with redirect_stdout(captured), redirect_stderr(captured):
             module = importlib.import_module(module_name(crawler_directory))
             crawler = crawler_class(module)()
-            scraped = crawler.scrape()
-            prepared = crawler.prepare_records(scraped)
+            # Never read the database; every event counts as new.
+            crawler._known_events = KnownEvents()
+            # transform() may fetch detail pages, so it runs inside the recording too.
+            with recording(crawler.config.slug, replay_config):
+                scraped = list(crawler.scrape_records() or [])
+                prepared = crawler.prepare_records(scraped)
         issues = validate_records(prepared)
         return {
             "status": "data_quality_failure" if issues else "passed",
@@ -238,11 +255,17 @@ def validate_crawler(crawler_directory: Path) -> dict[str, Any]:
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Live-validate one generated crawler.")
     parser.add_argument("--crawler-directory", type=Path, required=True)
+    parser.add_argument(
+        "--http-mode",
+        choices=MODES,
+        help="record or replay the crawler's HTTP traffic (default: CRAWLER_HTTP_MODE or live)",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
-    report = validate_crawler(parse_args().crawler_directory)
+    args = parse_args()
+    report = validate_crawler(args.crawler_directory, args.http_mode)
     print(json.dumps(report, ensure_ascii=False, indent=2))
     if report["status"] != "passed":
         raise SystemExit(1)
@@ -0,0 +1,92 @@
+"""Measure how long each crawler module takes to import.
+
+Every module is imported in a fresh interpreter, first the shared crawler
+infrastructure (``crawlers.base``, ``crawlers.http``) and then the crawler
+itself, so ``own_seconds`` is the cost the crawler adds on top of what every
+crawler process pays anyway.
+
+    python -m benchmarks.crawler_imports --top 20
+    python -m benchmarks.crawler_imports --json > imports.json
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from crawlers.manifest import load_manifest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import crawlers.base, crawlers.http
+shared = time.perf_counter()
+__import__(sys.argv[1])
+finished = time.perf_counter()
+print(json.dumps({"shared_seconds": shared - started, "own_seconds": finished - shared}))
+"""
+
+
+def measure(module: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE, module],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        return {"module": module, "error": error[-1] if error else f"exit {completed.returncode}"}
+    timings = json.loads(completed.stdout)
+    return {
+        "module": module,
+        "own_seconds": round(timings["own_seconds"], 4),
+        "shared_seconds": round(timings["shared_seconds"], 4),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report the slowest crawler module imports.")
+    parser.add_argument("--top", type=int, default=20, help="number of slowest modules to print")
+    parser.add_argument("--limit", type=int, help="only measure the first N crawler modules")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="parallel interpreters")
+    parser.add_argument("--json", action="store_true", help="print every measurement as JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    modules = [entry.module for entry in load_manifest()][: args.limit]
+    with ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as executor:
+        results = list(executor.map(measure, modules))
+
+    timed = sorted(
+        (result for result in results if "own_seconds" in result),
+        key=lambda result: result["own_seconds"],
+        reverse=True,
+    )
+    failed = [result for result in results if "error" in result]
+    if args.json:
+        print(json.dumps({"modules": timed, "failed": failed}, indent=2))
+        return
+
+    if timed:
+        shared = sorted(result["shared_seconds"] for result in timed)[len(timed) // 2]
+        total = sum(result["own_seconds"] for result in timed)
+        print(f"{len(timed)} modules, shared imports {shared:.3f}s (median), crawler imports {total:.2f}s total")
+    for result in timed[: args.top]:
+        print(f"{result['own_seconds']:8.3f}s  {result['module']}")
+    for result in failed:
+        print(f"  failed  {result['module']}: {result['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure crawlers.dates over a corpus of crawled date strings.
+
+Each corpus line is ``<lang>\\t<text>``.  A listing page repeats the same
+few date strings many times, so the corpus is scaled up with ``--copies``
+and parsed once without the cache, once with a cold cache and once warm.
+
+    python -m benchmarks.date_parsing
+    python -m benchmarks.date_parsing --corpus dates.tsv --copies 200 --show
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date
+from pathlib import Path
+import random
+import time
+
+from crawlers import dates
+
+
+DEFAULT_CORPUS = Path(__file__).parent / "data" / "date_corpus.tsv"
+
+
+def load_corpus(path: Path) -> list[tuple[str, str]]:
+    corpus = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip() and not line.startswith("#"):
+            lang, text = line.split("\t", 1)
+            corpus.append((text, lang))
+    return corpus
+
+
+def throughput(parse, samples: list[tuple[str, str]], reference: date) -> float:
+    started = time.perf_counter()
+    for text, lang in samples:
+        parse(text, lang, reference)
+    return len(samples) / (time.perf_counter() - started)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark crawlers.dates parsing.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--copies", type=int, default=100, help="times each corpus line occurs")
+    parser.add_argument("--show", action="store_true", help="print what every corpus line parses to")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    corpus = load_corpus(args.corpus)
+    reference = date.today()
+    samples = corpus * args.copies
+    random.Random(0).shuffle(samples)
+
+    for language in {lang for _text, lang in corpus}:
+        dates._grammar(language)
+    uncached = throughput(dates._parse_uncached, samples, reference)
+    dates.clear_cache()
+    cold = throughput(dates._parse, samples, reference)
+    warm = throughput(dates._parse, samples, reference)
+
+    parsed = [dates._parse_uncached(text, lang, reference) for text, lang in corpus]
+    with_date = sum(bool(found) for found, _time in parsed)
+    with_time = sum(event_time is not None for _found, event_time in parsed)
+    print(f"corpus: {len(corpus)} strings, {with_date} with a date, {with_time} with a time")
+    print(f"samples: {len(samples)} ({args.copies} copies)")
+    print(f"uncached:   {uncached:>10,.0f} strings/s")
+    print(f"cold cache: {cold:>10,.0f} strings/s  ({cold / uncached:.1f}x)")
+    print(f"warm cache: {warm:>10,.0f} strings/s  ({warm / uncached:.1f}x)")
+    print(f"cache: {dates.cache_info()}")
+    if args.show:
+        for (text, lang), (found, event_time) in zip(corpus, parsed):
+            shown = ", ".join(day.isoformat() for day in found) or "-"
+            print(f"{lang}  {text:<48} {shown}  {event_time or ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare crawlers.extractors.extract_city with the DataFrame scan it replaced.
+
+The texts are venue strings built from the city data: some with a postal
+code, some with only a city name and some without any city, which is the
+slowest case for a scan over every city.
+
+    python -m benchmarks.extract_city
+    python -m benchmarks.extract_city --texts 5000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from crawlers import extractors
+
+
+VENUES = ["Dom kultúry", "Kostol sv. Martina", "Mestské divadlo", "Synagóga", "Kultúrne centrum"]
+
+
+def dataframe_extract_city(cities_with_postal_code: pd.DataFrame, cities_by_population: pd.DataFrame, text: str):
+    postal_code = extractors.extract_postal_code(text)
+    if postal_code:
+        potential_cities = cities_with_postal_code[
+            cities_with_postal_code["postal_code"] == postal_code
+        ]["city"].values
+        for city in potential_cities:
+            if city in text:
+                return city
+        for key, value in extractors.SPECIAL_CITIES.items():
+            if postal_code.startswith(key):
+                return value
+    for city in cities_by_population["city"].values:
+        if city in text:
+            return city
+    return None
+
+
+def venue_texts(count: int, cities_with_postal_code: pd.DataFrame) -> list[str]:
+    rows = list(cities_with_postal_code.itertuples(index=False))
+    generator = random.Random(0)
+    texts = []
+    for index in range(count):
+        venue = generator.choice(VENUES)
+        city, postal_code = generator.choice(rows)
+        if index % 3 == 0:
+            texts.append(f"{venue}, Hlavná {index % 90 + 1}, {postal_code[:3]} {postal_code[3:]} {city}")
+        elif index % 3 == 1:
+            texts.append(f"{venue} {city}")
+        else:
+            texts.append(f"{venue}, vstup voľný")
+    return texts
+
+
+def best_seconds(function, texts: list[str], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            function(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark extract_city.")
+    parser.add_argument("--texts", type=int, default=1500)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    directory = extractors.DATA_DIRECTORY
+    cities_with_postal_code = pd.read_csv(directory / "cities_with_postal_code.csv", dtype={"postal_code": str})
+    cities_by_population = pd.read_csv(directory / "cities_by_population.csv")
+    texts = venue_texts(args.texts, cities_with_postal_code)
+
+    def baseline(text):
+        return dataframe_extract_city(cities_with_postal_code, cities_by_population, text)
+
+    mismatches = sum(baseline(text) != extractors.extract_city(text) for text in texts)
+    started = time.perf_counter()
+    extractors.cities_by_postal_code.cache_clear()
+    extractors.city_matcher.cache_clear()
+    extractors.cities_by_postal_code()
+    extractors.city_matcher()
+    build = time.perf_counter() - started
+
+    old = best_seconds(baseline, texts, args.repeat)
+    new = best_seconds(extractors.extract_city, texts, args.repeat)
+    print(f"{len(texts)} texts, {mismatches} mismatches, index build {build * 1000:.0f} ms")
+    print(f"dataframe scan: {old / len(texts) * 1e6:>8.1f} us/text")
+    print(f"indexed:        {new / len(texts) * 1e6:>8.1f} us/text  ({old / new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
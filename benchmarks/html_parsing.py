@@ -0,0 +1,89 @@
+"""Compare html.parser with the lxml backend of crawlers.parsing.parse_html.
+
+Pass saved listing pages (files or directories of ``*.html``); without any,
+a synthetic listing page with ``--events`` event blocks is used.  Memory is
+the tracemalloc peak while parsing, which covers the soup tree but not
+lxml's own short-lived C buffers.
+
+    python -m benchmarks.html_parsing /tmp/pages/*.html --select "article a[href]"
+    python -m benchmarks.html_parsing --events 2000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import timeit
+import tracemalloc
+
+from crawlers.parsing import parse_html
+
+
+PARSERS = ("html.parser", "lxml")
+
+
+def synthetic_listing(count: int) -> bytes:
+    events = "".join(
+        f"""
+        <article class="event" data-id="{index}">
+          <h3 class="event__title"><a href="/events/{index}">Koncert č. {index}</a></h3>
+          <p class="event__date">{index % 28 + 1}. {index % 12 + 1}. 2026 <span>19:30</span></p>
+          <p class="event__venue">Koncertná sieň<br>Bratislava
+          <ul class="event__programme"><li>Dvořák</li><li>Janáček</li><li>Suk</li></ul>
+        </article>"""
+        for index in range(count)
+    )
+    page = f"""<!DOCTYPE html><html lang="sk"><head><meta charset="utf-8"><title>Program</title></head>
+    <body><header><nav><a href="/">Domov</a></nav></header><main>{events}</main></body></html>"""
+    return page.encode("utf-8")
+
+
+def load_pages(paths: list[Path], events: int) -> list[tuple[str, bytes]]:
+    if not paths:
+        return [(f"synthetic listing ({events} events)", synthetic_listing(events))]
+    pages = []
+    for path in paths:
+        files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+        pages.extend((str(file), file.read_bytes()) for file in files)
+    return pages
+
+
+def peak_memory(content: bytes, parser: str) -> int:
+    tracemalloc.start()
+    try:
+        soup = parse_html(content, parser)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del soup
+    return peak
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends.")
+    parser.add_argument("pages", type=Path, nargs="*", help="saved HTML pages or directories of them")
+    parser.add_argument("--events", type=int, default=500, help="events on the synthetic listing page")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--select", help="CSS selector whose match count is compared across parsers")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    print(f"{'page':<40}  {'parser':<11}  {'parse':>9}  {'peak MiB':>8}  {'matches':>7}")
+    for name, content in load_pages(args.pages, args.events):
+        timings = {}
+        for parser in PARSERS:
+            number = max(1, 2_000_000 // max(len(content), 1))
+            best = min(timeit.repeat(lambda: parse_html(content, parser), number=number, repeat=args.repeat))
+            timings[parser] = best / number
+            matches = len(parse_html(content, parser).select(args.select)) if args.select else ""
+            print(
+                f"{name[-40:]:<40}  {parser:<11}  {timings[parser] * 1000:>7.2f}ms"
+                f"  {peak_memory(content, parser) / 2**20:>8.2f}  {matches:>7}"
+            )
+        print(f"{'':<40}  {'speedup':<11}  {timings['html.parser'] / timings['lxml']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare the pandas and plain-record paths of BaseCrawler.prepare_records.
+
+    python -m benchmarks.prepare_records
+    python -m benchmarks.prepare_records --sizes 10 100 500 5000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import timeit
+
+from crawlers.base import BaseCrawler, CrawlerConfig
+
+
+class BenchmarkCrawler(BaseCrawler):
+    config = CrawlerConfig(
+        slug="benchmark_sk",
+        source="Benchmark",
+        source_url="https://example.sk/",
+        columns=["title", "date", "time_from", "url", "description"],
+        dedupe_subset=["title", "date", "url"],
+        front_fields=[
+            ("venue", "Concert hall"),
+            ("city", "Bratislava"),
+            ("source_url", "https://example.sk/"),
+            ("source", "Benchmark"),
+        ],
+    )
+
+
+def records(count: int) -> list[dict]:
+    return [
+        {
+            "title": f"Concert {index % (count - count // 10 or 1)}",
+            "date": f"2026-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "time_from": "19:30" if index % 3 else None,
+            "url": f"https://example.sk/events/{index % (count - count // 10 or 1)}",
+            "description": "Programme: Dvořák, Janáček, Suk" if index % 2 else float("nan"),
+        }
+        for index in range(count)
+    ]
+
+
+def pandas_import_seconds() -> float:
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import time; started = time.perf_counter(); import pandas; print(time.perf_counter() - started)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(completed.stdout)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark BaseCrawler.prepare_records.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    crawler = BenchmarkCrawler()
+    print(f"pandas import (cold interpreter): {pandas_import_seconds() * 1000:.0f} ms")
+    print(f"{'rows':>6}  {'pandas':>10}  {'plain':>10}  {'speedup':>7}")
+    for size in args.sizes:
+        batch = records(size)
+        number = max(1, 2000 // size)
+        timings = {}
+        for name, prepare in (
+            ("pandas", crawler._prepare_dataframe_records),
+            ("plain", crawler._prepare_plain_records),
+        ):
+            best = min(timeit.repeat(lambda: prepare(batch), number=number, repeat=args.repeat))
+            timings[name] = best / number
+        print(
+            f"{size:>6}  {timings['pandas'] * 1000:>8.3f}ms  {timings['plain'] * 1000:>8.3f}ms"
+            f"  {timings['pandas'] / timings['plain']:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -68,7 +69,7 @@ def clean_text(value):
 
 
 def make_session():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     retries = Retry(
         total=3,
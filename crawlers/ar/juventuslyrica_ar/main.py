@@ -5,6 +5,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -208,7 +209,7 @@ class JuventusLyricaArCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         try:
             pages = fetch_pages(session)
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -116,7 +117,7 @@ class MozarteumArgentinoOrgCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         try:
             events = [event for event in listing_events(session) if is_concert(event)]
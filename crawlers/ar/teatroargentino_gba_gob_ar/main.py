@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -121,7 +122,7 @@ class TeatroArgentinoGbaGobArCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         try:
             items = listing_items(session)
@@ -0,0 +1,205 @@
+"""Compressed per-run crawl snapshots and run-to-run diffs.
+
+Every crawler run is stored as ``<directory>/<slug>/<run stamp>.jsonl.gz``,
+one prepared record per line.  Snapshots are never rewritten; only the
+oldest runs beyond ``keep_runs`` are pruned.  ``diff_records()`` compares a
+new scrape with the previous snapshot and classifies rows as added, changed
+or disappeared, matching events by URL, date and title.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+
+DEFAULT_ARCHIVE_DIRECTORY = Path('/var/lib/classical-bot/crawl-archive')
+DEFAULT_KEEP_RUNS = 60
+SNAPSHOT_SUFFIX = '.jsonl.gz'
+SUCCESS_MARKER = 'last-success'
+KEY_FIELDS = ('url', 'date')
+
+
+def normalize_record(record: dict) -> dict:
+    """Return the record as it reads back from a snapshot."""
+    return json.loads(json.dumps(record, default=str, ensure_ascii=False))
+
+
+def _grouped(records: Iterable[dict], fields: tuple[str, ...]) -> dict[tuple, list[dict]]:
+    groups: dict[tuple, list[dict]] = {}
+    for record in records:
+        groups.setdefault(tuple(record.get(name) for name in fields), []).append(record)
+    return groups
+
+
+@dataclass(frozen=True)
+class RecordChange:
+    previous: dict
+    current: dict
+
+    @property
+    def fields(self) -> list[str]:
+        names = dict.fromkeys([*self.previous, *self.current])
+        return [name for name in names if self.previous.get(name) != self.current.get(name)]
+
+
+@dataclass
+class RecordDiff:
+    added: list[dict] = field(default_factory=list)
+    changed: list[RecordChange] = field(default_factory=list)
+    disappeared: list[dict] = field(default_factory=list)
+    unchanged: list[dict] = field(default_factory=list)
+
+    def counts(self) -> dict[str, int]:
+        return {
+            'added_count': len(self.added),
+            'changed_count': len(self.changed),
+            'disappeared_count': len(self.disappeared),
+            'unchanged_count': len(self.unchanged),
+        }
+
+    def change_fraction(self) -> float:
+        """Share of the records of both runs that were added, changed or gone."""
+        moved = len(self.added) + len(self.changed) + len(self.disappeared)
+        total = moved + len(self.unchanged)
+        return moved / total if total else 0.0
+
+
+def diff_records(previous: Iterable[dict], current: Iterable[dict]) -> RecordDiff:
+    """Classify current records against the previous snapshot.
+
+    Records are matched by URL, date and title first.  Leftovers that are
+    the only remaining record for their URL and date on both sides are
+    treated as the same event with a changed title.  Both sides are
+    compared in their snapshot form, so dates and times scraped as objects
+    match the strings read back from disk.
+    """
+    previous_groups = _grouped((normalize_record(record) for record in previous), (*KEY_FIELDS, 'title'))
+    diff = RecordDiff()
+    unmatched = []
+    for record in (normalize_record(record) for record in current):
+        candidates = previous_groups.get(tuple(record.get(name) for name in (*KEY_FIELDS, 'title')))
+        if not candidates:
+            unmatched.append(record)
+            continue
+        before = candidates.pop(0)
+        if before == record:
+            diff.unchanged.append(record)
+        else:
+            diff.changed.append(RecordChange(before, record))
+
+    leftovers = _grouped((record for group in previous_groups.values() for record in group), KEY_FIELDS)
+    for key, records in _grouped(unmatched, KEY_FIELDS).items():
+        candidates = leftovers.get(key, [])
+        if len(records) == 1 and len(candidates) == 1:
+            diff.changed.append(RecordChange(candidates.pop(), records[0]))
+        else:
+            diff.added.extend(records)
+    diff.disappeared = [record for group in leftovers.values() for record in group]
+    return diff
+
+
+class SnapshotWriter:
+    """Write one snapshot incrementally; it becomes visible on ``close()``."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.record_count = 0
+        self._temporary = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self._temporary, 'wt', encoding='utf-8')
+
+    def write(self, records: Iterable[dict]) -> None:
+        for record in records:
+            self._file.write(json.dumps(record, default=str, ensure_ascii=False))
+            self._file.write('\n')
+            self.record_count += 1
+
+    def close(self) -> None:
+        self._file.close()
+        self._temporary.replace(self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._temporary.unlink(missing_ok=True)
+
+    def __enter__(self) -> SnapshotWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._file.closed:
+            # Already closed or aborted inside the block.
+            return
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class CrawlArchive:
+    def __init__(self, directory: Path, keep_runs: int = DEFAULT_KEEP_RUNS) -> None:
+        self.directory = directory
+        self.keep_runs = keep_runs
+
+    @classmethod
+    def from_environment(cls) -> CrawlArchive:
+        return cls(
+            Path(os.getenv('CRAWL_ARCHIVE_DIR', str(DEFAULT_ARCHIVE_DIRECTORY))),
+            int(os.getenv('CRAWL_ARCHIVE_KEEP_RUNS', DEFAULT_KEEP_RUNS)),
+        )
+
+    def runs(self, slug: str) -> list[Path]:
+        """Snapshots of a crawler, oldest first."""
+        return sorted((self.directory / slug).glob(f'*{SNAPSHOT_SUFFIX}'))
+
+    def latest(self, slug: str) -> Path | None:
+        runs = self.runs(slug)
+        return runs[-1] if runs else None
+
+    def writer(self, slug: str, run_at: datetime | None = None) -> SnapshotWriter:
+        run_at = (run_at or datetime.now(UTC)).astimezone(UTC)
+        path = self.directory / slug / f'{run_at:%Y%m%dT%H%M%S%fZ}{SNAPSHOT_SUFFIX}'
+        if path.exists():
+            raise FileExistsError(f'snapshot {path} already exists')
+        return SnapshotWriter(path)
+
+    def save(self, slug: str, records: Iterable[dict], run_at: datetime | None = None) -> Path:
+        with self.writer(slug, run_at) as writer:
+            writer.write(records)
+        self.prune(slug)
+        return writer.path
+
+    @staticmethod
+    def read(path: Path) -> Iterator[dict]:
+        with gzip.open(path, 'rt', encoding='utf-8') as snapshot:
+            for line in snapshot:
+                yield json.loads(line)
+
+    def load_latest(self, slug: str) -> list[dict[str, Any]] | None:
+        """Records of the latest snapshot, or None before the crawler's first one."""
+        path = self.latest(slug)
+        return list(self.read(path)) if path else None
+
+    def mark_succeeded(self, slug: str, started_at: datetime) -> None:
+        """Record the start of the latest run that finished without error."""
+        path = self.directory / slug / SUCCESS_MARKER
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        temporary.write_text(started_at.astimezone(UTC).isoformat() + '\n', encoding='utf-8')
+        temporary.replace(path)
+
+    def last_success(self, slug: str) -> datetime | None:
+        try:
+            return datetime.fromisoformat((self.directory / slug / SUCCESS_MARKER).read_text(encoding='utf-8').strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def prune(self, slug: str) -> None:
+        runs = self.runs(slug)
+        for path in runs[: max(len(runs) - self.keep_runs, 0)]:
+            path.unlink(missing_ok=True)
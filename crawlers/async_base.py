@@ -0,0 +1,139 @@
+"""Crawler base class for asyncio crawlers.
+
+``AsyncBaseCrawler`` is ``BaseCrawler`` with an ``async def scrape()`` that
+fetches through one ``curl.AsyncCurlSession``.  Detail pages are fetched
+with ``gather_details()`` instead of a ``ThreadPoolExecutor``: one event
+loop keeps many requests in flight, bounded overall and per host, and the
+per-domain rate limits of ``crawlers.politeness`` still apply.
+
+    class ExampleCrawler(AsyncBaseCrawler):
+        config = CrawlerConfig(...)
+
+        async def scrape(self):
+            listing = await self.fetch(self.config.source_url)
+            urls = [...]
+            return await self.gather_details(urls, self.parse_detail)
+
+        async def parse_detail(self, url):
+            response = await self.fetch(url)
+            return {...}
+
+``scrape()`` may also be an async generator; with ``chunk_size`` set, its
+records are then prepared and uploaded in chunks as they are yielded.  The
+event loop only runs while the next record is awaited, so requests the
+generator has in flight pause while a chunk is uploaded.  Preparing,
+archiving and uploading are the same as for ``BaseCrawler``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from urllib.parse import urlsplit
+
+from .base import BaseCrawler
+from .curl import AsyncCurlSession
+
+
+DEFAULT_CONCURRENCY = 32
+DEFAULT_HOST_CONCURRENCY = 6
+
+
+async def _next(records: AsyncIterator[dict]) -> dict:
+    return await anext(records)
+
+
+class AsyncBaseCrawler(BaseCrawler):
+    # Requests in flight across all hosts, and to any single host.
+    concurrency: int = DEFAULT_CONCURRENCY
+    host_concurrency: int = DEFAULT_HOST_CONCURRENCY
+    # Browser TLS fingerprint to present, e.g. 'chrome'; see curl_cffi.
+    impersonate: str | None = None
+    session: AsyncCurlSession | None = None
+
+    async def scrape(self) -> list[dict] | AsyncIterator[dict]:
+        """Return raw records, or yield them from an async generator."""
+        raise NotImplementedError
+
+    def create_session(self) -> AsyncCurlSession:
+        options: dict[str, Any] = {'max_clients': self.concurrency}
+        if self.impersonate:
+            options['impersonate'] = self.impersonate
+        return AsyncCurlSession(**options)
+
+    async def fetch(self, url: str, **kwargs) -> Any:
+        """GET ``url`` on the crawler's session and raise on HTTP errors."""
+        response = await self.session.get(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def gather_details(
+        self,
+        urls: Iterable[str],
+        fetch: Callable[[str], Awaitable[Any]] | None = None,
+        *,
+        concurrency: int | None = None,
+        host_concurrency: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list:
+        """Run ``fetch`` for every URL concurrently and return the results in input order.
+
+        ``fetch`` defaults to ``self.fetch``; pass the crawler's own detail
+        coroutine to parse pages as they arrive.  At most ``concurrency``
+        calls run at once, and at most ``host_concurrency`` for one host.
+        With ``return_exceptions`` a failed URL yields its exception instead
+        of cancelling the rest of the batch.
+        """
+        concurrency = concurrency or self.concurrency
+        host_concurrency = host_concurrency or self.host_concurrency
+        if concurrency < 1 or host_concurrency < 1:
+            raise ValueError('concurrency and host_concurrency must be at least 1')
+        fetch = fetch or self.fetch
+        slots = asyncio.Semaphore(concurrency)
+        host_slots = defaultdict(lambda: asyncio.Semaphore(host_concurrency))
+
+        async def run(url: str) -> Any:
+            async with host_slots[urlsplit(url).hostname], slots:
+                try:
+                    return await fetch(url)
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    return error
+
+        tasks = [asyncio.ensure_future(run(url)) for url in urls]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def scrape_records(self) -> Iterator[dict]:
+        """Run ``scrape()`` on a private event loop and yield its records.
+
+        The loop stays open between records but only runs while the next
+        one is awaited: tasks an async generator started are paused while
+        the caller handles earlier records.  A generator the caller stops
+        reading early is closed on the loop.
+        """
+        with asyncio.Runner() as runner:
+            self.session = self.create_session()
+            try:
+                scraped = self.scrape()
+                if hasattr(scraped, '__anext__'):
+                    try:
+                        while True:
+                            try:
+                                yield runner.run(_next(scraped))
+                            except StopAsyncIteration:
+                                break
+                    finally:
+                        runner.run(scraped.aclose())
+                else:
+                    yield from runner.run(scraped) or []
+            finally:
+                runner.run(self.session.close())
+                self.session = None
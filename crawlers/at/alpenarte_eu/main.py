@@ -5,6 +5,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -255,7 +256,7 @@ def archive_events(session):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     records = current_programme(session) + legacy_events(session) + archive_events(session)
     return sorted(records, key=lambda item: (
@@ -11,6 +11,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -39,7 +40,7 @@ def clean_text(value):
 
 
 def make_session():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     retry = Retry(
         total=4,
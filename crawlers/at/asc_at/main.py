@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -141,7 +142,7 @@ def add_detail(session, record):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     records = []
     for url in (UPCOMING_URL, ARCHIVE_URL):
@@ -4,10 +4,10 @@ from datetime import datetime
 from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -152,7 +152,7 @@ class BachconsortComCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         records = []
         for item in fetch_all_events(session):
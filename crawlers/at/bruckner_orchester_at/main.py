@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -201,7 +202,7 @@ def make_record(item, soup):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     items = {}
     for listing_url in (CALENDAR_URL, ARCHIVE_URL):
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -129,7 +130,7 @@ def parse_detail(url, soup):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     urls = listing_urls(session)
     records = []
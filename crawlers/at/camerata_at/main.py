@@ -3,10 +3,10 @@ import re
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -156,7 +156,7 @@ class CamerataAtCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        response = requests.get(CONCERTS_URL, headers=HEADERS, timeout=60)
+        response = http.get(CONCERTS_URL, headers=HEADERS, timeout=60)
         response.raise_for_status()
         events = listing_events(response.text)
         records = []
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -123,7 +124,7 @@ def detail_description(session, record):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     records = listing_items(session)
 
@@ -2,10 +2,10 @@ import html
 import re
 from datetime import date
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -215,7 +215,7 @@ class EnsembleZeitflussComCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         posts = {}
         for category in CONCERT_CATEGORIES:
@@ -1,10 +1,10 @@
 import re
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -122,7 +122,7 @@ class IneoQuartetComCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         token_response = session.get(ACCESS_TOKENS_URL, headers=HEADERS, timeout=45)
         token_response.raise_for_status()
         token = token_response.json()['apps'][WIX_EVENTS_APP_ID]['instance']
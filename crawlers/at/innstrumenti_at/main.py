@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -139,7 +140,7 @@ def fetch_event(event):
     url = clean_text(event.get('link'))
     if not url:
         return None
-    response = requests.get(url, headers=HEADERS, timeout=45)
+    response = http.get(url, headers=HEADERS, timeout=45)
     response.raise_for_status()
     return parse_event(response.text, url)
 
@@ -159,7 +160,7 @@ class InnstrumentiAtCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        response = requests.get(
+        response = http.get(
             API_URL,
             params={'per_page': 100, 'orderby': 'date', 'order': 'asc', '_fields': 'link,title'},
             headers=HEADERS,
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -131,7 +132,7 @@ class KammermusikfestAtCrawler(BaseCrawler):
 
     def scrape(self):
         try:
-            session = requests.Session()
+            session = http.create_session()
             session.headers.update(HEADERS)
             home_response = session.get(SOURCE_URL, timeout=45)
             home_response.raise_for_status()
@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -157,7 +158,7 @@ def make_record(event, detail=None):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = listing_events(session)
     arrangement_ids = {event.get('arrangement_id') for event in events}
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -175,7 +176,7 @@ def programme_description(session, ticket_soup):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     pages = sitemap_pages(session)
     ticket_pages = sorted({url for url in pages if '/tickets-kaufen/' in url})
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -70,7 +71,7 @@ def clean_text(value):
 
 
 def fetch_html(url):
-    response = requests.get(url, headers=HEADERS, timeout=60)
+    response = http.get(url, headers=HEADERS, timeout=60)
     response.raise_for_status()
     return response.text
 
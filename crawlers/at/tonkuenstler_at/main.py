@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -154,7 +155,7 @@ def make_record(event, detail=None):
 
 
 def scrape_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = listing_events(session)
     records = []
@@ -2,10 +2,10 @@ import re
 from datetime import date
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -173,7 +173,7 @@ class WienersingakademieAtCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        response = requests.get(EVENTS_URL, headers=HEADERS, timeout=45)
+        response = http.get(EVENTS_URL, headers=HEADERS, timeout=45)
         response.raise_for_status()
         records = parse_events(response.text)
         return sorted(
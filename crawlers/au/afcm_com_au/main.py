@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -132,7 +133,7 @@ def parse_programme(html, page_url=PROGRAM_URL):
 
 
 def fetch_html(url):
-    response = requests.get(url, headers=HEADERS, timeout=60)
+    response = http.get(url, headers=HEADERS, timeout=60)
     response.raise_for_status()
     return response
 
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -253,7 +254,7 @@ class AsqComAuCrawler(BaseCrawler):
         return items
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         try:
             items = self.fetch_catalogue(session)
@@ -269,7 +270,7 @@ class AsqComAuCrawler(BaseCrawler):
             raise
 
         def fetch(item):
-            response = requests.get(item['link'], headers=HEADERS, timeout=60)
+            response = http.get(item['link'], headers=HEADERS, timeout=60)
             response.raise_for_status()
             return parse_event_page(item, response.text)
 
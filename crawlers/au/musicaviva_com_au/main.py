@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -198,7 +199,7 @@ class MusicavivaComAuCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         sitemap = fetch(session, SITEMAP_URL)
         urls = discover_event_urls(sitemap.text)
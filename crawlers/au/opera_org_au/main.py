@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -170,7 +171,7 @@ class OperaOrgAuCrawler(BaseCrawler):
         return venue_cities
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         root = self.get_soup(session, CALENDAR_URL)
         records = []
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -223,7 +224,7 @@ def make_record(title, event_date, url, time_from, venue, city, description):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     urls = set()
     for listing_url in (SOURCE_URL, ARCHIVE_URL):
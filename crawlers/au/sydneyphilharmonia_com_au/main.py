@@ -9,6 +9,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -172,7 +173,7 @@ def make_record(event, descriptions):
 
 
 def scrape_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = fetch_all_events(session)
 
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -136,7 +137,7 @@ def records_from_detail(url, page):
 
 
 def scrape_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     listing = get_next_data(session, LISTING_URL)
     page = listing['props']['pageProps']['page']
@@ -1,15 +1,37 @@
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from contextlib import ExitStack, contextmanager
+import csv
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import islice
 import logging
 import re
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal
 
-import pandas as pd
+import psycopg2
 
-from .classical import upload_concerts, upload_potential_concerts
+from . import budget, http
+from .archive import KEY_FIELDS, CrawlArchive, RecordDiff, diff_records, normalize_record
+from .budget import BudgetExceeded, CrawlBudget
+from .classical import (
+    KnownEvents,
+    load_known_events,
+    upload_concert_delta,
+    upload_concerts,
+    upload_potential_concerts,
+)
+from .ledger import CrawlerRun, record_crawler_run
+from .replay import recording
 from observability import configure_logging
 
+if TYPE_CHECKING:
+    import pandas as pd
 
 UploadTarget = Literal['classical', 'potential']
+# Delta runs flag disappeared events as missing only when the scrape looks
+# complete: at most this many, or half of the previous run, may disappear.
+MISSING_EVENTS_TOLERANCE = 5
 logger = logging.getLogger(__name__)
 
 
@@ -24,8 +46,25 @@ class CrawlerConfig:
     dedupe_subset: list[str] | None = None
     front_fields: list[tuple[str, Any]] = field(default_factory=list)
     csv_path: str | None = None
+    bulk_upload: bool = False
+    incremental: bool = False
+    chunk_size: int | None = None
+    delta_upload: bool = False
+    # Scrape budgets; unset ones fall back to CRAWLER_MAX_* (see crawlers.budget).
+    # They cover scrape() and the detail requests made in transform().
+    max_seconds: float | None = None
+    max_requests: int | None = None
+    max_bytes: int | None = None
 
     def __post_init__(self):
+        if self.chunk_size is not None and self.chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, got {self.chunk_size!r}')
+        for name in ('max_seconds', 'max_requests', 'max_bytes'):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f'{name} must be positive, got {value!r}')
+        if self.delta_upload and (self.upload_target != 'classical' or self.chunk_size):
+            raise ValueError('delta_upload requires upload_target="classical" and no chunk_size')
         if self.country_code is None:
             return
         country_code = self.country_code.upper()
@@ -33,30 +72,203 @@ class CrawlerConfig:
             raise ValueError(f'country_code must be an ISO 3166-1 alpha-2 code, got {self.country_code!r}')
         object.__setattr__(self, 'country_code', country_code)
 
-    @property
-    def save_path(self) -> str:
-        return self.csv_path or f'data/{self.slug}.csv'
+
+def _is_missing(value: Any) -> bool:
+    # NaN and NaT are the only values that differ from themselves; pd.NA
+    # refuses the comparison.  Array-like values are never missing.
+    try:
+        return bool(value != value)
+    except TypeError:
+        return True
+    except ValueError:
+        return False
+
+
+def _write_csv(path: str, records: list[dict]) -> None:
+    fieldnames = list(dict.fromkeys(column for record in records for column in record))
+    with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def _chunks(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 class BaseCrawler:
     config: CrawlerConfig
+    _known_events: KnownEvents | None = None
+    last_diff: RecordDiff | None = None
+    run_started_at: datetime | None = None
+    current_run: CrawlerRun | None = None
+    budget_exceeded: BudgetExceeded | None = None
+    # Set by last_successful_run(): the scrape may only return changed events.
+    filtered_since_last_run: bool = False
 
-    def scrape(self) -> list[dict]:
+    def scrape(self) -> Iterable[dict]:
+        """Return or yield raw records.
+
+        With ``CrawlerConfig.chunk_size`` set, yielded records are prepared,
+        saved and uploaded in chunks while scraping continues.
+        """
         raise NotImplementedError
 
+    def scrape_records(self) -> Iterable[dict]:
+        """Records of one scrape, for callers outside the crawler.
+
+        ``run()``, the benchmark and the validator call this rather than
+        ``scrape()``, which ``AsyncBaseCrawler`` turns into a coroutine.
+        """
+        return self.scrape()
+
+    @contextmanager
+    def _within_budget(self, context: dict[str, str], hard_stop: bool = True) -> Iterator[budget.BudgetTracker]:
+        """Enforce the crawler's budget on the scrape and preparation inside the block.
+
+        Detail requests made in ``transform()`` count against the budget too.
+        ``budget_exceeded`` is set when the block ends.
+        """
+        with budget.enforcing(CrawlBudget.for_crawler(self.config), http.stats, hard_stop=hard_stop) as tracker:
+            try:
+                yield tracker
+            finally:
+                # tracker.exceeded is set before any BudgetExceeded is raised.
+                self.budget_exceeded = tracker.exceeded
+        if self.budget_exceeded is not None:
+            logger.warning(
+                'Crawler budget exceeded, keeping the records collected so far',
+                extra={
+                    'event': 'crawler_budget_exceeded',
+                    'budget_limit': self.budget_exceeded.limit,
+                    'error_message': str(self.budget_exceeded),
+                    **context,
+                },
+            )
+
+    def _scrape_until_budget_exceeded(self) -> Iterator[dict]:
+        """Yield scraped records, ending quietly once the budget is used up.
+
+        Records yielded before the budget ran out are kept.
+        """
+        try:
+            yield from self.scrape_records()
+        except BudgetExceeded:
+            pass
+
     def build_dataframe(self, records: list[dict]) -> pd.DataFrame:
+        import pandas as pd
+
         return pd.DataFrame(records, columns=self.config.columns)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         return df
 
+    def transform_records(self, records: list[dict]) -> list[dict]:
+        """Record-level counterpart of ``transform()`` that avoids pandas."""
+        return records
+
+    def known_events(self) -> KnownEvents:
+        """Return this source's stored (url, date) keys, loaded once per run.
+
+        Upload skips events that are already stored, so crawlers may leave out
+        detail requests for events where ``needs_details()`` is False.
+        """
+        if self._known_events is None:
+            table_name = 'potential_event' if self.config.upload_target == 'potential' else 'classical_concert'
+            self._known_events = load_known_events(self.config.source, table_name)
+        return self._known_events
+
+    def last_successful_run(self) -> datetime | None:
+        """Start time of the previous run that finished without error.
+
+        Crawlers pass it to ``sitemaps.iter_sitemap(since=...)`` to fetch
+        only pages changed since then.  Such a run returns only the changed
+        events, so once this returns a time the run is uploaded but neither
+        archived nor diffed, and a delta upload falls back to a plain one.
+        """
+        try:
+            since = CrawlArchive.from_environment().last_success(self.config.slug)
+        except OSError:
+            return None
+        if since is not None:
+            self.filtered_since_last_run = True
+        return since
+
     def upload(self, records: list[dict]) -> tuple[int, int]:
         if self.config.upload_target == 'potential':
-            return upload_potential_concerts(records)
-        return upload_concerts(records)
+            return upload_potential_concerts(records, bulk=self.config.bulk_upload)
+        return upload_concerts(records, bulk=self.config.bulk_upload)
+
+    def uses_dataframe(self) -> bool:
+        """Whether records are prepared through pandas.
+
+        Crawlers that override ``build_dataframe()`` or ``transform()`` get a
+        DataFrame; all others use the plain-record path.
+        """
+        crawler_class = type(self)
+        return (
+            crawler_class.transform is not BaseCrawler.transform
+            or crawler_class.build_dataframe is not BaseCrawler.build_dataframe
+        )
 
     def prepare_records(self, records: list[dict]) -> list[dict]:
         """Apply production transformations without writing or uploading."""
+        if self.uses_dataframe():
+            return self._prepare_dataframe_records(records)
+        return self._prepare_plain_records(records)
+
+    def _prepare_plain_records(self, records: list[dict]) -> list[dict]:
+        """Pure-Python equivalent of ``_prepare_dataframe_records()``.
+
+        Values are passed through as they are, whereas pandas would widen an
+        integer column with gaps to floats and datetimes to Timestamps.
+        """
+        columns = self.config.columns
+        if columns is None:
+            columns = list(dict.fromkeys(column for record in records for column in record))
+        records = self.transform_records(
+            [{column: record.get(column) for column in columns} for record in records]
+        )
+        columns = list(records[0]) if records else list(columns)
+
+        front = []
+        for column, value in self.config.front_fields:
+            if column in columns or any(name == column for name, _value in front):
+                raise ValueError(f'cannot insert {column}, already exists')
+            front.insert(0, (column, value))
+
+        has_country = 'country_code' in columns or any(name == 'country_code' for name, _value in front)
+        if not has_country and self.config.country_code is None:
+            raise ValueError(
+                'country_code is required on every record when CrawlerConfig.country_code is None'
+            )
+        if not has_country:
+            front.insert(0, ('country_code', self.config.country_code))
+
+        prepared = []
+        seen_keys = set()
+        for record in records:
+            record = {**dict(front), **record}
+            for column, value in record.items():
+                if _is_missing(value):
+                    record[column] = None
+            country_code = record['country_code']
+            if isinstance(country_code, str):
+                record['country_code'] = country_code.upper()
+            if self.config.dedupe_subset:
+                key = tuple(record[column] for column in self.config.dedupe_subset)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+            prepared.append(record)
+        return prepared
+
+    def _prepare_dataframe_records(self, records: list[dict]) -> list[dict]:
+        import pandas as pd
+
         df = self.build_dataframe(records)
         df = self.transform(df)
 
@@ -89,9 +301,17 @@ class BaseCrawler:
         configure_logging()
         context = {'crawler': self.config.slug, 'source_url': self.config.source_url}
         logger.info('Getting concerts', extra={'event': 'crawler_started', **context})
+        self.current_run = CrawlerRun(self.config.slug, self.config.source)
+        self.run_started_at = self.current_run.started_at
+        self.budget_exceeded = None
+        self.filtered_since_last_run = False
+        traffic = http.stats.snapshot()
+        error = None
         try:
-            return self._run(context)
-        except Exception as error:
+            with recording(self.config.slug):
+                result = self._run(context)
+        except Exception as caught:
+            error = caught
             logger.exception(
                 'Crawler failed',
                 extra={
@@ -102,28 +322,285 @@ class BaseCrawler:
                 },
             )
             raise
+        finally:
+            self._record_run(traffic, error, context)
+        if self.budget_exceeded is not None:
+            # Pages skipped this time must not count as seen by the next run.
+            return result
+        try:
+            CrawlArchive.from_environment().mark_succeeded(self.config.slug, self.run_started_at)
+        except OSError as error:
+            logger.warning(
+                'Could not record successful run',
+                extra={'event': 'crawler_success_mark_failed', 'error_message': str(error), **context},
+            )
+        return result
+
+    def _record_run(self, traffic: dict[str, Any], error: BaseException | None, context: dict[str, str]) -> None:
+        """Finish ``current_run`` and write it to the ``crawler_run`` ledger."""
+        run = self.current_run
+        now = http.stats.snapshot()
+        run.request_count = now['request_count'] - traffic['request_count']
+        run.bytes_received = now['bytes_received'] - traffic['bytes_received']
+        run.finish(error, budget_exceeded=self.budget_exceeded)
+        try:
+            record_crawler_run(run)
+        except (psycopg2.Error, OSError) as db_error:
+            logger.warning(
+                'Could not record crawler run',
+                extra={'event': 'crawler_run_record_failed', 'error_message': str(db_error), **context},
+            )
 
     def _run(self, context: dict[str, str]):
-        records = self.scrape()
+        run = self.current_run
+        self._known_events = None
+        if self.config.incremental:
+            known_events = self.known_events()
+            logger.info(
+                'Known events loaded',
+                extra={'event': 'crawler_known_events_loaded', 'record_count': len(known_events), **context},
+            )
+
+        if self.config.chunk_size:
+            return self._run_streaming(context)
+
+        with self._within_budget(context):
+            with run.phase('scrape'):
+                records = list(self._scrape_until_budget_exceeded())
+            logger.info(
+                'Scrape completed',
+                extra={'event': 'crawler_scrape_completed', 'record_count': len(records), **context},
+            )
+
+            with run.phase('prepare'):
+                records = self.prepare_records(records)
+        run.record_count = len(records)
+        archive = CrawlArchive.from_environment()
+        previous = self._load_snapshot(archive, context)
+        if self.config.incremental and previous:
+            self._carry_forward_skipped_details(previous, records)
+        # Events left out of a filtered scrape did not disappear from the source.
+        if previous is None or self.filtered_since_last_run:
+            self.last_diff = None
+        else:
+            self.last_diff = diff_records(previous, records)
+        if self.last_diff is not None and self.budget_exceeded is None:
+            run.change_fraction = self.last_diff.change_fraction()
+        # A partial scrape must not become the baseline of the next diff.
+        keep_snapshot = self.budget_exceeded is None and not self.filtered_since_last_run
+        if keep_snapshot and not self.config.delta_upload:
+            self._save_snapshot(archive, records, context)
+        if self.config.csv_path:
+            _write_csv(self.config.csv_path, records)
+            logger.info(
+                'CSV backup saved',
+                extra={'event': 'crawler_csv_saved', 'path': self.config.csv_path, 'record_count': len(records), **context},
+            )
         logger.info(
-            'Scrape completed',
-            extra={'event': 'crawler_scrape_completed', 'record_count': len(records), **context},
+            'Uploading concerts',
+            extra={'event': 'crawler_upload_started', 'record_count': len(records), **context},
         )
+        with run.phase('upload'):
+            if self.config.delta_upload and self.last_diff is not None:
+                counts = self._upload_delta(records, context)
+            else:
+                inserted_count, skipped_count = self.upload(records)
+                counts = {'inserted_count': inserted_count, 'skipped_count': skipped_count}
+        run.inserted_count = counts['inserted_count']
+        run.skipped_count = counts['skipped_count']
+        if keep_snapshot and self.config.delta_upload:
+            # The snapshot is the baseline of the next delta, so it is only
+            # saved once this run's changes are in the database.
+            self._save_snapshot(archive, records, context)
+        logger.info('Upload completed', extra={'event': 'crawler_upload_completed', **counts, **context})
+        return records
 
-        records = self.prepare_records(records)
-        df = pd.DataFrame(records)
+    def _upload_delta(self, records: list[dict], context: dict[str, str]) -> dict[str, int]:
+        diff = self.last_diff
+        previous_count = len(diff.changed) + len(diff.disappeared) + len(diff.unchanged)
+        complete = self.budget_exceeded is None and bool(records) and len(diff.disappeared) <= max(MISSING_EVENTS_TOLERANCE, previous_count // 2)
+        if not complete:
+            logger.warning(
+                'Scrape looks incomplete, not marking missing events',
+                extra={
+                    'event': 'crawler_missing_marking_skipped',
+                    'record_count': len(records),
+                    'previous_count': previous_count,
+                    'disappeared_count': len(diff.disappeared),
+                    **context,
+                },
+            )
+        return asdict(upload_concert_delta(diff, self.config.source, mark_missing=complete))
+
+    def _carry_forward_skipped_details(self, previous: list[dict], records: list[dict]) -> None:
+        """Fill the fields an incremental run left empty for known events from the previous snapshot.
+
+        Known events come back without their details, so without this the
+        snapshot and the diff would lose them on every incremental run.
+        """
+        known = self.known_events()
+        previous_by_key = {tuple(record.get(name) for name in (*KEY_FIELDS, 'title')): record for record in previous}
+        for record in records:
+            if known.needs_details(record.get('url'), record.get('date')):
+                continue
+            key = tuple(normalize_record(record).get(name) for name in (*KEY_FIELDS, 'title'))
+            before = previous_by_key.get(key)
+            if before is None:
+                continue
+            for column, value in record.items():
+                if value is None and before.get(column) is not None:
+                    record[column] = before[column]
+
+    def _load_snapshot(self, archive: CrawlArchive, context: dict[str, str]) -> list[dict] | None:
+        try:
+            return archive.load_latest(self.config.slug)
+        except (OSError, ValueError) as error:
+            logger.warning(
+                'Could not read previous crawl snapshot',
+                extra={'event': 'crawler_snapshot_failed', 'error_message': str(error), **context},
+            )
+            return None
 
-        save_path = self.config.save_path
-        df.to_csv(save_path, index=False)
+    def _save_snapshot(self, archive: CrawlArchive, records: list[dict], context: dict[str, str]) -> None:
+        """Archive the prepared records and log the diff against the previous run."""
+        try:
+            path = archive.save(self.config.slug, records)
+        except (OSError, ValueError) as error:
+            logger.warning(
+                'Could not save crawl snapshot',
+                extra={'event': 'crawler_snapshot_failed', 'error_message': str(error), **context},
+            )
+            return
         logger.info(
-            'CSV backup saved',
-            extra={'event': 'crawler_csv_saved', 'path': save_path, 'record_count': len(records), **context},
+            'Crawl snapshot saved',
+            extra={
+                'event': 'crawler_snapshot_saved',
+                'path': str(path),
+                'record_count': len(records),
+                **(self.last_diff.counts() if self.last_diff else {}),
+                **context,
+            },
         )
+
+    def _run_streaming(self, context: dict[str, str]) -> None:
+        """Prepare, archive and upload records in chunks of ``config.chunk_size``.
+
+        Peak memory is bounded by one chunk.  ``dedupe_subset`` is still
+        applied across the whole run.  Streaming runs are archived but not
+        diffed, since that would hold the previous snapshot in memory.
+        """
         logger.info(
             'Uploading concerts',
-            extra={'event': 'crawler_upload_started', 'record_count': len(records), **context},
+            extra={'event': 'crawler_upload_started', 'chunk_size': self.config.chunk_size, **context},
+        )
+        run = self.current_run
+        record_count = inserted_count = skipped_count = 0
+        seen_keys = set()
+        with ExitStack() as stack:
+            archive = CrawlArchive.from_environment()
+            try:
+                snapshot = stack.enter_context(archive.writer(self.config.slug))
+            except OSError as error:
+                snapshot = None
+                logger.warning(
+                    'Could not save crawl snapshot',
+                    extra={'event': 'crawler_snapshot_failed', 'error_message': str(error), **context},
+                )
+            csv_file = None
+            if self.config.csv_path:
+                csv_file = stack.enter_context(open(self.config.csv_path, 'w', newline='', encoding='utf-8'))
+            csv_writer = None
+            dropped_columns = set()
+            saved_count = 0
+
+            # Chunks are uploaded while scraping, so the budget must not interrupt calls.
+            tracker = stack.enter_context(self._within_budget(context, hard_stop=False))
+            scraped = run.timed(self._scrape_until_budget_exceeded(), 'scrape')
+            for chunk_index, chunk in enumerate(_chunks(scraped, self.config.chunk_size)):
+                record_count += len(chunk)
+                with run.phase('prepare'):
+                    records = self.prepare_records(chunk)
+                if self.config.dedupe_subset:
+                    unique = []
+                    for record in records:
+                        key = tuple(record.get(column) for column in self.config.dedupe_subset)
+                        if key not in seen_keys:
+                            seen_keys.add(key)
+                            unique.append(record)
+                    records = unique
+                if not records:
+                    continue
+
+                if snapshot:
+                    snapshot.write(records)
+                if csv_file:
+                    if csv_writer is None:
+                        fieldnames = dict.fromkeys(column for record in records for column in record)
+                        csv_writer = csv.DictWriter(
+                            csv_file, fieldnames=list(fieldnames), extrasaction='ignore', lineterminator='\n'
+                        )
+                        csv_writer.writeheader()
+                    # The header is written before later chunks are seen; columns
+                    # that only show up there cannot be added to it.
+                    dropped = {column for record in records for column in record}
+                    dropped -= {*csv_writer.fieldnames, *dropped_columns}
+                    if dropped:
+                        dropped_columns |= dropped
+                        logger.warning(
+                            'CSV backup is missing columns that first appeared after its header',
+                            extra={
+                                'event': 'crawler_csv_columns_dropped',
+                                'path': self.config.csv_path,
+                                'columns': sorted(dropped),
+                                **context,
+                            },
+                        )
+                    csv_writer.writerows(records)
+                saved_count += len(records)
+
+                with run.phase('upload'):
+                    inserted, skipped = self.upload(records)
+                inserted_count += inserted
+                skipped_count += skipped
+                logger.debug(
+                    'Chunk uploaded',
+                    extra={
+                        'event': 'crawler_chunk_uploaded',
+                        'chunk_index': chunk_index,
+                        'record_count': len(records),
+                        'inserted_count': inserted,
+                        'skipped_count': skipped,
+                        **context,
+                    },
+                )
+            if snapshot and (tracker.exceeded is not None or self.filtered_since_last_run):
+                # Chunks are uploaded, but a partial run is not archived.
+                snapshot.abort()
+                snapshot = None
+
+        logger.info(
+            'Scrape completed',
+            extra={'event': 'crawler_scrape_completed', 'record_count': record_count, **context},
         )
-        inserted_count, skipped_count = self.upload(records)
+        run.record_count = saved_count
+        run.inserted_count = inserted_count
+        run.skipped_count = skipped_count
+        if snapshot:
+            archive.prune(self.config.slug)
+            logger.info(
+                'Crawl snapshot saved',
+                extra={
+                    'event': 'crawler_snapshot_saved',
+                    'path': str(snapshot.path),
+                    'record_count': saved_count,
+                    **context,
+                },
+            )
+        if csv_file:
+            logger.info(
+                'CSV backup saved',
+                extra={'event': 'crawler_csv_saved', 'path': self.config.csv_path, 'record_count': saved_count, **context},
+            )
         logger.info(
             'Upload completed',
             extra={
@@ -133,4 +610,3 @@ class BaseCrawler:
                 **context,
             },
         )
-        return records
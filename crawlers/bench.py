@@ -0,0 +1,264 @@
+"""Benchmark crawlers offline against their recorded HTTP traffic.
+
+Every crawler with a recording (see ``crawlers.replay``) is imported in a
+fresh process, and its ``scrape()`` and ``prepare_records()`` run against
+that recording.  The numbers are the crawler's own parse and transform cost,
+without network time:
+
+    python -m crawlers.bench                               # every recorded crawler
+    python -m crawlers.bench --crawler filharmonia_sk --tracemalloc
+    python -m crawlers.bench --output baseline.json
+    python -m crawlers.bench --baseline baseline.json      # exit 1 on regressions
+
+The report is JSON and lists the crawler with the most CPU time first.
+``fast_path_hints`` lists the shared fast paths a crawler does not use yet:
+``parse_html`` (it still uses ``html.parser``) and ``plain_records`` (it
+prepares records through pandas).  ``fast_path_candidates`` lists those
+crawlers by CPU time, so the most expensive ones are converted first.
+
+Run with the default single job when comparing timings; parallel jobs
+compete for CPU.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+import importlib
+import inspect
+import json
+import multiprocessing
+from pathlib import Path
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from .manifest import CrawlerEntry, load_manifest
+from .replay import ReplayConfig
+
+
+DEFAULT_MAX_SLOWDOWN = 1.25
+DEFAULT_MAX_MEMORY_GROWTH = 1.25
+# Smaller differences are noise, whatever the ratio.
+MIN_SECONDS_DELTA = 0.05
+MIN_MEGABYTES_DELTA = 5.0
+TIME_METRICS = ('wall_seconds', 'cpu_seconds')
+MEMORY_METRICS = ('peak_rss_mb', 'peak_traced_mb')
+
+
+def _crawler_class(module: Any) -> type:
+    from .base import BaseCrawler
+
+    classes = [
+        value
+        for value in vars(module).values()
+        if inspect.isclass(value)
+        and issubclass(value, BaseCrawler)
+        and value is not BaseCrawler
+        and value.__module__ == module.__name__
+    ]
+    if len(classes) != 1:
+        raise ValueError(f'expected exactly one BaseCrawler subclass, found {len(classes)}')
+    return classes[0]
+
+
+def fast_path_hints(crawler: Any, module: Any) -> list[str]:
+    """Shared fast paths the crawler does not use yet."""
+    hints = []
+    source = inspect.getsource(module)
+    if 'html.parser' in source:
+        hints.append('parse_html')
+    if crawler.uses_dataframe():
+        hints.append('plain_records')
+    return hints
+
+
+def _megabytes(byte_count: float) -> float:
+    return round(byte_count / (1024 * 1024), 1)
+
+
+def measure_crawler(entry: CrawlerEntry, config: ReplayConfig, trace_memory: bool = False) -> dict[str, Any]:
+    """Run one crawler against its recording and return its measurements.
+
+    Meant to run in a fresh process: peak RSS covers the whole process.
+    """
+    from . import http
+    from .classical import KnownEvents
+    from .replay import recording
+
+    result: dict[str, Any] = {'slug': entry.slug, 'module': entry.module}
+    try:
+        module = importlib.import_module(entry.module)
+        crawler = _crawler_class(module)()
+        # Never read the database; every event counts as new.
+        crawler._known_events = KnownEvents()
+        result['fast_path_hints'] = fast_path_hints(crawler, module)
+        http.stats.reset()
+        if trace_memory:
+            tracemalloc.start()
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        # transform() may fetch detail pages, so it runs inside the recording too.
+        with recording(entry.slug, config):
+            scraped = list(crawler.scrape_records() or [])
+            scraped_at = time.perf_counter()
+            prepared = crawler.prepare_records(scraped)
+            finished_at = time.perf_counter()
+        cpu_seconds = time.process_time() - cpu_started
+        if trace_memory:
+            result['peak_traced_mb'] = _megabytes(tracemalloc.get_traced_memory()[1])
+    except Exception as error:
+        result['error'] = f'{type(error).__name__}: {error}'[:500]
+        return result
+    finally:
+        tracemalloc.stop()
+
+    traffic = http.stats.snapshot()
+    wall_seconds = finished_at - wall_started
+    result.update({
+        'record_count': len(prepared),
+        'wall_seconds': round(wall_seconds, 4),
+        'cpu_seconds': round(cpu_seconds, 4),
+        'scrape_seconds': round(scraped_at - wall_started, 4),
+        'prepare_seconds': round(finished_at - scraped_at, 4),
+        'records_per_second': round(len(prepared) / wall_seconds, 1) if wall_seconds else None,
+        'request_count': traffic['request_count'],
+        'bytes_parsed': traffic['bytes_received'],
+        # ru_maxrss is in kilobytes on Linux.
+        'peak_rss_mb': _megabytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024),
+    })
+    return result
+
+
+def run_benchmarks(
+    entries: list[CrawlerEntry],
+    config: ReplayConfig,
+    *,
+    jobs: int = 1,
+    trace_memory: bool = False,
+) -> list[dict[str, Any]]:
+    """Measure each crawler in its own fresh process, in input order."""
+    if not entries:
+        return []
+    with ProcessPoolExecutor(
+        max_workers=max(jobs, 1),
+        mp_context=multiprocessing.get_context('spawn'),
+        max_tasks_per_child=1,
+    ) as executor:
+        futures = [executor.submit(measure_crawler, entry, config, trace_memory) for entry in entries]
+        return [future.result() for future in futures]
+
+
+def _regression(result: dict, metric: str, baseline: Any, current: Any) -> dict[str, Any]:
+    return {'slug': result['slug'], 'metric': metric, 'baseline': baseline, 'current': current}
+
+
+def find_regressions(
+    results: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    *,
+    max_slowdown: float = DEFAULT_MAX_SLOWDOWN,
+    max_memory_growth: float = DEFAULT_MAX_MEMORY_GROWTH,
+) -> list[dict[str, Any]]:
+    """Compare results with an earlier report of this module.
+
+    The same recording must give the same requests and records, so any
+    increase in requests, any lost record and any new error count as
+    regressions.  Time and memory may grow by the given factors.
+    """
+    previous = {result['slug']: result for result in baseline.get('crawlers', [])}
+    regressions = []
+    for result in results:
+        old = previous.get(result['slug'])
+        if old is None or 'error' in old:
+            continue
+        if 'error' in result:
+            regressions.append(_regression(result, 'error', None, result['error']))
+            continue
+        if result['request_count'] > old['request_count']:
+            regressions.append(_regression(result, 'request_count', old['request_count'], result['request_count']))
+        if result['record_count'] < old['record_count']:
+            regressions.append(_regression(result, 'record_count', old['record_count'], result['record_count']))
+        for metric in TIME_METRICS:
+            if (
+                result[metric] > old[metric] * max_slowdown
+                and result[metric] - old[metric] >= MIN_SECONDS_DELTA
+            ):
+                regressions.append(_regression(result, metric, old[metric], result[metric]))
+        for metric in MEMORY_METRICS:
+            if metric not in result or metric not in old:
+                continue
+            if (
+                result[metric] > old[metric] * max_memory_growth
+                and result[metric] - old[metric] >= MIN_MEGABYTES_DELTA
+            ):
+                regressions.append(_regression(result, metric, old[metric], result[metric]))
+    return regressions
+
+
+def build_report(results: list[dict[str, Any]], skipped: list[str]) -> dict[str, Any]:
+    measured = sorted(
+        (result for result in results if 'error' not in result),
+        key=lambda result: result['cpu_seconds'],
+        reverse=True,
+    )
+    return {
+        'crawlers': measured + [result for result in results if 'error' in result],
+        'fast_path_candidates': [
+            {'slug': result['slug'], 'cpu_seconds': result['cpu_seconds'], 'hints': result['fast_path_hints']}
+            for result in measured
+            if result['fast_path_hints']
+        ],
+        'without_recording': skipped,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--crawler', action='append', help='slug of a crawler to measure; repeatable')
+    parser.add_argument('--recordings', type=Path, help='recordings directory (default: CRAWLER_HTTP_RECORDINGS_DIR)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='latency added to each replayed request')
+    parser.add_argument('--jobs', type=int, default=1, help='crawlers measured in parallel')
+    parser.add_argument('--tracemalloc', action='store_true', help='also report peak Python heap (slower)')
+    parser.add_argument('--output', type=Path, help='also write the report to this file')
+    parser.add_argument('--baseline', type=Path, help='report to compare with; exit 1 on regressions')
+    parser.add_argument('--max-slowdown', type=float, default=DEFAULT_MAX_SLOWDOWN)
+    parser.add_argument('--max-memory-growth', type=float, default=DEFAULT_MAX_MEMORY_GROWTH)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = replace(ReplayConfig.from_environment(), mode='replay', latency_seconds=args.latency_ms / 1000)
+    if args.recordings:
+        config = replace(config, directory=args.recordings)
+    entries = load_manifest()
+    if args.crawler:
+        unknown = set(args.crawler) - {entry.slug for entry in entries}
+        if unknown:
+            raise SystemExit(f'unknown crawler: {", ".join(sorted(unknown))}')
+        entries = [entry for entry in entries if entry.slug in args.crawler]
+    recorded = [entry for entry in entries if config.path(entry.slug).exists()]
+    skipped = [entry.slug for entry in entries if not config.path(entry.slug).exists()]
+
+    results = run_benchmarks(recorded, config, jobs=args.jobs, trace_memory=args.tracemalloc)
+    report = build_report(results, skipped)
+    if args.baseline:
+        report['regressions'] = find_regressions(
+            results,
+            json.loads(args.baseline.read_text(encoding='utf-8')),
+            max_slowdown=args.max_slowdown,
+            max_memory_growth=args.max_memory_growth,
+        )
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + '\n', encoding='utf-8')
+    print(text)
+    if report.get('regressions'):
+        print(f'{len(report["regressions"])} regressions against {args.baseline}', file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""Per-crawler limits on wall time, requests and bytes.
+
+``BaseCrawler.run()`` scrapes and prepares records under a ``CrawlBudget``
+built from the crawler's ``CrawlerConfig`` (``max_seconds``,
+``max_requests``, ``max_bytes``), falling back to ``CRAWLER_MAX_SECONDS``,
+``CRAWLER_MAX_REQUESTS`` and ``CRAWLER_MAX_BYTES``, so detail pages fetched
+in ``transform()`` count too.  Once a limit is reached, every further
+crawler HTTP request raises ``BudgetExceeded``.
+
+``BudgetExceeded`` is a ``requests.RequestException``, so crawlers that skip
+failed detail pages stop fetching and return what they have; an exception
+that escapes ``scrape()`` ends it, and records already yielded are kept.
+Either way the collected records are uploaded and the run is recorded as
+``budget_exceeded``.  An exception that escapes ``transform()`` leaves
+nothing to salvage and fails the run.  A scrape or preparation stuck in one
+call past its wall-time budget is interrupted ``HARD_STOP_GRACE_SECONDS``
+later.
+
+The default wall-time budget stops crawlers well before the executor kills
+them at ``CRAWLER_TIMEOUT_SECONDS``, which would lose everything.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+import signal
+import threading
+import time
+from typing import TYPE_CHECKING, Iterator
+
+import requests
+
+if TYPE_CHECKING:
+    from .base import CrawlerConfig
+    from .http import HttpStats
+
+
+DEFAULT_MAX_SECONDS = 25 * 60
+HARD_STOP_GRACE_SECONDS = 60
+
+
+class BudgetExceeded(requests.RequestException):
+    """A crawler used up one of its budgets; ``limit`` names which one."""
+
+    def __init__(self, limit: str, message: str):
+        super().__init__(message)
+        self.limit = limit
+
+
+def _optional_limit(name: str, default: float | None = None) -> float | None:
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    parsed = float(value)
+    # Zero switches the limit off.
+    return parsed if parsed > 0 else None
+
+
+@dataclass(frozen=True)
+class CrawlBudget:
+    max_seconds: float | None = None
+    max_requests: int | None = None
+    max_bytes: int | None = None
+
+    @classmethod
+    def for_crawler(cls, config: 'CrawlerConfig') -> 'CrawlBudget':
+        """The crawler's own limits, with the environment's for those it leaves unset."""
+        max_requests = _optional_limit('CRAWLER_MAX_REQUESTS')
+        max_bytes = _optional_limit('CRAWLER_MAX_BYTES')
+        return cls(
+            max_seconds=config.max_seconds or _optional_limit('CRAWLER_MAX_SECONDS', DEFAULT_MAX_SECONDS),
+            max_requests=config.max_requests or (int(max_requests) if max_requests else None),
+            max_bytes=config.max_bytes or (int(max_bytes) if max_bytes else None),
+        )
+
+
+class BudgetTracker:
+    """Checks one run's usage, counted in ``stats``, against its budget."""
+
+    def __init__(self, budget: CrawlBudget, stats: 'HttpStats', clock=time.monotonic):
+        self.budget = budget
+        self.stats = stats
+        self.clock = clock
+        self.started = clock()
+        self.baseline = stats.snapshot()
+        self.exceeded: BudgetExceeded | None = None
+
+    def usage(self) -> dict[str, float]:
+        now = self.stats.snapshot()
+        return {
+            'seconds': self.clock() - self.started,
+            'requests': now['request_count'] - self.baseline['request_count'],
+            'bytes': now['bytes_received'] - self.baseline['bytes_received'],
+        }
+
+    def check(self) -> None:
+        """Raise ``BudgetExceeded`` if any limit has been reached."""
+        if self.exceeded is not None:
+            # A fresh exception each time; re-raising one would grow its traceback.
+            raise BudgetExceeded(self.exceeded.limit, str(self.exceeded))
+        usage = self.usage()
+        for limit, used, allowed in (
+            ('max_seconds', usage['seconds'], self.budget.max_seconds),
+            ('max_requests', usage['requests'], self.budget.max_requests),
+            ('max_bytes', usage['bytes'], self.budget.max_bytes),
+        ):
+            if allowed is not None and used >= allowed:
+                self.exceeded = BudgetExceeded(limit, f'crawler budget {limit}={allowed:g} used up ({used:g})')
+                raise self.exceeded
+
+
+_active: BudgetTracker | None = None
+
+
+def active_budget() -> BudgetTracker | None:
+    return _active
+
+
+def check() -> None:
+    """Raise ``BudgetExceeded`` if the running crawler's budget is used up."""
+    if _active is not None:
+        _active.check()
+
+
+@contextmanager
+def enforcing(budget: CrawlBudget, stats: 'HttpStats', *, hard_stop: bool = True) -> Iterator[BudgetTracker]:
+    """Enforce ``budget`` on the traffic counted in ``stats`` inside the block.
+
+    Without ``hard_stop``, for blocks that also upload, the wall-time budget
+    is only checked before requests and never interrupts a call.
+    """
+    global _active
+    tracker = BudgetTracker(budget, stats)
+    previous, _active = _active, tracker
+    # Signal handlers only run in the main thread.
+    hard_stop = (
+        hard_stop and budget.max_seconds is not None and threading.current_thread() is threading.main_thread()
+    )
+    if hard_stop:
+        def interrupt(signum, frame):
+            tracker.exceeded = BudgetExceeded(
+                'max_seconds', f'crawler budget max_seconds={budget.max_seconds:g} overrun by a blocking call'
+            )
+            raise tracker.exceeded
+
+        previous_handler = signal.signal(signal.SIGALRM, interrupt)
+        signal.setitimer(signal.ITIMER_REAL, budget.max_seconds + HARD_STOP_GRACE_SECONDS)
+    try:
+        yield tracker
+    finally:
+        if hard_stop:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        _active = previous
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -174,7 +175,7 @@ def make_archive_records(url, html, fallback):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     catalog = concert_catalog(get_response(session, CONCERTS_URL).text)
     records = []
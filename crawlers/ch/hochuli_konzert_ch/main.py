@@ -2,10 +2,10 @@ import re
 from datetime import date
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -98,7 +98,7 @@ def make_record(element):
 
 
 def get_concerts():
-    response = requests.get(SOURCE_URL, headers=HEADERS, timeout=60)
+    response = http.get(SOURCE_URL, headers=HEADERS, timeout=60)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, 'html.parser')
     records = []
@@ -12,6 +12,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -59,7 +60,7 @@ def clean_text(value):
 
 
 def make_session():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     retry = Retry(
         total=3,
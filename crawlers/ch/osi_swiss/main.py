@@ -2,9 +2,9 @@ import re
 import unicodedata
 from datetime import datetime
 
-import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -157,7 +157,7 @@ def make_record(story):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     params = {
         'version': 'published',
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -198,7 +199,7 @@ def parse_archive_item(item):
 
 
 def fetch(url, params=None):
-    response = requests.get(url, params=params, headers=HEADERS, timeout=45)
+    response = http.get(url, params=params, headers=HEADERS, timeout=45)
     response.raise_for_status()
     return response.text
 
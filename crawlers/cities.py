@@ -1,5 +1,6 @@
 import math
 import re
+import threading
 import unicodedata
 from dataclasses import dataclass
 from typing import Any
@@ -56,3 +57,79 @@ def resolve_city(cursor, value: Any, source_scope: str | None = None) -> CityRes
     )
     rows = cursor.fetchall()
     return CityResolution(*rows[0]) if len(rows) == 1 else None
+
+
+class CityResolver:
+    """In-memory ``city_alias`` index that resolves like ``resolve_city``.
+
+    All aliases are loaded once per process.  ``refresh`` compares the alias
+    count and highest alias id with the database, loads only aliases added
+    since the last refresh (for example by the programme analyzer), and
+    reloads everything when rows were removed.  ``city_alias`` has no
+    update timestamp, so an alias or city changed in place by an UPDATE is
+    only picked up by the next full reload or a new process.
+    """
+
+    def __init__(self) -> None:
+        self._aliases: dict[tuple[str, str | None], set[CityResolution]] = {}
+        self._alias_count = 0
+        self._max_alias_id: int | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self, cursor) -> bool:
+        """Bring the index up to date; return whether anything was loaded."""
+        cursor.execute("SELECT COUNT(*), MAX(id) FROM city_alias")
+        alias_count, max_alias_id = cursor.fetchone()
+        with self._lock:
+            if (alias_count, max_alias_id) == (self._alias_count, self._max_alias_id):
+                return False
+            if (
+                self._max_alias_id is not None
+                and max_alias_id is not None
+                and alias_count > self._alias_count
+                and max_alias_id > self._max_alias_id
+            ):
+                aliases = self._fetch(cursor, self._max_alias_id)
+                if self._alias_count + len(aliases) == alias_count:
+                    self._add(aliases)
+                    return True
+            self._aliases = {}
+            self._alias_count = 0
+            self._max_alias_id = None
+            self._add(self._fetch(cursor))
+            return True
+
+    def resolve(self, value: Any, source_scope: str | None = None) -> CityResolution | None:
+        key = normalize_city_key(value)
+        if key is None:
+            return None
+        if source_scope:
+            cities = self._aliases.get((key, source_scope), ())
+            if len(cities) == 1:
+                return next(iter(cities))
+        cities = self._aliases.get((key, None), ())
+        return next(iter(cities)) if len(cities) == 1 else None
+
+    @staticmethod
+    def _fetch(cursor, after_id: int = 0) -> list[tuple]:
+        cursor.execute(
+            """
+            SELECT a.id, a.normalized_alias, a.source_scope,
+                   c.id, c.english_name, c.local_name, c.country_code
+            FROM city_alias a JOIN city c ON c.id = a.city_id
+            WHERE a.id > %s
+            """,
+            (after_id,),
+        )
+        return cursor.fetchall()
+
+    def _add(self, aliases: list[tuple]) -> None:
+        for alias_id, normalized_alias, source_scope, *city in aliases:
+            key = (normalized_alias, source_scope or None)
+            self._aliases.setdefault(key, set()).add(CityResolution(*city))
+            self._alias_count += 1
+            if self._max_alias_id is None or alias_id > self._max_alias_id:
+                self._max_alias_id = alias_id
+
+
+city_resolver = CityResolver()
@@ -1,80 +1,382 @@
-import os
+from dataclasses import dataclass
+from datetime import date as date_type, time as time_type
+
 from dotenv import load_dotenv
-import psycopg2
-from .cities import clean_city_raw, resolve_city
+from psycopg2.extras import Json, execute_values
+
+from db.connection import connection
+from .archive import RecordChange, RecordDiff
+from .cities import city_resolver, clean_city_raw
 
 load_dotenv()
 
-def upload_concerts(data: list[dict], table_name: str = 'classical_concert'):
+CONCERT_COLUMNS = (
+    'title', 'date', 'source', 'source_url', 'time_from', 'time_to', 'city_raw',
+    'country_code_raw', 'city_id', 'country_code_resolved', 'venue', 'url', 'type',
+    'description', 'composers', 'is_concert_details_filled',
+)
+BULK_PAGE_SIZE = 1000
+
+
+def concert_row(concert: dict, city_raw: str | None, city) -> tuple:
     """
-    Upload concerts to the database
+    Build the column values of one concert in CONCERT_COLUMNS order
     """
-    DB_NAME = os.getenv('DB_NAME')
-    DB_USER = os.getenv('DB_USER')
-    DB_PASS = os.getenv('DB_PASS')
-    DB_HOST = os.getenv('DB_HOST')
-    DB_PORT = os.getenv('DB_PORT')
-    
-    conn = psycopg2.connect(dbname=DB_NAME, user=DB_USER, password=DB_PASS, host=DB_HOST, port=DB_PORT)
-    cursor = conn.cursor()
-    
-    new_concerts = []
-    skipped_count = 0
-    
-    for concert in data:
+    composers = concert.get('composers')
+    return (
+        concert['title'],
+        concert['date'],
+        concert['source'],
+        concert['source_url'],
+        concert.get('time_from'),
+        concert.get('time_to'),
+        city_raw,
+        concert.get('country_code'),
+        city.city_id if city else None,
+        city.country_code if city else None,
+        concert['venue'],
+        concert['url'],
+        concert.get('type'),
+        concert.get('description'),
+        composers,
+        composers is not None,
+    )
+
+
+def _date_key(value) -> str:
+    # Records carry ISO strings, the database returns date objects.
+    return str(value)[:10]
+
+
+class KnownEvents:
+    """
+    Stored (url, date) keys of one source and whether each has a description
+    """
+
+    def __init__(self, rows=()):
+        self._described: dict[tuple[str, str], bool] = {}
+        for url, date, described in rows:
+            key = (url, _date_key(date))
+            self._described[key] = self._described.get(key, False) or bool(described)
+
+    def __len__(self):
+        return len(self._described)
+
+    def __contains__(self, key):
+        url, date = key
+        return (url, _date_key(date)) in self._described
+
+    def has_description(self, url: str, date) -> bool:
+        return self._described.get((url, _date_key(date)), False)
+
+    def needs_details(self, url: str, date) -> bool:
+        """
+        True unless the event is already stored with a description
+        """
+        return not self.has_description(url, date)
+
+
+def load_known_events(source: str, table_name: str = 'classical_concert') -> KnownEvents:
+    """
+    Load the stored events of a source with one read-only query
+    """
+    with connection(readonly=True) as conn, conn.cursor() as cursor:
         cursor.execute(
-            f"SELECT id FROM {table_name} WHERE title = %s AND date = %s AND url = %s",
-            (concert['title'], concert['date'], concert['url'])
+            f"SELECT url, date, COALESCE(description, '') <> '' FROM {table_name} WHERE source = %s",
+            (source,),
         )
-        exists = cursor.fetchone()
-        
-        if not exists:
-            new_concerts.append(concert)
-        else:
-            skipped_count += 1
-    
-    inserted_count = 0
-    if new_concerts:
+        return KnownEvents(cursor.fetchall())
+
+
+def upload_concerts(data: list[dict], table_name: str = 'classical_concert', bulk: bool = False):
+    """
+    Upload concerts to the database
+    """
+    if bulk:
+        return bulk_upload_concerts(data, table_name)
+
+    with connection() as conn:
+        cursor = conn.cursor()
+        city_resolver.refresh(cursor)
+
+        new_concerts = []
+        seen_keys = set()
+        skipped_count = 0
+
+        for concert in data:
+            # The (title, date, url, time_from) key is unique, so repeated rows
+            # within one batch are skipped just like rows that already exist.
+            key = _identity(concert)
+            if key in seen_keys:
+                skipped_count += 1
+                continue
+            seen_keys.add(key)
+            cursor.execute(
+                f"SELECT id FROM {table_name} "
+                "WHERE title = %s AND date = %s AND url = %s AND time_from IS NOT DISTINCT FROM %s::time",
+                (concert['title'], concert['date'], concert['url'], concert.get('time_from'))
+            )
+            exists = cursor.fetchone()
+
+            if not exists:
+                new_concerts.append(concert)
+            else:
+                skipped_count += 1
+
+        inserted_count = 0
         for concert in new_concerts:
-            composers = concert.get('composers')
-            is_concert_details_filled = True if composers is not None else False
             city_raw = clean_city_raw(concert.get('city'))
-            city = resolve_city(cursor, city_raw, concert.get('source'))
+            city = city_resolver.resolve(city_raw, concert.get('source'))
             cursor.execute(
-                f"INSERT INTO {table_name} (title, date, source, source_url, time_from, time_to, city_raw, country_code_raw, city_id, country_code_resolved, venue, url, type, description, composers, is_concert_details_filled) "
-                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING id",
-                (
-                    concert['title'], 
-                    concert['date'], 
-                    concert['source'],
-                    concert['source_url'],
-                    concert.get('time_from'),
-                    concert.get('time_to'), 
-                    city_raw,
-                    concert.get('country_code'),
-                    city.city_id if city else None,
-                    city.country_code if city else None,
-                    concert['venue'],
-                    concert['url'], 
-                    concert.get('type'),
-                    concert.get('description'),
-                    composers,
-                    is_concert_details_filled
-                )
+                f"INSERT INTO {table_name} ({', '.join(CONCERT_COLUMNS)}) "
+                f"VALUES ({', '.join(['%s'] * len(CONCERT_COLUMNS))}) RETURNING id",
+                concert_row(concert, city_raw, city),
             )
             inserted_count += 1
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
-    
+
+        conn.commit()
+        cursor.close()
+
     return inserted_count, skipped_count
 
-def upload_potential_concerts(data: list[dict]):
+def bulk_upload_concerts(data: list[dict], table_name: str = 'classical_concert'):
+    """
+    Upload concerts to the database in one set-based statement
+
+    Rows are sent with multi-row VALUES pages and merged on the unique
+    (title, date, url, time_from) key, so the database skips existing concerts and
+    duplicates inside the batch.  Returns the same (inserted, skipped)
+    counts as the row-by-row path.
+    """
+    if not data:
+        return 0, 0
+
+    with connection() as conn:
+        with conn.cursor() as cursor:
+            inserted_count = _insert_concerts(cursor, data, table_name)
+        conn.commit()
+
+    return inserted_count, len(data) - inserted_count
+
+def _insert_concerts(cursor, data: list[dict], table_name: str = 'classical_concert') -> int:
+    if not data:
+        return 0
+    city_resolver.refresh(cursor)
+    rows = []
+    for concert in data:
+        city_raw = clean_city_raw(concert.get('city'))
+        city = city_resolver.resolve(city_raw, concert.get('source'))
+        rows.append(concert_row(concert, city_raw, city))
+
+    inserted = execute_values(
+        cursor,
+        f"INSERT INTO {table_name} ({', '.join(CONCERT_COLUMNS)}) VALUES %s "
+        "ON CONFLICT (title, date, url, time_from) DO NOTHING RETURNING id",
+        rows,
+        page_size=BULK_PAGE_SIZE,
+        fetch=True,
+    )
+    return len(inserted)
+
+def upload_potential_concerts(data: list[dict], bulk: bool = False):
     """
     Upload concerts to the database
     """
-    return upload_concerts(data, table_name='potential_event')
+    return upload_concerts(data, table_name='potential_event', bulk=bulk)
+
+DELTA_FIELDS = ('time_from', 'time_to', 'venue')
+CHANGE_MODEL = 'crawler'
+
+
+@dataclass
+class DeltaResult:
+    inserted_count: int = 0
+    skipped_count: int = 0
+    updated_count: int = 0
+    missing_count: int = 0
+    reappeared_count: int = 0
+
+
+def _event_date(value) -> date_type | None:
+    if isinstance(value, date_type):
+        return value
+    try:
+        return date_type.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _event_time(value) -> time_type | None:
+    if isinstance(value, time_type):
+        return value
+    try:
+        return time_type.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _delta_value(field: str, value):
+    if field == 'date':
+        return _event_date(value)
+    if field in {'time_from', 'time_to'}:
+        return _event_time(value)
+    return value or None
+
+
+def _json_event_value(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, time_type):
+        return value.isoformat(timespec='minutes')
+    if isinstance(value, date_type):
+        return value.isoformat()
+    return str(value)
+
+
+def _identity(record: dict) -> tuple:
+    return record['title'], _event_date(record['date']), record['url'], _event_time(record.get('time_from'))
+
+
+def _pair_rescheduled(diff: RecordDiff) -> tuple[list[RecordChange], list[dict], list[dict]]:
+    """Pair a disappeared and an added record with the same title and URL."""
+    def by_page(records):
+        groups = {}
+        for record in records:
+            groups.setdefault((record['title'], record['url']), []).append(record)
+        return groups
+
+    disappeared = by_page(diff.disappeared)
+    rescheduled = []
+    added = []
+    for key, records in by_page(diff.added).items():
+        candidates = disappeared.get(key, [])
+        if len(records) == 1 and len(candidates) == 1:
+            rescheduled.append(RecordChange(candidates.pop(), records[0]))
+        else:
+            added.extend(records)
+    return rescheduled, added, [record for group in disappeared.values() for record in group]
+
+
+def upload_concert_delta(
+    diff: RecordDiff,
+    source: str,
+    *,
+    mark_missing: bool = True,
+    today: date_type | None = None,
+) -> DeltaResult:
+    """
+    Apply a run-to-run diff to classical_concert
+
+    Added events are inserted, and fields that changed at the source since
+    the previous run are updated and recorded in classical_concert_change
+    like analyzer event updates.  An event that moved to another date
+    keeps its row; a renamed event is inserted anew.  Upcoming events
+    missing from a complete scrape get missing_from_source_at, which keeps
+    them out of programme analysis until they reappear.
+    """
+    today = today or date_type.today()
+    rescheduled, added, disappeared = _pair_rescheduled(diff)
+    changes = [*diff.changed, *rescheduled]
+    current = [*diff.unchanged, *(change.current for change in diff.changed), *added]
+    result = DeltaResult()
+
+    with connection() as conn:
+        with conn.cursor() as cursor:
+            urls = sorted({change.previous['url'] for change in changes} | {record['url'] for record in disappeared})
+            cursor.execute(
+                "SELECT id, title, date, url, time_from, time_to, venue, missing_from_source_at IS NOT NULL "
+                "FROM classical_concert WHERE source = %s AND (url = ANY(%s) OR missing_from_source_at IS NOT NULL)",
+                (source, urls),
+            )
+            stored = {}
+            for concert_id, title, date, url, time_from, time_to, venue, missing in cursor.fetchall():
+                stored[(title, date, url, time_from)] = {
+                    'id': concert_id, 'date': date, 'time_from': time_from,
+                    'time_to': time_to, 'venue': venue, 'missing': missing,
+                }
+
+            updates = []
+            change_rows = []
+            for change in changes:
+                row = stored.get(_identity(change.previous))
+                if row is None:
+                    added.append(change.current)
+                    continue
+                if change.current['title'] != change.previous['title']:
+                    # Titles are not tracked event fields: store the renamed
+                    # event as new and let the old row go missing.
+                    added.append(change.current)
+                    disappeared.append(change.previous)
+                    continue
+                if _identity(change.current) != _identity(change.previous) and _identity(change.current) in stored:
+                    # The new date or time already has its own row; leave both alone.
+                    continue
+                values = {}
+                for field in ('date', *DELTA_FIELDS):
+                    new_value = _delta_value(field, change.current.get(field))
+                    if new_value is None or new_value == row[field]:
+                        continue
+                    if _delta_value(field, change.previous.get(field)) == new_value:
+                        continue
+                    values[field] = new_value
+                    change_rows.append((
+                        row['id'], field, Json(_json_event_value(row[field])),
+                        Json(_json_event_value(new_value)), change.current['url'],
+                        f'Changed on the source page since the previous {source} crawl',
+                        CHANGE_MODEL,
+                    ))
+                if values:
+                    updates.append((
+                        row['id'],
+                        *(values.get(field, row[field]) for field in ('date', *DELTA_FIELDS)),
+                    ))
+
+            if updates:
+                execute_values(
+                    cursor,
+                    "UPDATE classical_concert AS c SET date = v.date, time_from = v.time_from, "
+                    "time_to = v.time_to, venue = v.venue, updated_at = now() "
+                    "FROM (VALUES %s) AS v(id, date, time_from, time_to, venue) WHERE c.id = v.id",
+                    updates,
+                    template='(%s, %s::date, %s::time, %s::time, %s)',
+                    page_size=BULK_PAGE_SIZE,
+                )
+                execute_values(
+                    cursor,
+                    "INSERT INTO classical_concert_change "
+                    "(classical_concert_id, field_name, old_value, new_value, source_url, evidence, model) "
+                    "VALUES %s",
+                    change_rows,
+                    page_size=BULK_PAGE_SIZE,
+                )
+            result.updated_count = len(updates)
+
+            result.inserted_count = _insert_concerts(cursor, added)
+            result.skipped_count = len(added) - result.inserted_count
+
+            seen = {_identity(record) for record in current} | {_identity(change.current) for change in changes}
+            reappeared = [row['id'] for key, row in stored.items() if row['missing'] and key in seen]
+            if reappeared:
+                cursor.execute(
+                    "UPDATE classical_concert SET missing_from_source_at = NULL WHERE id = ANY(%s)",
+                    (reappeared,),
+                )
+            result.reappeared_count = len(reappeared)
+
+            if mark_missing:
+                missing = [
+                    stored[key]['id'] for key in map(_identity, disappeared)
+                    if key in stored and not stored[key]['missing'] and key[1] and key[1] >= today
+                ]
+                if missing:
+                    cursor.execute(
+                        "UPDATE classical_concert SET missing_from_source_at = now() WHERE id = ANY(%s)",
+                        (missing,),
+                    )
+                result.missing_count = len(missing)
+        conn.commit()
+
+    return result
 
 class Concert:
     def __init__(self, title: str, date: str, source: str, time_from: str, time_to: str, city: str, venue: str, url: str, event_type: str, country_code: str | None = None):
@@ -0,0 +1,143 @@
+"""curl_cffi sessions that take part in HTTP record/replay.
+
+Some sites only answer clients with a browser TLS fingerprint.  Crawlers for
+them use ``CurlSession``/``AsyncCurlSession`` instead of curl_cffi's own
+sessions, so that inside ``replay.recording()`` their traffic is recorded
+and replayed just like that of ``crawlers.http`` sessions:
+
+    session = CurlSession(impersonate='chrome')
+    response = session.get(url)
+
+Requests are keyed the same way as with ``requests``, so one recording can
+hold traffic from both clients.  Live requests wait for the same per-domain
+rate limits as ``crawlers.http`` sessions (see ``crawlers.politeness``), and
+all requests count towards ``crawlers.http.stats`` and the crawler's budget.  Responses are always read in full while
+recording or replaying; ``stream=True`` is ignored then.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from curl_cffi import requests as curl_requests
+import requests
+
+from . import budget, http, politeness, replay
+
+
+def _prepared(method: str, url: str, kwargs: dict[str, Any]) -> requests.PreparedRequest:
+    return requests.Request(
+        method.upper(),
+        url,
+        params=kwargs.get('params'),
+        data=kwargs.get('data') if kwargs.get('data') is not None else kwargs.get('content'),
+        json=kwargs.get('json'),
+    ).prepare()
+
+
+def _response(exchange: replay.Exchange) -> curl_requests.Response:
+    response = curl_requests.Response()
+    response.status_code = exchange.status_code
+    response.reason = exchange.reason
+    response.ok = exchange.status_code < 400
+    response.url = exchange.final_url
+    response.headers = curl_requests.Headers(exchange.headers)
+    response.content = exchange.content
+    response.from_replay = True
+    return response
+
+
+def _record(cassette: replay.Cassette, request: requests.PreparedRequest, response: curl_requests.Response) -> None:
+    cassette.record(replay.Exchange.create(
+        request.method,
+        request.url,
+        request.body,
+        status_code=response.status_code,
+        reason=response.reason,
+        final_url=response.url,
+        headers=response.headers,
+        content=response.content,
+    ))
+
+
+def _account(response: curl_requests.Response, elapsed_seconds: float, streamed: bool) -> None:
+    if streamed and not getattr(response, 'from_replay', False):
+        # Reading the body here would defeat streaming.
+        try:
+            byte_count = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            byte_count = 0
+    else:
+        byte_count = len(response.content or b'')
+    http.stats.record(byte_count, elapsed_seconds)
+
+
+class CurlSession(curl_requests.Session):
+    """``curl_cffi.requests.Session`` that records and replays inside ``replay.recording()``."""
+
+    def __init__(self, *args, limiter: politeness.DomainRateLimiter | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter or politeness.default_limiter()
+
+    def request(self, method, url, **kwargs):
+        budget.check()
+        started = time.perf_counter()
+        response = self._request(method, url, **kwargs)
+        _account(response, time.perf_counter() - started, bool(kwargs.get('stream')))
+        return response
+
+    def _request(self, method, url, **kwargs):
+        cassette = replay.active_cassette()
+        if cassette is None:
+            return self._request_politely(method, url, **kwargs)
+        request = _prepared(method, url, kwargs)
+        if cassette.mode == 'replay':
+            return _response(cassette.play(request.method, request.url, request.body))
+        kwargs.pop('stream', None)
+        response = self._request_politely(method, url, **kwargs)
+        _record(cassette, request, response)
+        return response
+
+    def _request_politely(self, method, url, **kwargs):
+        self.limiter.wait(url)
+        response = super().request(method, url, **kwargs)
+        self.limiter.observe(url, response.status_code, response.headers)
+        return response
+
+
+class AsyncCurlSession(curl_requests.AsyncSession):
+    """``curl_cffi.requests.AsyncSession`` that records and replays inside ``replay.recording()``."""
+
+    def __init__(self, *args, limiter: politeness.DomainRateLimiter | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter or politeness.default_limiter()
+
+    async def request(self, method, url, **kwargs):
+        budget.check()
+        started = time.perf_counter()
+        response = await self._request(method, url, **kwargs)
+        _account(response, time.perf_counter() - started, bool(kwargs.get('stream')))
+        return response
+
+    async def _request(self, method, url, **kwargs):
+        cassette = replay.active_cassette()
+        if cassette is None:
+            return await self._request_politely(method, url, **kwargs)
+        request = _prepared(method, url, kwargs)
+        if cassette.mode == 'replay':
+            exchange = cassette.play(request.method, request.url, request.body, wait=False)
+            await asyncio.sleep(cassette.latency_seconds)
+            return _response(exchange)
+        kwargs.pop('stream', None)
+        response = await self._request_politely(method, url, **kwargs)
+        _record(cassette, request, response)
+        return response
+
+    async def _request_politely(self, method, url, **kwargs):
+        # A robots.txt lookup blocks, so the slot is booked off the event loop.
+        delay = await asyncio.to_thread(self.limiter.reserve, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        response = await super().request(method, url, **kwargs)
+        self.limiter.observe(url, response.status_code, response.headers)
+        return response
@@ -2,10 +2,10 @@ import re
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://auditeorganum.cz'
@@ -151,7 +151,7 @@ def extract_concert(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     concert_links = find_concert_links(session)
     concerts = []
 
@@ -3,10 +3,10 @@ from datetime import datetime
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://bachcollegium.cz'
@@ -115,7 +115,7 @@ def extract_concert(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     concerts = []
 
     for url in find_concert_links(session):
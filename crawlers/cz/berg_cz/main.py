@@ -3,10 +3,10 @@ from datetime import datetime
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://berg.cz/'
@@ -202,7 +202,7 @@ class BergCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         concert_links = find_concert_links(session)
         concert_data = []
 
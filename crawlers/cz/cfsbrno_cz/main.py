@@ -1,10 +1,10 @@
 import re
 from datetime import date, timedelta
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.cfsbrno.cz'
@@ -94,7 +94,7 @@ def fetch_events(session):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     concerts = []
 
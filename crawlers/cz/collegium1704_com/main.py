@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -160,7 +161,7 @@ def parse_event(event):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     seen = set()
     concerts = []
 
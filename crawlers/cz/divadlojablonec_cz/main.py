@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -187,7 +188,7 @@ def fallback_record(item):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     program_soup = get_soup(session, PROGRAM_URL)
     archive_soup = get_soup(session, ARCHIVE_URL)
@@ -3,10 +3,10 @@ from datetime import date
 from html import unescape
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup, Tag
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.dvorak-symphony-orchestra.com'
@@ -197,7 +197,7 @@ def extract_concerts_from_program(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
 
     concerts = []
@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 from html import unescape
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.ebcz.eu/'
@@ -106,7 +106,7 @@ def extract_concert(node):
 
 
 def get_concerts():
-    response = requests.get(BASE_URL, headers=HEADERS, timeout=30)
+    response = http.get(BASE_URL, headers=HEADERS, timeout=30)
     response.raise_for_status()
     # The server omits a charset and requests otherwise assumes ISO-8859-1.
     response.encoding = 'utf-8'
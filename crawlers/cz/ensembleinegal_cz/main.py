@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.ensembleinegal.cz'
@@ -163,7 +164,7 @@ def extract_concert(card, session, nonce):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     response = session.get(CONCERTS_URL, timeout=30)
     response.raise_for_status()
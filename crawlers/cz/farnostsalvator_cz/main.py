@@ -3,10 +3,10 @@ from datetime import date
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.farnostsalvator.cz'
@@ -251,7 +251,7 @@ def discover_article_links(session):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     concerts = []
 
     for link in discover_article_links(session):
@@ -3,12 +3,12 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from observability import log_message
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.fhk.cz/'
@@ -142,7 +142,7 @@ def parse_event_page(html, url):
 
 
 def fetch_event(url):
-    response = requests.get(url, timeout=30)
+    response = http.get(url, timeout=30)
     response.raise_for_status()
     return parse_event_page(response.text, url)
 
@@ -158,7 +158,7 @@ class FhkCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        with requests.Session() as session:
+        with http.create_session() as session:
             urls = discover_event_urls(session)
 
         records = []
@@ -2,10 +2,10 @@ import re
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://firkusny.cz'
@@ -159,7 +159,7 @@ class FirkusnyCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         concerts = []
 
         for link in find_concert_links(session):
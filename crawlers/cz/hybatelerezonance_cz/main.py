@@ -2,10 +2,10 @@ import re
 from html import unescape
 from urllib.parse import urldefrag, urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.klavirnirecitaly.cz'
@@ -229,7 +229,7 @@ def extract_concert(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
 
     concerts = []
@@ -3,10 +3,10 @@ import re
 from datetime import datetime
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -85,7 +85,7 @@ def canonical_url(url):
 
 
 def fetch(url):
-    response = requests.get(url, headers=HEADERS, timeout=30)
+    response = http.get(url, headers=HEADERS, timeout=30)
     response.raise_for_status()
     return response
 
@@ -2,10 +2,10 @@ import re
 from datetime import date
 from html import unescape
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://liedercompany.cz'
@@ -140,7 +140,7 @@ def fetch_events(session):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
 
     concerts = []
@@ -3,10 +3,10 @@ import re
 from datetime import date, datetime
 from html import unescape
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.mfo.cz/'
@@ -165,7 +165,7 @@ def fetch_events(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
 
     pages = [PROGRAM_URL]
@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.ndm.cz'
@@ -169,7 +170,7 @@ def extract_detail(session, url, fallback_description, fallback_venue):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     response = session.get(PROGRAM_URL, timeout=30)
     response.raise_for_status()
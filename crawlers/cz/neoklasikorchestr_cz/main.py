@@ -2,10 +2,10 @@ import html
 import re
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://neoklasikorchestr.cz'
@@ -260,7 +260,7 @@ def extract_concert(page):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     pages = fetch_pages(session)
     concerts = []
 
@@ -6,6 +6,7 @@ import urllib3
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -178,7 +179,7 @@ def extract_detail_description(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
 
     soup = get_soup(session, LISTING_URL)
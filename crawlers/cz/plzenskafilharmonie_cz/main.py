@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -117,7 +118,7 @@ def extract_listing(html):
 
 
 def extract_detail(url, fallback):
-    response = requests.get(url, headers=HEADERS, timeout=30)
+    response = http.get(url, headers=HEADERS, timeout=30)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, 'html.parser')
 
@@ -153,7 +154,7 @@ def extract_detail(url, fallback):
 
 
 def get_concerts():
-    response = requests.get(PROGRAM_URL, headers=HEADERS, timeout=30)
+    response = http.get(PROGRAM_URL, headers=HEADERS, timeout=30)
     response.raise_for_status()
     concerts = extract_listing(response.text)
 
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -150,7 +151,7 @@ def extract_concert(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     concert_links = discover_event_links(session)
     concerts = []
 
@@ -3,10 +3,10 @@ from datetime import date, datetime
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://praha.charita.cz'
@@ -139,7 +139,7 @@ def parse_event(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     concerts = []
 
@@ -6,6 +6,8 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
+from ...structured import fetch_tribe_events
 from observability import log_message
 
 
@@ -109,24 +111,7 @@ def event_type(event):
 
 
 def fetch_events(session):
-    events = []
-    page = 1
-
-    while True:
-        response = session.get(
-            EVENTS_API_URL,
-            params={'per_page': 50, 'page': page},
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
-        events.extend(data.get('events', []))
-
-        total_pages = int(data.get('total_pages') or 1)
-        if page >= total_pages:
-            break
-        page += 1
-
+    events = fetch_tribe_events(EVENTS_API_URL, session=session)
     return [event for event in events if is_school_concert(event)]
 
 
@@ -206,7 +191,7 @@ def parse_event(session, event):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
 
     concerts = []
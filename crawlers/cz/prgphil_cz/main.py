@@ -1,9 +1,9 @@
 import re
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 def parse_date(date_str):
@@ -69,7 +69,7 @@ def extract_concert(card):
 
 
 def get_concerts():
-    r = requests.get('https://www.prgphil.cz/koncerty-a-vstupenky')
+    r = http.get('https://www.prgphil.cz/koncerty-a-vstupenky')
     soup = BeautifulSoup(r.content, 'html.parser')
 
     cards = soup.select('div.vypis-ko-koncert')
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -132,7 +133,7 @@ def listing_records(session, year):
 
 
 def detail_description(url):
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     soup = get_soup(session, url)
     sections = soup.select('.single-event-program, .single-event-interprets')
@@ -186,7 +187,7 @@ class ShfCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         records = []
         for year in archive_years(session):
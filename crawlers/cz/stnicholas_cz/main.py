@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -210,7 +211,7 @@ def extract_concert(session, url, listing_text):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     links = find_event_links(session)
     concerts = []
 
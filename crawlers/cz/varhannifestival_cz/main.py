@@ -2,10 +2,10 @@ import re
 from html import unescape
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 
 BASE_URL = 'https://www.varhannifestival.cz'
@@ -136,7 +136,7 @@ def extract_concerts(soup):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     soup = get_soup(session, BASE_URL)
     return extract_concerts(soup)
 
@@ -0,0 +1,418 @@
+"""Shared multilingual date and time parsing for crawlers.
+
+Month and weekday names, list words ("a", "und", "et") and range words
+("až", "bis", "au") are kept per language and compiled once per process
+into a few regular expressions.  Dates are read in the forms event pages
+use:
+
+    19. 6. 2015, 19.06.15, 2015-06-19, 19/06/2015
+    19. júna 2026, 19 juin 2026, 19 de junio de 2026, June 19, 2026
+    2026. június 19.
+
+and lists and ranges expand to every date they name:
+
+    19. & 20.6.2015              -> 2015-06-19, 2015-06-20
+    Sa 19. – Mo 21. Juni 2026    -> 2026-06-19, 2026-06-20, 2026-06-21
+    30.12.2026 - 2.1.2027        -> 2026-12-30 ... 2027-01-02
+
+A date without a year takes the year of the date it is listed or ranged
+with, otherwise the next occurrence that is not more than ``PAST_DAYS``
+before today.  Results are memoized, so pages that repeat the same date
+strings parse each one once.
+
+    parse_date('So 21. júna o 19.00 hod.', 'sk')
+    parse_datetime('Sa., 20.6.2026, 19:30 Uhr', 'de', 'Europe/Vienna')
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import cache, lru_cache
+import re
+import unicodedata
+from zoneinfo import ZoneInfo
+
+
+PAST_DAYS = 90
+MAX_RANGE_DAYS = 62
+CACHE_SIZE = 8192
+LANGUAGE_ALIASES = {'cz': 'cs', 'nb': 'no'}
+
+_MONTH_NAMES = {
+    'sk': [
+        ('január', 'januára', 'jan'), ('február', 'februára', 'feb'), ('marec', 'marca', 'mar'),
+        ('apríl', 'apríla', 'apr'), ('máj', 'mája'), ('jún', 'júna'), ('júl', 'júla'),
+        ('august', 'augusta', 'aug'), ('september', 'septembra', 'sep', 'sept'),
+        ('október', 'októbra', 'okt'), ('november', 'novembra', 'nov'), ('december', 'decembra', 'dec'),
+    ],
+    'cs': [
+        ('leden', 'ledna'), ('únor', 'února'), ('březen', 'března'), ('duben', 'dubna'),
+        ('květen', 'května'), ('červen', 'června'), ('červenec', 'července'), ('srpen', 'srpna'),
+        ('září',), ('říjen', 'října'), ('listopad', 'listopadu'), ('prosinec', 'prosince'),
+    ],
+    'de': [
+        ('januar', 'jänner', 'jan', 'jän'), ('februar', 'feber', 'feb'), ('märz', 'maerz', 'mär', 'mrz'),
+        ('april', 'apr'), ('mai',), ('juni', 'jun'), ('juli', 'jul'), ('august', 'aug'),
+        ('september', 'sep', 'sept'), ('oktober', 'okt'), ('november', 'nov'), ('dezember', 'dez'),
+    ],
+    'fr': [
+        ('janvier', 'janv'), ('février', 'févr', 'fév'), ('mars',), ('avril', 'avr'), ('mai',),
+        ('juin',), ('juillet', 'juil'), ('août',), ('septembre', 'sept'), ('octobre', 'oct'),
+        ('novembre', 'nov'), ('décembre', 'déc'),
+    ],
+    'it': [
+        ('gennaio', 'gen'), ('febbraio', 'feb'), ('marzo', 'mar'), ('aprile', 'apr'), ('maggio', 'mag'),
+        ('giugno', 'giu'), ('luglio', 'lug'), ('agosto', 'ago'), ('settembre', 'set'),
+        ('ottobre', 'ott'), ('novembre', 'nov'), ('dicembre', 'dic'),
+    ],
+    'no': [
+        ('januar', 'jan'), ('februar', 'feb'), ('mars', 'mar'), ('april', 'apr'), ('mai',),
+        ('juni', 'jun'), ('juli', 'jul'), ('august', 'aug'), ('september', 'sep', 'sept'),
+        ('oktober', 'okt'), ('november', 'nov'), ('desember', 'des'),
+    ],
+    'en': [
+        ('january', 'jan'), ('february', 'feb'), ('march', 'mar'), ('april', 'apr'), ('may',),
+        ('june', 'jun'), ('july', 'jul'), ('august', 'aug'), ('september', 'sep', 'sept'),
+        ('october', 'oct'), ('november', 'nov'), ('december', 'dec'),
+    ],
+    'hu': [
+        ('január', 'jan'), ('február', 'febr'), ('március', 'márc'), ('április', 'ápr'),
+        ('május', 'máj'), ('június', 'jún'), ('július', 'júl'), ('augusztus', 'aug'),
+        ('szeptember', 'szept'), ('október', 'okt'), ('november', 'nov'), ('december', 'dec'),
+    ],
+    'pl': [
+        ('styczeń', 'stycznia'), ('luty', 'lutego'), ('marzec', 'marca'), ('kwiecień', 'kwietnia'),
+        ('maj', 'maja'), ('czerwiec', 'czerwca'), ('lipiec', 'lipca'), ('sierpień', 'sierpnia'),
+        ('wrzesień', 'września'), ('październik', 'października'), ('listopad', 'listopada'),
+        ('grudzień', 'grudnia'),
+    ],
+    'es': [
+        ('enero', 'ene'), ('febrero', 'feb'), ('marzo', 'mar'), ('abril', 'abr'), ('mayo', 'may'),
+        ('junio', 'jun'), ('julio', 'jul'), ('agosto', 'ago'), ('septiembre', 'setiembre', 'sep', 'sept'),
+        ('octubre', 'oct'), ('noviembre', 'nov'), ('diciembre', 'dic'),
+    ],
+}
+
+_WEEKDAY_NAMES = {
+    'sk': [
+        ('pondelok', 'po'), ('utorok', 'ut'), ('streda', 'stredu', 'st'), ('štvrtok', 'št'),
+        ('piatok', 'pi'), ('sobota', 'sobotu', 'so'), ('nedeľa', 'nedeľu', 'ne'),
+    ],
+    'cs': [
+        ('pondělí', 'po'), ('úterý', 'út'), ('středa', 'středu', 'st'), ('čtvrtek', 'čt'),
+        ('pátek', 'pá'), ('sobota', 'sobotu', 'so'), ('neděle', 'neděli', 'ne'),
+    ],
+    'de': [
+        ('montag', 'mo'), ('dienstag', 'di'), ('mittwoch', 'mi'), ('donnerstag', 'do'),
+        ('freitag', 'fr'), ('samstag', 'sonnabend', 'sa'), ('sonntag', 'so'),
+    ],
+    'fr': [
+        ('lundi', 'lun'), ('mardi', 'mar'), ('mercredi', 'mer'), ('jeudi', 'jeu'),
+        ('vendredi', 'ven'), ('samedi', 'sam'), ('dimanche', 'dim'),
+    ],
+    'it': [
+        ('lunedì', 'lun'), ('martedì', 'mar'), ('mercoledì', 'mer'), ('giovedì', 'gio'),
+        ('venerdì', 'ven'), ('sabato', 'sab'), ('domenica', 'dom'),
+    ],
+    'no': [
+        ('mandag', 'man'), ('tirsdag', 'tir'), ('onsdag', 'ons'), ('torsdag', 'tor'),
+        ('fredag', 'fre'), ('lørdag', 'lør'), ('søndag', 'søn'),
+    ],
+    'en': [
+        ('monday', 'mon'), ('tuesday', 'tue', 'tues'), ('wednesday', 'wed'),
+        ('thursday', 'thu', 'thur', 'thurs'), ('friday', 'fri'), ('saturday', 'sat'), ('sunday', 'sun'),
+    ],
+    'hu': [
+        ('hétfő',), ('kedd',), ('szerda', 'sze'), ('csütörtök', 'cs'), ('péntek',),
+        ('szombat', 'szo'), ('vasárnap',),
+    ],
+    'pl': [
+        ('poniedziałek', 'pon'), ('wtorek', 'wt'), ('środa', 'śr'), ('czwartek', 'czw'),
+        ('piątek', 'pt'), ('sobota', 'sob'), ('niedziela', 'niedz', 'nd'),
+    ],
+    'es': [
+        ('lunes', 'lun'), ('martes', 'mar'), ('miércoles', 'mié'), ('jueves', 'jue'),
+        ('viernes', 'vie'), ('sábado', 'sáb'), ('domingo', 'dom'),
+    ],
+}
+
+_LIST_WORDS = {
+    'sk': ('a',), 'cs': ('a',), 'de': ('und',), 'fr': ('et',), 'it': ('e',),
+    'no': ('og',), 'en': ('and',), 'hu': ('és',), 'pl': ('i',), 'es': ('y',),
+}
+_RANGE_WORDS = {
+    'sk': ('až', 'do'), 'cs': ('až', 'do'), 'de': ('bis',), 'fr': ('au',), 'it': ('al',),
+    'no': ('til',), 'en': ('to', 'through', 'until'), 'hu': (), 'pl': ('do',), 'es': ('al',),
+}
+# Languages that also write the month before the day ("June 19", "június 19.").
+_MONTH_FIRST = {'en', 'hu'}
+_MONTH_JOINERS = {'es': 'de'}
+
+LANGUAGES = tuple(_MONTH_NAMES)
+
+_SPACES = str.maketrans({'\xa0': ' ', '\u2009': ' ', '\u202f': ' ', '\u200b': ''})
+_DASHES = re.compile('[\u2010-\u2015\u2212]')
+_ORDINAL = r'(?:st|nd|rd|th|er|º|°)?'
+_DAY = r'(?<![\d.:/])(?P<{}>\d{{1,2}})' + _ORDINAL
+
+_CLOCK_RE = re.compile(r'(?<![\d:.])(?P<hour>\d{1,2}):(?P<minute>\d{2})(?!\d)(?:\s*(?P<meridiem>[ap])\.?\s?m\b\.?)?')
+_HOUR_H_RE = re.compile(r'(?<![\d:.])(?P<hour>\d{1,2})\s?h\s?(?P<minute>\d{2})(?!\d)')
+_SUFFIX_RE = re.compile(
+    r'(?<![\d:.])(?P<hour>\d{1,2})(?:\s*\.\s*(?P<minute>\d{2}))?\s*'
+    r'(?:(?P<meridiem>[ap])\.?\s?m\b\.?|uhr\b|hod\b|hodin\b|h\b|hrs?\b|órakor\b|óra\b)'
+)
+_PREFIX_RE = re.compile(
+    r'\b(?:um|ab|kl|ore|alle|godz|o|od|à|a las)\.?\s*(?P<hour>\d{1,2})(?:[.:](?P<minute>\d{2}))?(?!\d|[.:]\d)'
+)
+_DOTTED_RE = re.compile(r'(?<![\d:.])(?P<hour>\d{1,2})\.(?P<minute>\d{2})(?!\d|\.\d)')
+_TIME_PATTERNS = (_CLOCK_RE, _HOUR_H_RE, _SUFFIX_RE, _PREFIX_RE, _DOTTED_RE)
+
+
+def _without_accents(text: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(character for character in decomposed if not unicodedata.combining(character))
+
+
+def _alternation(words) -> str:
+    return '|'.join(re.escape(word) for word in sorted(set(words), key=len, reverse=True))
+
+
+@dataclass(frozen=True)
+class _Grammar:
+    months: dict[str, int]
+    date_re: re.Pattern
+    weekday_re: re.Pattern
+    prefix_re: re.Pattern
+    prefix_day_re: re.Pattern
+    more_day_re: re.Pattern
+    connector_re: re.Pattern
+    range_words: frozenset[str]
+
+
+@cache
+def _grammar(lang: str) -> _Grammar:
+    lang = LANGUAGE_ALIASES.get(lang, lang)
+    if lang not in _MONTH_NAMES:
+        raise ValueError(f'unsupported date language {lang!r}, expected one of {", ".join(LANGUAGES)}')
+    months = {}
+    for number, names in enumerate(_MONTH_NAMES[lang], start=1):
+        for name in names:
+            months[name] = months[_without_accents(name)] = number
+    weekdays = {
+        variant
+        for names in _WEEKDAY_NAMES[lang] for name in names
+        for variant in (name, _without_accents(name))
+    } - set(months)
+
+    month = rf'(?P<{{}}>{_alternation(months)})\b\.?'
+    joiner = rf'\s+{_MONTH_JOINERS[lang]}' if lang in _MONTH_JOINERS else ''
+    range_words = ('-', *_RANGE_WORDS[lang])
+    connector = '|'.join(
+        [r'-', r',', r'&', r'\+']
+        + [rf'\b{re.escape(word)}\b' for word in (*_RANGE_WORDS[lang], *_LIST_WORDS[lang])]
+    )
+    forms = [
+        r'(?<!\d)(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})(?!\d)',
+        _DAY.format('num_day') + r'\.\s*(?P<num_month>\d{1,2})\.(?P<num_year>\s*\d{4}|\d{2})?(?!\d|[:.]\d)',
+        _DAY.format('slash_day') + r'/(?P<slash_month>\d{1,2})/(?P<slash_year>\d{4})(?!\d)',
+        _DAY.format('name_day') + rf'\.?,?{joiner}\s*' + month.format('name_month')
+        + rf'(?:,?{joiner}\s+(?P<name_year>\d{{4}})(?!\d))?',
+    ]
+    if lang in _MONTH_FIRST:
+        forms.append(
+            r'(?:(?<!\d)(?P<first_year>\d{4})\.?\s+)?' + month.format('first_month') + r'\s*'
+            + _DAY.format('first_day') + r'\.?'
+            + rf'(?P<first_more>(?:\s*(?:{connector})\s*\d{{1,2}}(?!\d|[.:]\d){_ORDINAL}\.?)*)'
+            + r'(?:,?\s+(?P<first_trailing_year>\d{4})(?!\d))?'
+        )
+    prefix_day = rf'(?<![\d.:/])(\d{{1,2}}){_ORDINAL}\.?\s*({connector})\s*'
+    return _Grammar(
+        months=months,
+        date_re=re.compile('|'.join(f'(?:{form})' for form in forms)),
+        weekday_re=re.compile(rf'\b(?:{_alternation(weekdays)})\b\.?,?'),
+        prefix_re=re.compile(rf'(?:(?<![\d.:/])\d{{1,2}}{_ORDINAL}\.?\s*(?:{connector})\s*)+$'),
+        prefix_day_re=re.compile(prefix_day),
+        more_day_re=re.compile(rf'\s*({connector})\s*(\d{{1,2}})(?!\d|[.:]\d)'),
+        connector_re=re.compile(rf'\s*({connector})\s*'),
+        range_words=frozenset(range_words),
+    )
+
+
+@dataclass
+class _Anchor:
+    start: int
+    end: int
+    days: list[int]
+    connectors: list[str]
+    month: int
+    year: int | None
+    # Index of the day written next to the month; earlier days were listed
+    # before it ("19. & 20.6.") and may belong to the previous month.
+    own_day: int = 0
+    link: str | None = None
+
+
+def _year(value: str | None) -> int | None:
+    if value is None:
+        return None
+    year = int(value.strip())
+    return year + 2000 if year < 100 else year
+
+
+def _anchor(match: re.Match, grammar: _Grammar) -> _Anchor:
+    groups = match.groupdict()
+    if groups['iso_day']:
+        day, month, year = groups['iso_day'], int(groups['iso_month']), groups['iso_year']
+    elif groups['num_day']:
+        day, month, year = groups['num_day'], int(groups['num_month']), groups['num_year']
+    elif groups['slash_day']:
+        day, month, year = groups['slash_day'], int(groups['slash_month']), groups['slash_year']
+    elif groups['name_day']:
+        day, month, year = groups['name_day'], grammar.months[groups['name_month']], groups['name_year']
+    else:
+        day, month = groups['first_day'], grammar.months[groups['first_month']]
+        year = groups['first_year'] or groups['first_trailing_year']
+    anchor = _Anchor(match.start(), match.end(), [int(day)], [], month, _year(year))
+    for connector, more_day in grammar.more_day_re.findall(groups.get('first_more') or ''):
+        anchor.connectors.append(connector.strip())
+        anchor.days.append(int(more_day))
+    return anchor
+
+
+def _expand(items: list[date], connectors: list[str], range_words: frozenset[str]) -> list[date]:
+    dates = items[:1]
+    for connector, item in zip(connectors, items[1:]):
+        start = dates[-1]
+        span = (item - start).days
+        if connector in range_words and 1 < span <= MAX_RANGE_DAYS:
+            dates.extend(start + timedelta(days=offset) for offset in range(1, span))
+        dates.append(item)
+    return dates
+
+
+def _infer_year(month: int, day: int, reference: date) -> int:
+    try:
+        candidate = date(reference.year, month, day)
+    except ValueError:
+        return reference.year
+    return reference.year + 1 if candidate < reference - timedelta(days=PAST_DAYS) else reference.year
+
+
+def _scan(text: str, lang: str, reference: date) -> tuple[tuple[date, ...], str]:
+    """Return the dates in ``text`` and the text with those dates blanked."""
+    grammar = _grammar(lang)
+    text = _DASHES.sub('-', text.translate(_SPACES).casefold())
+    text = grammar.weekday_re.sub(lambda match: ' ' * len(match.group()), text)
+
+    anchors = []
+    previous_end = 0
+    for match in grammar.date_re.finditer(text):
+        anchor = _anchor(match, grammar)
+        segment = text[previous_end:anchor.start]
+        prefix = grammar.prefix_re.search(segment)
+        if prefix:
+            pairs = grammar.prefix_day_re.findall(prefix.group())
+            anchor.days[:0] = [int(day) for day, _connector in pairs]
+            anchor.connectors[:0] = [connector.strip() for _day, connector in pairs]
+            anchor.own_day = len(pairs)
+            anchor.start = previous_end + prefix.start()
+            segment = segment[:prefix.start()]
+        if anchors:
+            link = grammar.connector_re.fullmatch(segment)
+            anchor.link = link.group(1) if link else None
+        anchors.append(anchor)
+        previous_end = match.end()
+
+    for anchor, following in zip(reversed(anchors), [None, *reversed(anchors)]):
+        if anchor.year is not None:
+            continue
+        if following is not None and following.link and following.year is not None:
+            anchor.year = following.year
+            if (anchor.month, anchor.days[anchor.own_day]) > (following.month, following.days[0]):
+                anchor.year -= 1
+        else:
+            anchor.year = _infer_year(anchor.month, anchor.days[anchor.own_day], reference)
+
+    dates = []
+    blanked = list(text)
+    for anchor in anchors:
+        items = []
+        try:
+            for index, day in enumerate(anchor.days):
+                month, year = anchor.month, anchor.year
+                if index < anchor.own_day and day > anchor.days[anchor.own_day]:
+                    # "30. - 2. 7.": the listed days start in the previous month.
+                    month, year = (12, year - 1) if month == 1 else (month - 1, year)
+                items.append(date(year, month, day))
+        except ValueError:
+            continue
+        expanded = _expand(items, anchor.connectors, grammar.range_words)
+        if anchor.link and dates:
+            dates.extend(_expand([dates[-1], expanded[0]], [anchor.link], grammar.range_words)[1:-1])
+        dates.extend(expanded)
+        blanked[anchor.start:anchor.end] = ' ' * (anchor.end - anchor.start)
+    return tuple(dict.fromkeys(dates)), ''.join(blanked)
+
+
+def _time(text: str) -> time | None:
+    for pattern in _TIME_PATTERNS:
+        for match in pattern.finditer(text):
+            hour, minute = int(match['hour']), int(match['minute'] or 0)
+            meridiem = match.groupdict().get('meridiem')
+            if meridiem and hour <= 12:
+                hour = hour % 12 + (12 if meridiem == 'p' else 0)
+            if hour < 24 and minute < 60:
+                return time(hour, minute)
+    return None
+
+
+def _parse_uncached(text: str, lang: str, reference: date) -> tuple[tuple[date, ...], time | None]:
+    dates, remainder = _scan(text, lang, reference)
+    return dates, _time(remainder)
+
+
+_parse = lru_cache(maxsize=CACHE_SIZE)(_parse_uncached)
+
+
+def parse_dates(text: str, lang: str, *, reference: date | None = None) -> tuple[date, ...]:
+    """Every date named in ``text``, with lists and ranges expanded."""
+    return _parse(text, lang, reference or date.today())[0]
+
+
+def parse_date(text: str, lang: str, *, reference: date | None = None) -> date | None:
+    dates = parse_dates(text, lang, reference=reference)
+    return dates[0] if dates else None
+
+
+def parse_time(text: str, lang: str) -> time | None:
+    """The first clock time in ``text`` that is not part of a date."""
+    return _parse(text, lang, date.today())[1]
+
+
+def parse_datetime(
+    text: str,
+    lang: str,
+    tz: str | None = None,
+    *,
+    reference: date | None = None,
+) -> datetime | None:
+    """The first date in ``text`` at its first time, midnight if none is given.
+
+    With ``tz`` (an IANA name such as ``'Europe/Bratislava'``) the result is
+    timezone-aware.
+    """
+    dates, event_time = _parse(text, lang, reference or date.today())
+    if not dates:
+        return None
+    return datetime.combine(dates[0], event_time or time(), tzinfo=ZoneInfo(tz) if tz else None)
+
+
+def month_number(name: str, lang: str) -> int | None:
+    return _grammar(lang).months.get(name.strip(' .,').casefold())
+
+
+def cache_info():
+    return _parse.cache_info()
+
+
+def clear_cache() -> None:
+    _parse.cache_clear()
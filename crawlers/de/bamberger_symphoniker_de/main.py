@@ -6,6 +6,7 @@ from zoneinfo import ZoneInfo
 import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -28,7 +29,7 @@ HEADERS = {
 
 
 def fetch_month(year, month):
-    response = requests.get(
+    response = http.get(
         CALENDAR_URL,
         params={
             'type': '42534537567',
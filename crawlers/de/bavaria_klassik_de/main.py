@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -58,7 +59,7 @@ def request_page(url, params, position):
     last_error = None
     for _attempt in range(3):
         try:
-            response = requests.post(
+            response = http.post(
                 url,
                 params=params,
                 data=data,
@@ -127,7 +128,7 @@ def known_city(venue):
 
 
 def detail_location(url):
-    response = requests.get(url, headers=HEADERS, timeout=45)
+    response = http.get(url, headers=HEADERS, timeout=45)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, 'html.parser')
     for script in soup.select('script[type="application/ld+json"]'):
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -267,7 +268,7 @@ def records_from_page(session, page, fetch_details=False):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     current = get_page(session, 'alle-konzerte')
     archive = get_page(session, 'konzertarchiv')
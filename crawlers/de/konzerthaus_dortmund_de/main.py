@@ -10,6 +10,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -43,7 +44,7 @@ def get_html(session, url):
 
 
 def make_session():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     retries = Retry(
         total=3,
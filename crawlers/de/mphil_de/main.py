@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -139,7 +139,7 @@ def parse_item(item):
 
 
 def get_concerts():
-    response = requests.get(CALENDAR_URL, headers=HEADERS, timeout=45)
+    response = http.get(CALENDAR_URL, headers=HEADERS, timeout=45)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, 'html.parser')
     records = []
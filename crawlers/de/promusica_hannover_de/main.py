@@ -1,9 +1,9 @@
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -104,7 +104,7 @@ def make_record(event):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = fetch_events(session)
     records = []
@@ -4,6 +4,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -74,7 +75,7 @@ def make_record(event):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     url = EVENTS_API
     # An early date makes the API return its still-published archive as well
@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -127,7 +128,7 @@ def parse_program(soup):
 
 
 def get_concerts():
-    response = requests.get(PROGRAM_URL, headers=HEADERS, timeout=30)
+    response = http.get(PROGRAM_URL, headers=HEADERS, timeout=30)
     try:
         response.raise_for_status()
     except requests.RequestException as error:
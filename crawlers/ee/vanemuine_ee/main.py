@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -139,7 +140,7 @@ def get_page(session, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     listing_html = get_page(session, PROGRAM_URL)
     records = parse_listing(BeautifulSoup(listing_html, 'html.parser'))
@@ -9,6 +9,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -131,7 +132,7 @@ def make_records(production, detail):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     productions = list((get_json(session, PROGRAMME_API).get('productions') or {}).values())
     details = {}
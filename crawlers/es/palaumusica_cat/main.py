@@ -1,10 +1,10 @@
 import re
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -127,7 +127,7 @@ def make_record(session, production, stage):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     response = session.get(
         API_URL,
@@ -0,0 +1,251 @@
+"""Run crawler modules in parallel, one isolated child process per crawler.
+
+A bounded number of crawlers run at once.  Each crawler is imported and run
+in its own process, so a crash, a hung request or leaked memory only affects
+that crawler.  Crawlers that exceed their time limit are terminated.
+
+The processes are forked from a ``zygote.Zygote`` that has already imported
+the crawlers' heavy dependencies, so a crawler process starts almost as
+cheaply as a function call.  After ``CRAWLER_RUNS_PER_WORKER`` crawlers the
+zygote is replaced by a fresh one, so module state it holds never grows
+stale over a long-running scheduler.  Every result carries the child's peak
+RSS.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+import importlib
+import logging
+from multiprocessing.connection import wait
+import os
+import signal
+import time
+from typing import Callable, Iterable, Literal
+
+from .zygote import Zygote
+
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT_SECONDS = 30 * 60
+DEFAULT_RUNS_PER_WORKER = 100
+TERMINATE_GRACE_SECONDS = 10
+
+CrawlerStatus = Literal['succeeded', 'failed', 'timed_out']
+logger = logging.getLogger(__name__)
+
+
+def _positive_number(name: str, default: float) -> float:
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    try:
+        parsed = float(value)
+    except ValueError as error:
+        raise ValueError(f'{name} must be a number, got {value!r}') from error
+    if parsed <= 0:
+        raise ValueError(f'{name} must be positive, got {value!r}')
+    return parsed
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    max_workers: int = DEFAULT_MAX_WORKERS
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+    runs_per_worker: int = DEFAULT_RUNS_PER_WORKER
+    preload: bool = True
+
+    @classmethod
+    def from_environment(cls) -> 'ExecutorConfig':
+        return cls(
+            max_workers=int(_positive_number('CRAWLER_WORKERS', DEFAULT_MAX_WORKERS)),
+            timeout_seconds=_positive_number('CRAWLER_TIMEOUT_SECONDS', DEFAULT_TIMEOUT_SECONDS),
+            runs_per_worker=int(_positive_number('CRAWLER_RUNS_PER_WORKER', DEFAULT_RUNS_PER_WORKER)),
+            preload=os.getenv('CRAWLER_PRELOAD', '1').strip().lower() not in ('0', 'false', 'no'),
+        )
+
+
+@dataclass(frozen=True)
+class CrawlerResult:
+    module: str
+    status: CrawlerStatus
+    exit_code: int | None
+    elapsed_seconds: float
+    peak_rss_bytes: int | None = None
+
+
+def run_crawler_module(module_path: str) -> None:
+    """Child process entry point: import a crawler module and run its main()."""
+    try:
+        importlib.import_module(module_path).main()
+    except Exception:
+        logger.exception(
+            'Crawler process failed',
+            extra={'event': 'crawler_process_failed', 'crawler_module': module_path},
+        )
+        raise SystemExit(1)
+
+
+@dataclass
+class _RunningCrawler:
+    index: int
+    module: str
+    zygote: Zygote
+    # Set once the zygote has forked the child, which may wait for its preload.
+    started: float | None = None
+    pid: int | None = None
+    terminated_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return 0.0 if self.started is None else time.monotonic() - self.started
+
+    def deadline(self, config: ExecutorConfig) -> float:
+        """Seconds until this crawler must be signalled next."""
+        if self.pid is None:
+            return config.timeout_seconds
+        if self.terminated_at is None:
+            return config.timeout_seconds - self.elapsed
+        return TERMINATE_GRACE_SECONDS - (time.monotonic() - self.terminated_at)
+
+    def signal(self, signum: int) -> None:
+        try:
+            os.kill(self.pid, signum)
+        except ProcessLookupError:
+            pass
+
+
+class _ZygotePool:
+    """The current zygote, replaced after ``runs_per_worker`` forks."""
+
+    def __init__(self, config: ExecutorConfig):
+        self.config = config
+        self.current: Zygote | None = None
+        self.zygotes: list[Zygote] = []
+
+    def zygote(self) -> Zygote:
+        if self.current is not None and not self.current.process.is_alive():
+            self.current = None
+        if self.current is not None and self.current.run_count >= self.config.runs_per_worker:
+            # It exits on its own once its running children have finished.
+            self.current.stop()
+            self.current = None
+        if self.current is None:
+            if self.config.preload:
+                self.current = Zygote()
+            else:
+                self.current = Zygote(modules=(), warm_up=())
+            self.zygotes.append(self.current)
+        return self.current
+
+    def discard(self, zygote: Zygote) -> None:
+        """Stop handing out a zygote that died."""
+        if self.current is zygote:
+            self.current = None
+
+    def close(self) -> None:
+        for zygote in self.zygotes:
+            zygote.close()
+
+
+def _megabytes(byte_count: int | None) -> float | None:
+    return None if byte_count is None else round(byte_count / (1024 * 1024), 1)
+
+
+def run_crawlers(
+    modules: Iterable[str],
+    config: ExecutorConfig | None = None,
+    *,
+    target: Callable[[str], None] = run_crawler_module,
+) -> list[CrawlerResult]:
+    """Run every crawler module once and return the results in input order.
+
+    ``target`` runs in the child and must be importable by module name.
+    """
+    config = config or ExecutorConfig.from_environment()
+    modules = list(modules)
+    pending = deque(enumerate(modules))
+    running: dict[int, _RunningCrawler] = {}
+    results: list[CrawlerResult | None] = [None] * len(modules)
+    pool = _ZygotePool(config)
+
+    def finish(crawler: _RunningCrawler, exit_code: int | None, peak_rss_bytes: int | None) -> None:
+        if crawler.terminated_at is not None:
+            status = 'timed_out'
+        else:
+            status = 'succeeded' if exit_code == 0 else 'failed'
+        result = CrawlerResult(crawler.module, status, exit_code, round(crawler.elapsed, 3), peak_rss_bytes)
+        results[crawler.index] = result
+        logger.log(
+            logging.INFO if status == 'succeeded' else logging.ERROR,
+            'Crawler process finished',
+            extra={
+                'event': 'crawler_process_finished',
+                'crawler_module': crawler.module,
+                'status': status,
+                'exit_code': exit_code,
+                'elapsed_seconds': result.elapsed_seconds,
+                'peak_rss_mb': _megabytes(peak_rss_bytes),
+            },
+        )
+
+    try:
+        while pending or running:
+            while pending and len(running) < config.max_workers:
+                index, module = pending.popleft()
+                zygote = pool.zygote()
+                zygote.start(index, target, module)
+                running[index] = _RunningCrawler(index, module, zygote)
+
+            connections = {crawler.zygote.connection: crawler.zygote for crawler in running.values()}
+            next_deadline = min(crawler.deadline(config) for crawler in running.values())
+            for connection in wait(list(connections), timeout=max(next_deadline, 0)):
+                try:
+                    message = connections[connection].receive()
+                except EOFError:
+                    # The zygote died.  Its children were reparented and would
+                    # keep crawling unsupervised, so they are killed too, and
+                    # the next crawler gets a fresh zygote.
+                    pool.discard(connections[connection])
+                    for crawler in [crawler for crawler in running.values() if crawler.zygote.connection is connection]:
+                        if crawler.pid is not None:
+                            crawler.signal(signal.SIGKILL)
+                        del running[crawler.index]
+                        finish(crawler, None, None)
+                    continue
+                crawler = running.get(message[1])
+                if crawler is None:
+                    continue
+                if message[0] == 'started':
+                    crawler.pid = message[2]
+                    crawler.started = time.monotonic()
+                else:
+                    del running[crawler.index]
+                    finish(crawler, message[2], message[3])
+
+            for crawler in running.values():
+                if crawler.pid is None or crawler.deadline(config) > 0:
+                    continue
+                if crawler.terminated_at is None:
+                    crawler.signal(signal.SIGTERM)
+                    crawler.terminated_at = time.monotonic()
+                else:
+                    crawler.signal(signal.SIGKILL)
+    finally:
+        for crawler in running.values():
+            if crawler.pid is not None:
+                crawler.signal(signal.SIGKILL)
+        pool.close()
+
+    peaks = [result.peak_rss_bytes for result in results if result.peak_rss_bytes is not None]
+    logger.info(
+        'Crawler pass completed',
+        extra={
+            'event': 'crawler_pass_completed',
+            'crawler_count': len(results),
+            'succeeded_count': sum(result.status == 'succeeded' for result in results),
+            'failed_count': sum(result.status == 'failed' for result in results),
+            'timed_out_count': sum(result.status == 'timed_out' for result in results),
+            'max_peak_rss_mb': _megabytes(max(peaks, default=None)),
+        },
+    )
+    return results
@@ -1,9 +1,9 @@
+import csv
+from functools import cache
+from pathlib import Path
 import re
 
-import pandas as pd
-
-CITIES_WITH_POSTAL_CODE = pd.read_csv('data/cities_with_postal_code.csv', dtype={'postal_code': str})
-CITIES_BY_POPULATION = pd.read_csv('data/cities_by_population.csv', dtype={'postal_code': str})
+DATA_DIRECTORY = Path(__file__).resolve().parent.parent / 'data'
 SPECIAL_CITIES = {
 	'8': 'Bratislava',
 	'040': 'Košice',
@@ -85,9 +85,82 @@ def extract_postal_code(text):
     return None
 
 
+class CityMatcher:
+    """
+    Aho-Corasick automaton over city names.
+
+    find() returns the earliest listed name that occurs anywhere in the text,
+    like checking `name in text` for every name in order, but in a single pass
+    over the text.
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self._children = [{}]
+        self._fail = [0]
+        self._first = [len(self.names)]
+        for index, name in enumerate(self.names):
+            node = 0
+            for character in name:
+                child = self._children[node].get(character)
+                if child is None:
+                    child = len(self._children)
+                    self._children[node][character] = child
+                    self._children.append({})
+                    self._fail.append(0)
+                    self._first.append(len(self.names))
+                node = child
+            self._first[node] = min(self._first[node], index)
+
+        queue = list(self._children[0].values())
+        for node in queue:
+            for character, child in self._children[node].items():
+                fail = self._fail[node]
+                while fail and character not in self._children[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._children[fail].get(character, 0)
+                # A node also matches every name that ends in its fail node.
+                self._first[child] = min(self._first[child], self._first[self._fail[child]])
+                queue.append(child)
+
+    def find(self, text):
+        children, fail, first = self._children, self._fail, self._first
+        node = 0
+        best = len(self.names)
+        for character in text:
+            while node and character not in children[node]:
+                node = fail[node]
+            node = children[node].get(character, 0)
+            if first[node] < best:
+                best = first[node]
+        return self.names[best] if best < len(self.names) else None
+
+
+def _read_csv(name):
+    with open(DATA_DIRECTORY / name, newline='', encoding='utf-8') as csv_file:
+        return list(csv.DictReader(csv_file))
+
+
+@cache
+def cities_by_postal_code():
+    index = {}
+    for row in _read_csv('cities_with_postal_code.csv'):
+        index.setdefault(row['postal_code'], []).append(row['city'])
+    return index
+
+
+@cache
+def city_matcher():
+    """Matcher over cities_by_population.csv, most populous city first."""
+    return CityMatcher(row['city'] for row in _read_csv('cities_by_population.csv'))
+
+
 def extract_city(text):
     """
     Extract the city from a string using the postal code.
+
+    Without a postal code match, the most populous city whose name occurs
+    in the text is returned.  Both lookups are built on first use.
     
     Args:
         text (str): The text to search for city.
@@ -97,18 +170,14 @@ def extract_city(text):
     """
     postal_code = extract_postal_code(text)
     if postal_code:
-        potential_cities = CITIES_WITH_POSTAL_CODE[CITIES_WITH_POSTAL_CODE['postal_code'] == postal_code]['city'].values
-        for city in potential_cities:
+        for city in cities_by_postal_code().get(postal_code, ()):
             if city in text:
                 return city
         for key, value in SPECIAL_CITIES.items():
             if postal_code.startswith(key):
                 return value
-        
-    for city in CITIES_BY_POPULATION['city'].values:
-        if city in text:
-            return city
-    return None
+
+    return city_matcher().find(text)
 
 def clean_string(text):
     text = text.replace('\u200b', '')
@@ -3,10 +3,10 @@ import re
 from datetime import date
 from html import unescape
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -143,7 +143,7 @@ def make_records(event):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = get_events(session)
     records = []
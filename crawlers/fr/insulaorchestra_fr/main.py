@@ -9,6 +9,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -163,7 +164,7 @@ def detail_records(event, places):
     url = clean_text(event.get('link'))
     if not url or '/en/' in url:
         return []
-    response = requests.get(url, headers=HEADERS, timeout=45)
+    response = http.get(url, headers=HEADERS, timeout=45)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, 'html.parser')
     description = description_from_page(soup)
@@ -204,7 +205,7 @@ def detail_records(event, places):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = paginated_collection(session, EVENTS_API)
     places = place_lookup(paginated_collection(session, PLACES_API))
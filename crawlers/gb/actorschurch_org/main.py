@@ -7,6 +7,7 @@ from xml.etree import ElementTree
 import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -94,13 +95,13 @@ def make_record(event_url, payload):
 
 
 def fetch_record(event_url):
-    response = requests.get(page_data_url(event_url), headers=HEADERS, timeout=45)
+    response = http.get(page_data_url(event_url), headers=HEADERS, timeout=45)
     response.raise_for_status()
     return make_record(event_url, response.json())
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     urls = event_urls(session)
     records = []
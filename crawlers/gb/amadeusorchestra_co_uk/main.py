@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -88,7 +88,7 @@ def record_from_item(item):
 
 
 def get_concerts():
-    response = requests.get(CONCERTS_URL, headers=HEADERS, timeout=45)
+    response = http.get(CONCERTS_URL, headers=HEADERS, timeout=45)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, 'html.parser')
     records = []
@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -100,7 +101,7 @@ class ChamberConcertsOrgCrawler(BaseCrawler):
 
     def scrape(self):
         try:
-            response = requests.get(EVENTS_JSON_URL, headers=HEADERS, timeout=45)
+            response = http.get(EVENTS_JSON_URL, headers=HEADERS, timeout=45)
             response.raise_for_status()
             payload = response.json()
         except (requests.RequestException, ValueError) as error:
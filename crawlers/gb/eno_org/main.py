@@ -9,6 +9,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -36,7 +37,7 @@ def clean_text(value):
 
 
 def build_session():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     session.mount(
         'https://',
@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -163,7 +164,7 @@ def make_record(url, html):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     records = []
     for url in production_urls(session):
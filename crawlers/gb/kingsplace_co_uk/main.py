@@ -5,6 +5,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -126,7 +127,7 @@ def records_from_payloads(events, instances, plans):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = get_json(session, f'{API_URL}/events')
     instances = get_json(session, f'{API_URL}/instances')
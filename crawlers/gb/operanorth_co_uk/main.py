@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -83,7 +84,7 @@ def clean_text(value):
 
 
 def get_response(url):
-    response = requests.get(url, headers=HEADERS, timeout=45)
+    response = http.get(url, headers=HEADERS, timeout=45)
     response.raise_for_status()
     return response
 
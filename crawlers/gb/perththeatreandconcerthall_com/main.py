@@ -5,6 +5,7 @@ from datetime import datetime
 import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -103,7 +104,7 @@ def make_record(event, instance, venue):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     events = {event['id']: event for event in get_json(session, 'events') if event.get('id')}
     instances = get_json(session, 'instances')
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -67,7 +68,7 @@ def clean_text(value):
 
 
 def get_soup(url):
-    response = requests.get(url, headers=HEADERS, timeout=45)
+    response = http.get(url, headers=HEADERS, timeout=45)
     response.raise_for_status()
     return BeautifulSoup(response.text, 'html.parser')
 
@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 from urllib.parse import urlencode
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -181,7 +181,7 @@ def make_record(event):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(ALGOLIA_HEADERS)
     # Recursive windows avoid Algolia's 1,000-result pagination limit while
     # retaining the site's published archive as well as future performances.
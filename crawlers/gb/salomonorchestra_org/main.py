@@ -5,6 +5,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -120,7 +121,7 @@ def parse_section(lines):
 
 def get_concerts():
     try:
-        response = requests.get(CONCERTS_URL, headers=HEADERS, timeout=45)
+        response = http.get(CONCERTS_URL, headers=HEADERS, timeout=45)
         response.raise_for_status()
     except requests.RequestException as error:
         log_message(
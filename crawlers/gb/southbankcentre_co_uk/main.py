@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -169,7 +170,7 @@ def get_concerts():
     # filter remains available, so query individual dates concurrently to get
     # beyond the first listing page without dropping later performances.
     def scrape_day(day):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         return listing_cards(session, day, day)
 
@@ -0,0 +1,254 @@
+"""Shared HTTP client for crawlers.
+
+``create_session()`` is a drop-in replacement for ``requests.Session()`` and
+``get()`` for ``requests.get()``.  Sessions keep a keep-alive connection pool
+per host, apply default connect/read timeouts, retry idempotent requests with
+backoff on 429 and 5xx responses, and record request count, bytes and latency.
+Requests wait for the per-domain rate limits of ``crawlers.politeness`` and
+stop with ``budget.BudgetExceeded`` once the running crawler's budget is used.
+Inside ``replay.recording()`` their traffic is recorded or replayed.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from observability import log_message
+from . import budget, politeness, replay
+from .http_cache import CONDITIONAL_HEADERS, HttpCache, default_cache
+
+
+DEFAULT_TIMEOUT = (10, 45)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_POOL_SIZE = 16
+DEFAULT_CONCURRENCY = 8
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+@dataclass
+class HttpStats:
+    """Running totals of crawler HTTP traffic in this process."""
+
+    request_count: int = 0
+    bytes_received: int = 0
+    elapsed_seconds: float = 0.0
+    cache_hits: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, byte_count: int, elapsed_seconds: float, cache_hit: bool = False) -> None:
+        with self._lock:
+            self.request_count += 1
+            self.bytes_received += byte_count
+            self.elapsed_seconds += elapsed_seconds
+            self.cache_hits += cache_hit
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                'request_count': self.request_count,
+                'bytes_received': self.bytes_received,
+                'elapsed_seconds': round(self.elapsed_seconds, 3),
+                'cache_hits': self.cache_hits,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.request_count = 0
+            self.bytes_received = 0
+            self.elapsed_seconds = 0.0
+            self.cache_hits = 0
+
+
+stats = HttpStats()
+
+
+def _response_size(response: requests.Response) -> int:
+    # Revalidated responses only transferred a 304 header.  Reading a
+    # streamed body here would defeat streaming; fall back to the declared
+    # length for those responses.
+    if getattr(response, 'from_cache', False):
+        return 0
+    if getattr(response, '_content_consumed', True):
+        return len(response.content or b'')
+    try:
+        return int(response.headers.get('Content-Length', 0))
+    except ValueError:
+        return 0
+
+
+class CrawlerSession(requests.Session):
+    """``requests.Session`` with crawler timeouts, retries and accounting.
+
+    When the on-disk HTTP cache is enabled (``CRAWLER_HTTP_CACHE``), GET
+    requests are revalidated against stored ETag/Last-Modified validators.
+    Every request that reaches the network, redirect hops included, first
+    waits for its domain's slot in the shared rate limiter.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache: HttpCache | None = None,
+        use_cache: bool = True,
+        limiter: politeness.DomainRateLimiter | None = None,
+        rate_limit: bool = True,
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.cache = (cache or default_cache()) if use_cache else None
+        self.limiter = (limiter or politeness.default_limiter()) if rate_limit else None
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        budget.check()
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        started = time.perf_counter()
+        response = super().request(method, url, *args, **kwargs)
+        elapsed = time.perf_counter() - started
+        byte_count = _response_size(response)
+        cache_hit = getattr(response, 'from_cache', False)
+        stats.record(byte_count, elapsed, cache_hit)
+        log_message(
+            'HTTP request completed',
+            event='crawler_http_request',
+            method=method,
+            url=url,
+            status_code=response.status_code,
+            bytes=byte_count,
+            elapsed_ms=round(elapsed * 1000, 1),
+            cache_hit=cache_hit,
+        )
+        return response
+
+    def send(self, request, **kwargs):
+        cassette = replay.active_cassette()
+        if cassette is not None:
+            # Recordings need complete bodies, so the conditional cache is bypassed.
+            return cassette.send(request, lambda: self._send_politely(request, **kwargs))
+        key = self.cache.key(request) if self.cache and not kwargs.get('stream') else None
+        added = {}
+        if key:
+            added = {
+                name: value
+                for name, value in self.cache.conditional_headers(key).items()
+                if name not in request.headers
+            }
+            request.headers.update(added)
+        response = self._send_politely(request, **kwargs)
+        if not key or response.history:
+            # Redirect hops are cached under their own URLs by the nested send().
+            return response
+        if response.status_code == 304 and added:
+            return self.cache.revalidated(key, response) or response
+        self.cache.store(key, response)
+        return response
+
+    def _send_politely(self, request, **kwargs):
+        if self.limiter is None:
+            return super().send(request, **kwargs)
+        self.limiter.wait(request.url)
+        response = super().send(request, **kwargs)
+        if not response.history:
+            # Redirect hops were observed by the nested send() for their own URLs.
+            self.limiter.observe(request.url, response.status_code, response.headers)
+        return response
+
+    def rebuild_method(self, prepared_request, response):
+        # Called once per redirect hop; validators belong to the previous URL.
+        super().rebuild_method(prepared_request, response)
+        for name in CONDITIONAL_HEADERS:
+            prepared_request.headers.pop(name, None)
+
+
+def create_session(headers: dict[str, str] | None = None, **options) -> CrawlerSession:
+    """Create a crawler session, optionally with default headers."""
+    session = CrawlerSession(**options)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+_shared_session: CrawlerSession | None = None
+_shared_session_pid: int | None = None
+_shared_session_lock = threading.Lock()
+
+
+def get_session() -> CrawlerSession:
+    """Return the process-wide session used by the module-level helpers."""
+    global _shared_session, _shared_session_pid
+    with _shared_session_lock:
+        # A forked worker must not reuse its parent's sockets.
+        if _shared_session is None or _shared_session_pid != os.getpid():
+            _shared_session = create_session()
+            _shared_session_pid = os.getpid()
+        return _shared_session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Drop-in replacement for ``requests.get`` on the shared session."""
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Drop-in replacement for ``requests.post`` on the shared session."""
+    return get_session().post(url, **kwargs)
+
+
+def fetch_many(
+    urls: Iterable[str],
+    fetch: Callable[[str], Any] | None = None,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    return_exceptions: bool = False,
+) -> list:
+    """Fetch ``urls`` concurrently and return the results in input order.
+
+    ``fetch`` defaults to a shared-session ``get``; pass a crawler's own
+    detail function to parse pages inside the pool.  With
+    ``return_exceptions`` a failed URL yields its exception instead of
+    aborting the whole batch.
+    """
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be at least 1, got {concurrency}')
+    fetch = fetch or get
+
+    def run(url):
+        try:
+            return fetch(url)
+        except Exception as error:
+            if not return_exceptions:
+                raise
+            return error
+
+    urls = list(urls)
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+        return list(executor.map(run, urls))
@@ -0,0 +1,194 @@
+"""Persistent conditional-request cache for crawler HTTP responses.
+
+Successful GET responses that carry an ``ETag`` or ``Last-Modified`` validator
+are stored on disk.  The next request for the same URL is sent with
+``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` answer is
+served from the stored body, so unchanged detail pages cost one small
+round trip instead of a full download.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_CACHE_DIRECTORY = Path('/var/lib/classical-bot/http-cache')
+DEFAULT_MAX_MEGABYTES = 1024
+DEFAULT_TTL_DAYS = 30
+EVICTION_INTERVAL = 200
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+# Request headers that select a different representation of the same URL.
+VARY_HEADERS = ('Accept', 'Accept-Language')
+UNCACHEABLE_HEADERS = ('Authorization', 'Cookie')
+_STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Content-Language')
+
+
+@dataclass(frozen=True)
+class HttpCacheConfig:
+    directory: Path
+    max_bytes: int
+    ttl_seconds: int
+
+    @classmethod
+    def from_environment(cls) -> HttpCacheConfig | None:
+        """Return the cache settings, or None unless CRAWLER_HTTP_CACHE is on."""
+        if os.getenv('CRAWLER_HTTP_CACHE', '').strip().lower() not in {'1', 'true', 'yes', 'on'}:
+            return None
+        return cls(
+            directory=Path(os.getenv('CRAWLER_HTTP_CACHE_DIR', str(DEFAULT_CACHE_DIRECTORY))),
+            max_bytes=int(os.getenv('CRAWLER_HTTP_CACHE_MAX_MB', DEFAULT_MAX_MEGABYTES)) * 1024 * 1024,
+            ttl_seconds=int(os.getenv('CRAWLER_HTTP_CACHE_TTL_DAYS', DEFAULT_TTL_DAYS)) * 86400,
+        )
+
+
+class HttpCache:
+    """Validator-keyed response store with TTL and size-based eviction."""
+
+    def __init__(self, config: HttpCacheConfig) -> None:
+        self.config = config
+        self._stores_since_eviction = 0
+        self._lock = threading.Lock()
+
+    def key(self, request: requests.PreparedRequest) -> str | None:
+        """Return the cache key of a request, or None when it is uncacheable.
+
+        Requests with credentials or cookies may get a personalised page, so
+        they are never cached.
+        """
+        if request.method != 'GET' or any(name in request.headers for name in UNCACHEABLE_HEADERS):
+            return None
+        identity = '\n'.join([request.url, *(request.headers.get(name, '') for name in VARY_HEADERS)])
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        directory = self.config.directory / key[:2]
+        return directory / f'{key}.json', directory / f'{key}.body'
+
+    def _metadata(self, key: str) -> dict | None:
+        meta_path, body_path = self._paths(key)
+        try:
+            if time.time() - meta_path.stat().st_mtime > self.config.ttl_seconds:
+                self._remove(key)
+                return None
+            metadata = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return metadata if body_path.exists() else None
+
+    def conditional_headers(self, key: str) -> dict[str, str]:
+        metadata = self._metadata(key)
+        if metadata is None:
+            return {}
+        headers = {}
+        if metadata['headers'].get('ETag'):
+            headers['If-None-Match'] = metadata['headers']['ETag']
+        if metadata['headers'].get('Last-Modified'):
+            headers['If-Modified-Since'] = metadata['headers']['Last-Modified']
+        return headers
+
+    def revalidated(self, key: str, not_modified: requests.Response) -> requests.Response | None:
+        """Build the stored response for a 304 answer and renew its TTL."""
+        metadata = self._metadata(key)
+        if metadata is None:
+            return None
+        meta_path, body_path = self._paths(key)
+        try:
+            body = body_path.read_bytes()
+            os.utime(meta_path)
+            os.utime(body_path)
+        except OSError:
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response._content = body
+        response._content_consumed = True
+        response.headers = CaseInsensitiveDict(metadata['headers'])
+        response.encoding = metadata.get('encoding')
+        response.url = metadata['url']
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.history = not_modified.history
+        response.from_cache = True
+        return response
+
+    def store(self, key: str, response: requests.Response) -> None:
+        if response.status_code != 200 or not getattr(response, '_content_consumed', False):
+            return
+        if not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return
+        meta_path, body_path = self._paths(key)
+        metadata = {
+            'url': response.url,
+            'encoding': response.encoding,
+            'headers': {
+                name: response.headers[name]
+                for name in _STORED_HEADERS
+                if name in response.headers
+            },
+        }
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            for path, content in (
+                (body_path, response.content),
+                (meta_path, json.dumps(metadata).encode('utf-8')),
+            ):
+                temporary = path.with_suffix(f'{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp')
+                temporary.write_bytes(content)
+                temporary.replace(path)
+        except OSError:
+            return
+        with self._lock:
+            self._stores_since_eviction += 1
+            due = self._stores_since_eviction >= EVICTION_INTERVAL
+            if due:
+                self._stores_since_eviction = 0
+        if due:
+            self.evict()
+
+    def _remove(self, key: str) -> None:
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Drop expired entries, then least recently used ones over the size limit."""
+        entries = []
+        now = time.time()
+        for body_path in self.config.directory.glob('*/*.body'):
+            try:
+                status = body_path.stat()
+            except OSError:
+                continue
+            if now - status.st_mtime > self.config.ttl_seconds:
+                self._remove(body_path.stem)
+                continue
+            entries.append((status.st_mtime, status.st_size, body_path.stem))
+        total = sum(size for _mtime, size, _key in entries)
+        for _mtime, size, key in sorted(entries):
+            if total <= self.config.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+
+_default_cache: HttpCache | None = None
+_default_cache_loaded = False
+
+
+def default_cache() -> HttpCache | None:
+    """Return the process cache configured by the environment, if enabled."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        config = HttpCacheConfig.from_environment()
+        _default_cache = HttpCache(config) if config else None
+        _default_cache_loaded = True
+    return _default_cache
@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -55,7 +56,7 @@ def get_page(url):
     last_error = None
     for attempt in range(4):
         try:
-            response = requests.get(url, headers=HEADERS, timeout=45)
+            response = http.get(url, headers=HEADERS, timeout=45)
             response.raise_for_status()
             return response.text
         except requests.RequestException as error:
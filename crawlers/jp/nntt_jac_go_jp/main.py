@@ -6,6 +6,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -87,7 +88,7 @@ def parse_occurrence(month, event):
 
 def fetch_description(url):
     try:
-        response = requests.get(url, headers=HEADERS, timeout=45)
+        response = http.get(url, headers=HEADERS, timeout=45)
         response.raise_for_status()
         response.encoding = response.apparent_encoding
     except requests.RequestException as error:
@@ -115,7 +116,7 @@ def fetch_description(url):
 
 def get_concerts():
     try:
-        response = requests.get(CALENDAR_URL, headers=HEADERS, timeout=60)
+        response = http.get(CALENDAR_URL, headers=HEADERS, timeout=60)
         response.raise_for_status()
         calendar = response.json()
     except (requests.RequestException, ValueError) as error:
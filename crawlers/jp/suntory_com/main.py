@@ -4,6 +4,7 @@ from datetime import date
 import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -181,7 +182,7 @@ def parse_detail(text, url, date_token, hall_token):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     final_month = add_months(date.today().replace(day=1), 4)
     records = []
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -166,7 +167,7 @@ def parse_detail_page(html, url):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     records = []
     today = date.today()
@@ -175,7 +176,7 @@ def get_concerts():
     def fetch_archive(year, month):
         url = f'{ARCHIVE_URL}?ym={year:04d}{month:02d}'
         try:
-            response = requests.get(url, headers=HEADERS, timeout=45)
+            response = http.get(url, headers=HEADERS, timeout=45)
             response.raise_for_status()
             return parse_archive_page(response.text, year, month, url)
         except requests.RequestException as error:
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -127,7 +128,7 @@ def page_count(html):
 
 
 def fetch_page(page):
-    response = requests.get(
+    response = http.get(
         LIST_URL,
         params={**LIST_PARAMS, 'page': page},
         headers=HEADERS,
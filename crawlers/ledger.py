@@ -0,0 +1,122 @@
+"""Per-run ledger of crawler timings, traffic and outcomes.
+
+``BaseCrawler.run()`` fills one ``CrawlerRun`` per execution and writes it to
+the ``crawler_run`` table, so questions like "which crawlers were slowest
+this week" are a query instead of a log search:
+
+    SELECT crawler, avg(duration_seconds), max(peak_memory_bytes)
+    FROM crawler_run
+    WHERE started_at > now() - interval '7 days'
+    GROUP BY crawler ORDER BY 2 DESC LIMIT 20;
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import resource
+import time
+from typing import Iterable, Iterator, Literal
+
+from db.connection import connection
+
+
+RunStatus = Literal['running', 'succeeded', 'failed', 'budget_exceeded']
+PHASES = ('scrape', 'prepare', 'upload')
+MAX_ERROR_MESSAGE_LENGTH = 1000
+
+
+@dataclass
+class CrawlerRun:
+    crawler: str
+    source: str | None
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+    status: RunStatus = 'running'
+    phase_seconds: dict[str, float] = field(default_factory=dict)
+    request_count: int | None = None
+    bytes_received: int | None = None
+    record_count: int | None = None
+    inserted_count: int | None = None
+    skipped_count: int | None = None
+    # Share of records added, changed or gone since the previous run.
+    change_fraction: float | None = None
+    peak_memory_bytes: int | None = None
+    error_class: str | None = None
+    error_message: str | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase ``name``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + time.perf_counter() - started
+
+    def timed(self, items: Iterable, name: str) -> Iterator:
+        """Yield from ``items``, adding the time spent producing them to phase ``name``."""
+        iterator = iter(items)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def finish(self, error: BaseException | None = None, *, budget_exceeded: BaseException | None = None) -> None:
+        """Close the run; ``budget_exceeded`` marks a run that stopped early with partial results."""
+        self.finished_at = datetime.now(UTC)
+        if error is not None:
+            self.status = 'failed'
+        elif budget_exceeded is not None:
+            self.status = 'budget_exceeded'
+            error = budget_exceeded
+        else:
+            self.status = 'succeeded'
+        if error is not None:
+            self.error_class = type(error).__name__
+            self.error_message = str(error)[:MAX_ERROR_MESSAGE_LENGTH]
+        # ru_maxrss is in kilobytes on Linux.  Crawlers run one per process,
+        # so the process peak is the crawler's peak.
+        self.peak_memory_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    @property
+    def duration_seconds(self) -> float | None:
+        if self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at).total_seconds()
+
+
+def record_crawler_run(run: CrawlerRun) -> None:
+    """Insert a finished run into ``crawler_run``."""
+    with connection() as conn, conn.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO crawler_run (
+                crawler, source, status, started_at, finished_at, duration_seconds,
+                scrape_seconds, prepare_seconds, upload_seconds,
+                request_count, bytes_received, record_count, inserted_count, skipped_count,
+                change_fraction, peak_memory_bytes, error_class, error_message
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                run.crawler,
+                run.source,
+                run.status,
+                run.started_at,
+                run.finished_at,
+                run.duration_seconds,
+                *(run.phase_seconds.get(name) for name in PHASES),
+                run.request_count,
+                run.bytes_received,
+                run.record_count,
+                run.inserted_count,
+                run.skipped_count,
+                run.change_fraction,
+                run.peak_memory_bytes,
+                run.error_class,
+                run.error_message,
+            ),
+        )
+        conn.commit()
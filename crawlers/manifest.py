@@ -0,0 +1,199 @@
+"""Static manifest of crawler entry points.
+
+The scheduler needs the slug, module, country and upload target of every
+crawler, but importing ~300 crawler modules pulls in requests, bs4, pandas
+and friends before any crawler runs.  The manifest reads those values from
+the ``CrawlerConfig(...)`` call of each ``crawlers/*/*/main.py`` by parsing
+its source, and caches them on disk keyed by file size and modification
+time so that only changed crawlers are parsed again.
+
+Usage:
+
+    python -m crawlers.manifest           # print the manifest as JSON
+    python -m crawlers.manifest --check   # fail when a config is not static
+"""
+
+import argparse
+import ast
+from dataclasses import asdict, dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+
+
+CRAWLERS_DIRECTORY = Path(__file__).parent
+DEFAULT_MANIFEST_PATH = Path('/var/lib/classical-bot/crawler-manifest.json')
+MANIFEST_VERSION = 1
+# Must match the CrawlerConfig field defaults; importing crawlers.base here
+# would load pandas, which this module exists to avoid.
+CONFIG_DEFAULTS = {'country_code': 'SK', 'upload_target': 'classical', 'source': None}
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CrawlerEntry:
+    slug: str
+    module: str
+    country_code: str | None
+    upload_target: str
+    source: str | None
+
+
+class ManifestError(ValueError):
+    pass
+
+
+def module_path(main_file: Path, crawlers_directory: Path = CRAWLERS_DIRECTORY) -> str:
+    parts = main_file.relative_to(crawlers_directory).with_suffix('').parts
+    return '.'.join((crawlers_directory.name, *parts))
+
+
+def _constants(tree: ast.Module) -> dict[str, object]:
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                constants[node.targets[0].id] = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+    return constants
+
+
+def inspect_crawler(main_file: Path, crawlers_directory: Path = CRAWLERS_DIRECTORY) -> CrawlerEntry:
+    """Read a crawler's CrawlerConfig without importing its module."""
+    tree = ast.parse(main_file.read_text(encoding='utf-8'), filename=str(main_file))
+    calls = [
+        node for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'CrawlerConfig'
+    ]
+    if len(calls) != 1:
+        raise ManifestError(f'{main_file}: expected one CrawlerConfig(...) call, found {len(calls)}')
+
+    constants = _constants(tree)
+    values = dict(CONFIG_DEFAULTS)
+    for keyword in calls[0].keywords:
+        if keyword.arg not in {'slug', *CONFIG_DEFAULTS}:
+            continue
+        if isinstance(keyword.value, ast.Name) and keyword.value.id in constants:
+            values[keyword.arg] = constants[keyword.value.id]
+            continue
+        try:
+            values[keyword.arg] = ast.literal_eval(keyword.value)
+        except ValueError:
+            raise ManifestError(
+                f'{main_file}: CrawlerConfig {keyword.arg}= is not a literal or module constant'
+            ) from None
+    if 'slug' not in values:
+        raise ManifestError(f'{main_file}: CrawlerConfig has no slug')
+    country_code = values['country_code']
+    return CrawlerEntry(
+        slug=values['slug'],
+        module=module_path(main_file, crawlers_directory),
+        country_code=country_code.upper() if isinstance(country_code, str) else country_code,
+        upload_target=values['upload_target'],
+        source=values['source'],
+    )
+
+
+def _fingerprint(main_file: Path) -> list[int]:
+    status = main_file.stat()
+    return [status.st_size, status.st_mtime_ns]
+
+
+def _read_cache(path: Path) -> dict[str, dict]:
+    try:
+        cached = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict) or cached.get('version') != MANIFEST_VERSION:
+        return {}
+    return cached.get('crawlers', {})
+
+
+def _write_cache(path: Path, crawlers: dict[str, dict]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f'.{os.getpid()}.tmp')
+        temporary.write_text(
+            json.dumps({'version': MANIFEST_VERSION, 'crawlers': crawlers}, indent=1, sort_keys=True) + '\n',
+            encoding='utf-8',
+        )
+        temporary.replace(path)
+    except OSError as error:
+        logger.warning(
+            'Could not save the crawler manifest',
+            extra={'event': 'crawler_manifest_save_failed', 'path': str(path), 'error_message': str(error)},
+        )
+
+
+def load_manifest(
+    crawlers_directory: Path = CRAWLERS_DIRECTORY,
+    cache_path: Path | None = None,
+) -> list[CrawlerEntry]:
+    """Return the manifest, re-inspecting only crawlers changed since the last call.
+
+    A crawler whose config cannot be read statically is still listed under
+    its directory name, so the scheduler keeps running it.
+    """
+    if cache_path is None:
+        cache_path = Path(os.getenv('CRAWLER_MANIFEST_PATH', str(DEFAULT_MANIFEST_PATH)))
+    cached = _read_cache(cache_path)
+    crawlers = {}
+    entries = []
+    for main_file in sorted(crawlers_directory.glob('*/*/main.py')):
+        key = str(main_file.relative_to(crawlers_directory))
+        fingerprint = _fingerprint(main_file)
+        previous = cached.get(key)
+        if previous and previous['fingerprint'] == fingerprint:
+            entry = CrawlerEntry(**previous['entry'])
+        else:
+            try:
+                entry = inspect_crawler(main_file, crawlers_directory)
+            except (ManifestError, SyntaxError) as error:
+                logger.error(
+                    'Could not inspect crawler config',
+                    extra={'event': 'crawler_manifest_entry_failed', 'path': key, 'error_message': str(error)},
+                )
+                entry = CrawlerEntry(
+                    slug=main_file.parent.name,
+                    module=module_path(main_file, crawlers_directory),
+                    country_code=None,
+                    upload_target=CONFIG_DEFAULTS['upload_target'],
+                    source=None,
+                )
+        crawlers[key] = {'fingerprint': fingerprint, 'entry': asdict(entry)}
+        entries.append(entry)
+    if crawlers != cached:
+        _write_cache(cache_path, crawlers)
+    return entries
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='exit with status 1 when a crawler config cannot be read statically',
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.check:
+        failures = []
+        for main_file in sorted(CRAWLERS_DIRECTORY.glob('*/*/main.py')):
+            try:
+                inspect_crawler(main_file)
+            except (ManifestError, SyntaxError) as error:
+                failures.append(str(error))
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        raise SystemExit(1 if failures else 0)
+    print(json.dumps([asdict(entry) for entry in load_manifest()], indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
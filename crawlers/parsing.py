@@ -0,0 +1,43 @@
+"""Shared HTML parsing for crawlers.
+
+``parse_html()`` builds an ordinary ``BeautifulSoup`` tree with lxml's C
+parser instead of Python's ``html.parser``, which tokenizes large listing
+pages faster and with less memory (see ``benchmarks.html_parsing``).
+``find()``, ``select()`` and ``get_text()`` work as before, so a crawler
+switches by replacing ``BeautifulSoup(content, 'html.parser')`` with
+``parse_html(content)``.
+
+lxml repairs broken markup differently from html.parser (stray closing
+tags, unclosed ``<p>``, content after ``</html>``), so crawlers move over
+one module at a time.  ``CRAWLER_HTML_PARSER=html.parser`` switches every
+converted crawler back without a code change.
+"""
+
+import os
+from typing import Any
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+DEFAULT_PARSER = 'lxml'
+
+
+def default_parser() -> str:
+    return os.getenv('CRAWLER_HTML_PARSER', '').strip() or DEFAULT_PARSER
+
+
+def parse_html(
+    markup: Any,
+    parser: str | None = None,
+    *,
+    parse_only: SoupStrainer | None = None,
+) -> BeautifulSoup:
+    """Parse HTML text, bytes or an HTTP response into a soup.
+
+    Pass bytes or a response rather than ``response.text`` when possible, so
+    the page's own ``<meta charset>`` decides the encoding.  ``parse_only``
+    keeps only matching elements, e.g. ``SoupStrainer('article')`` on a
+    listing page whose events are all ``<article>`` blocks.
+    """
+    content = getattr(markup, 'content', markup)
+    return BeautifulSoup(content, parser or default_parser(), parse_only=parse_only)
@@ -0,0 +1,306 @@
+"""Per-site request rate limits shared by every crawler HTTP client.
+
+Requests are limited per registered domain (``tickets.example.co.uk`` and
+``www.example.co.uk`` share ``example.co.uk``), so thread pools of several
+crawlers hitting one aggregator or ticket portal add up to one polite rate
+instead of one rate each.  Each domain gets a token bucket of
+``CRAWLER_RATE_LIMIT_PER_SECOND`` requests per second with bursts of
+``CRAWLER_RATE_LIMIT_BURST``; different domains never wait for each other.
+
+A ``Crawl-delay`` in a host's robots.txt lowers its domain's rate, and a 429
+or 503 with ``Retry-After`` pauses the domain for every caller.  robots.txt
+is fetched once per host and cached for a day.
+
+Bucket state and robots.txt lookups are kept in files in
+``CRAWLER_RATE_LIMIT_DIR``, so crawlers running in parallel processes share
+the limits, and the robots.txt cache outlives the one process per crawler
+run.  Set it to an empty value to keep both in process memory; they also
+fall back to memory when the directory is not writable.  The buckets use
+GCRA: the whole state of a bucket is one timestamp, which makes the shared
+file a cheap read-modify-write under ``flock``.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC
+from email.utils import parsedate_to_datetime
+import fcntl
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Mapping
+from urllib.parse import urlsplit
+import urllib.request
+from urllib.robotparser import RobotFileParser
+
+import tldextract
+
+from observability import log_message
+
+
+DEFAULT_DIRECTORY = Path('/var/lib/classical-bot/rate-limits')
+DEFAULT_RATE_PER_SECOND = 2.0
+DEFAULT_BURST = 4
+ROBOTS_TTL_SECONDS = 24 * 3600
+ROBOTS_TIMEOUT_SECONDS = 5
+# A misconfigured server must not stall a crawl for hours.
+MAX_RETRY_AFTER_SECONDS = 600
+RETRY_AFTER_STATUSES = (429, 503)
+ROBOTS_USER_AGENT = 'ClassicalBot'
+
+# The bundled public suffix list; never download it at crawl time.
+_extract = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    rate_per_second: float = DEFAULT_RATE_PER_SECOND
+    burst: int = DEFAULT_BURST
+    directory: Path | None = None
+    respect_robots: bool = True
+
+    def __post_init__(self):
+        if self.rate_per_second < 0:
+            raise ValueError(f'rate_per_second must not be negative, got {self.rate_per_second!r}')
+        if self.burst < 1:
+            raise ValueError(f'burst must be at least 1, got {self.burst!r}')
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate_per_second > 0
+
+    @classmethod
+    def from_environment(cls) -> 'RateLimitConfig':
+        directory = os.getenv('CRAWLER_RATE_LIMIT_DIR', str(DEFAULT_DIRECTORY)).strip()
+        return cls(
+            rate_per_second=float(os.getenv('CRAWLER_RATE_LIMIT_PER_SECOND', DEFAULT_RATE_PER_SECOND)),
+            burst=int(os.getenv('CRAWLER_RATE_LIMIT_BURST', DEFAULT_BURST)),
+            directory=Path(directory) if directory else None,
+            respect_robots=os.getenv('CRAWLER_RESPECT_ROBOTS', '1').strip().lower() not in ('0', 'false', 'no'),
+        )
+
+
+def registered_domain(url: str) -> str:
+    """The domain a site registered, or the bare host for IPs and intranet names."""
+    host = (urlsplit(url).hostname or '').lower()
+    return _extract(host).top_domain_under_public_suffix or host
+
+
+def retry_after_seconds(headers: Mapping[str, str], now: float | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header, in seconds or as an HTTP date."""
+    value = (headers.get('Retry-After') or '').strip()
+    if not value:
+        return None
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=UTC)
+        now = time.time() if now is None else now
+        seconds = retry_at.timestamp() - now
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def fetch_crawl_delay(origin: str) -> float | None:
+    """The ``Crawl-delay`` robots.txt at ``origin`` sets for us, if any."""
+    request = urllib.request.Request(f'{origin}/robots.txt', headers={'User-Agent': ROBOTS_USER_AGENT})
+    try:
+        with urllib.request.urlopen(request, timeout=ROBOTS_TIMEOUT_SECONDS) as response:
+            lines = response.read(512 * 1024).decode('utf-8', errors='replace').splitlines()
+    except (OSError, ValueError):
+        # Missing, forbidden or unreachable robots.txt: no delay requested.
+        return None
+    parser = RobotFileParser()
+    parser.parse(lines)
+    delay = parser.crawl_delay(ROBOTS_USER_AGENT)
+    return float(delay) if delay else None
+
+
+class _Slots:
+    """Theoretical arrival times per domain, in this process or in shared files."""
+
+    def __init__(self, directory: Path | None):
+        self.directory = directory
+        self._times: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def update(self, domain: str, change: Callable[[float], float]) -> float:
+        """Replace the domain's stored time with ``change(stored)`` and return the new value."""
+        if self.directory is not None:
+            try:
+                return self._update_file(domain, change)
+            except OSError as error:
+                log_message(
+                    'Could not share rate limit state, keeping it in this process',
+                    event='crawler_rate_limit_state_failed',
+                    level='warning',
+                    error_message=str(error),
+                )
+                self.directory = None
+        with self._lock:
+            self._times[domain] = change(self._times.get(domain, 0.0))
+            return self._times[domain]
+
+    def _update_file(self, domain: str, change: Callable[[float], float]) -> float:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / f'{domain}.slot', 'a+') as handle:
+            # flock locks belong to the open file, so threads of one process
+            # exclude each other here as well.
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            handle.seek(0)
+            try:
+                stored = float(handle.read() or 0.0)
+            except ValueError:
+                stored = 0.0
+            updated = change(stored)
+            handle.seek(0)
+            handle.truncate()
+            handle.write(repr(updated))
+            return updated
+
+
+class RobotsCache:
+    """Crawl delays per origin, cached in memory and optionally on disk."""
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        fetch: Callable[[str], float | None] = fetch_crawl_delay,
+        ttl_seconds: float = ROBOTS_TTL_SECONDS,
+    ):
+        self.path = directory / 'robots.json' if directory else None
+        self.fetch = fetch
+        self.ttl_seconds = ttl_seconds
+        self._delays: dict[str, tuple[float | None, float]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def crawl_delay(self, url: str) -> float | None:
+        parts = urlsplit(url)
+        origin = f'{parts.scheme}://{parts.netloc}'.lower()
+        with self._lock:
+            lock = self._locks.setdefault(origin, threading.Lock())
+        # One fetch per origin; other origins do not wait for it.
+        with lock:
+            cached = self._delays.get(origin) or self._load().get(origin)
+            if cached and time.time() - cached[1] < self.ttl_seconds:
+                self._delays[origin] = cached
+                return cached[0]
+            delay = self.fetch(origin)
+            self._delays[origin] = (delay, time.time())
+            self._save(origin)
+            return delay
+
+    def _load(self) -> dict[str, tuple[float | None, float]]:
+        if self.path is None:
+            return {}
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return {origin: tuple(entry) for origin, entry in stored.items()}
+
+    def _save(self, origin: str) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path.with_suffix('.lock'), 'a') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                stored = self._load()
+                stored[origin] = list(self._delays[origin])
+                temporary = self.path.with_suffix(f'.{os.getpid()}.tmp')
+                temporary.write_text(json.dumps(stored, sort_keys=True), encoding='utf-8')
+                temporary.replace(self.path)
+        except OSError:
+            # The lookup stays cached in memory for this process.
+            pass
+
+
+class DomainRateLimiter:
+    """Token bucket per registered domain, honouring Crawl-delay and Retry-After.
+
+    ``reserve()`` books the next slot of the URL's domain and returns how
+    long to wait for it, so async clients can ``await asyncio.sleep()``;
+    ``wait()`` sleeps itself.  Pass every response to ``observe()``.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig | None = None,
+        *,
+        robots: RobotsCache | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.config = config or RateLimitConfig()
+        self.robots = robots or RobotsCache(self.config.directory)
+        self.clock = clock
+        self.sleep = sleep
+        self._slots = _Slots(self.config.directory)
+
+    def interval(self, url: str) -> float:
+        """Seconds between requests to the URL's domain at the steady rate."""
+        interval = 1 / self.config.rate_per_second
+        if self.config.respect_robots:
+            interval = max(interval, self.robots.crawl_delay(url) or 0.0)
+        return interval
+
+    def reserve(self, url: str) -> float:
+        if not self.config.enabled or not urlsplit(url).hostname:
+            return 0.0
+        interval = self.interval(url)
+        # A site that asks for a delay gets no bursts.
+        tolerance = 0.0 if interval > 1 / self.config.rate_per_second else (self.config.burst - 1) * interval
+        now = self.clock()
+        booked = {}
+
+        def book(stored: float) -> float:
+            arrival = max(stored, now)
+            booked['at'] = arrival - tolerance
+            return arrival + interval
+
+        self._slots.update(registered_domain(url), book)
+        return max(booked['at'] - now, 0.0)
+
+    def wait(self, url: str) -> None:
+        delay = self.reserve(url)
+        if delay > 0:
+            self.sleep(delay)
+
+    def observe(self, url: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Pause the URL's domain for everyone if the response asks us to back off."""
+        if not self.config.enabled or status_code not in RETRY_AFTER_STATUSES:
+            return
+        seconds = retry_after_seconds(headers)
+        if not seconds:
+            return
+        resume_at = self.clock() + seconds
+        tolerance = (self.config.burst - 1) / self.config.rate_per_second
+        domain = registered_domain(url)
+        self._slots.update(domain, lambda stored: max(stored, resume_at + tolerance))
+        log_message(
+            'Crawler HTTP requests paused by Retry-After',
+            event='crawler_rate_limited',
+            domain=domain,
+            status_code=status_code,
+            retry_after_seconds=round(seconds, 1),
+        )
+
+
+_default_limiter: DomainRateLimiter | None = None
+_default_limiter_lock = threading.Lock()
+
+
+def default_limiter() -> DomainRateLimiter:
+    """The process-wide limiter configured from the environment."""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = DomainRateLimiter(RateLimitConfig.from_environment())
+        return _default_limiter
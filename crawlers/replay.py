@@ -0,0 +1,289 @@
+"""Record crawler HTTP traffic and replay it without the network.
+
+``CRAWLER_HTTP_MODE=record`` stores every response a crawler receives, and
+``CRAWLER_HTTP_MODE=replay`` serves the stored responses instead of
+contacting the site, optionally after ``CRAWLER_HTTP_REPLAY_LATENCY_MS`` per
+request to mimic a live server.  Each crawler has one gzipped JSON-lines
+recording, ``<CRAWLER_HTTP_RECORDINGS_DIR>/<slug>.jsonl.gz``.
+
+``BaseCrawler.run()`` and the generated-crawler validator wrap their scrape
+in ``recording()``; anything else can do the same:
+
+    with recording('filharmonia-sk'):
+        records = crawler.scrape()
+
+Requests are matched by method, URL (including the query string) and body.
+A URL requested several times is answered with its responses in recorded
+order.  A crawler that builds URLs from today's date therefore only replays
+on the day it was recorded.
+"""
+
+from __future__ import annotations
+
+import base64
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+import gzip
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Iterator, Mapping
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+MODES = ('live', 'record', 'replay')
+DEFAULT_RECORDINGS_DIRECTORY = Path('/var/lib/classical-bot/http-recordings')
+# Bodies are stored decoded and cookies are not replayed.
+_DROPPED_HEADERS = frozenset({
+    'connection', 'content-encoding', 'content-length', 'keep-alive', 'set-cookie', 'transfer-encoding',
+})
+
+
+class ReplayMissError(requests.ConnectionError):
+    """A request made during replay has no recorded response."""
+
+
+@dataclass(frozen=True)
+class ReplayConfig:
+    mode: str = 'live'
+    directory: Path = DEFAULT_RECORDINGS_DIRECTORY
+    latency_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.mode not in MODES:
+            raise ValueError(f'HTTP mode must be one of {", ".join(MODES)}, got {self.mode!r}')
+
+    @classmethod
+    def from_environment(cls) -> ReplayConfig:
+        return cls(
+            mode=os.getenv('CRAWLER_HTTP_MODE', '').strip().lower() or 'live',
+            directory=Path(os.getenv('CRAWLER_HTTP_RECORDINGS_DIR', str(DEFAULT_RECORDINGS_DIRECTORY))),
+            latency_seconds=float(os.getenv('CRAWLER_HTTP_REPLAY_LATENCY_MS', 0)) / 1000,
+        )
+
+    def path(self, slug: str) -> Path:
+        return self.directory / f'{slug}.jsonl.gz'
+
+
+def body_hash(body: str | bytes | None) -> str | None:
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """One recorded request and the response it received."""
+
+    method: str
+    url: str
+    body_hash: str | None
+    status_code: int
+    reason: str
+    final_url: str
+    headers: dict[str, str]
+    content: bytes
+
+    @classmethod
+    def create(
+        cls,
+        method: str,
+        url: str,
+        body: str | bytes | None,
+        *,
+        status_code: int,
+        reason: str | None,
+        final_url: str | None,
+        headers: Mapping[str, str],
+        content: bytes | None,
+    ) -> Exchange:
+        return cls(
+            method=method.upper(),
+            url=url,
+            body_hash=body_hash(body),
+            status_code=status_code,
+            reason=reason or '',
+            final_url=final_url or url,
+            headers={name: value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS},
+            content=content or b'',
+        )
+
+    @property
+    def key(self) -> tuple[str, str, str | None]:
+        return self.method, self.url, self.body_hash
+
+    def to_json(self) -> dict[str, Any]:
+        data = {
+            'method': self.method,
+            'url': self.url,
+            'body_hash': self.body_hash,
+            'status_code': self.status_code,
+            'reason': self.reason,
+            'final_url': self.final_url,
+            'headers': self.headers,
+        }
+        try:
+            data['text'] = self.content.decode('utf-8')
+        except UnicodeDecodeError:
+            data['base64'] = base64.b64encode(self.content).decode('ascii')
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Exchange:
+        if 'text' in data:
+            content = data['text'].encode('utf-8')
+        else:
+            content = base64.b64decode(data.get('base64', ''))
+        return cls(
+            method=data['method'],
+            url=data['url'],
+            body_hash=data.get('body_hash'),
+            status_code=data['status_code'],
+            reason=data.get('reason', ''),
+            final_url=data.get('final_url') or data['url'],
+            headers=data.get('headers') or {},
+            content=content,
+        )
+
+
+class Cassette:
+    """The recorded exchanges of one crawler, either being recorded or replayed."""
+
+    def __init__(self, path: Path, mode: str, *, latency_seconds: float = 0.0) -> None:
+        if mode not in ('record', 'replay'):
+            raise ValueError(f'cassette mode must be record or replay, got {mode!r}')
+        self.path = path
+        self.mode = mode
+        self.latency_seconds = latency_seconds
+        self._exchanges: list[Exchange] = []
+        self._queues: dict[tuple[str, str, str | None], deque[Exchange]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, *, latency_seconds: float = 0.0) -> Cassette:
+        """Open a recording for replay; raises FileNotFoundError without one."""
+        cassette = cls(path, 'replay', latency_seconds=latency_seconds)
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    cassette._add(Exchange.from_json(json.loads(line)))
+        return cassette
+
+    def __len__(self) -> int:
+        return len(self._exchanges)
+
+    def _add(self, exchange: Exchange) -> None:
+        self._exchanges.append(exchange)
+        self._queues.setdefault(exchange.key, deque()).append(exchange)
+
+    def record(self, exchange: Exchange) -> None:
+        with self._lock:
+            self._add(exchange)
+
+    def play(self, method: str, url: str, body: str | bytes | None = None, *, wait: bool = True) -> Exchange:
+        """Return the next recorded response for a request.
+
+        With ``wait`` it sleeps for the configured latency before returning;
+        asynchronous callers pass ``wait=False`` and sleep themselves.
+        """
+        key = (method.upper(), url, body_hash(body))
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise ReplayMissError(f'No recorded response for {method.upper()} {url} in {self.path}')
+            # The last response of a URL answers any further requests for it.
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+        if wait and self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        return exchange
+
+    def save(self) -> None:
+        """Write the recording atomically, replacing any previous one."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f'.{self.path.name}.{os.getpid()}.tmp')
+        with self._lock:
+            lines = [json.dumps(exchange.to_json(), ensure_ascii=False) + '\n' for exchange in self._exchanges]
+        with gzip.open(temporary, 'wt', encoding='utf-8') as file:
+            file.writelines(lines)
+        temporary.replace(self.path)
+
+    def send(self, request: requests.PreparedRequest, send: Callable[[], requests.Response]) -> requests.Response:
+        """Replay ``request``, or perform it with ``send`` and record the response."""
+        if self.mode == 'replay':
+            return requests_response(self.play(request.method, request.url, request.body), request)
+        response = send()
+        content = response.content
+        # The body was read for the recording; let streaming callers read it again.
+        response.raw = io.BytesIO(content)
+        self.record(Exchange.create(
+            request.method,
+            request.url,
+            request.body,
+            status_code=response.status_code,
+            reason=response.reason,
+            final_url=response.url,
+            headers=response.headers,
+            content=content,
+        ))
+        return response
+
+
+def requests_response(exchange: Exchange, request: requests.PreparedRequest | None = None) -> requests.Response:
+    """Build a ``requests.Response`` from a recorded exchange."""
+    response = requests.Response()
+    response.status_code = exchange.status_code
+    response.reason = exchange.reason
+    response.url = exchange.final_url
+    response.headers = CaseInsensitiveDict(exchange.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = exchange.content
+    response._content_consumed = True
+    response.raw = io.BytesIO(exchange.content)
+    response.request = request
+    response.elapsed = timedelta(0)
+    response.from_replay = True
+    return response
+
+
+_active: Cassette | None = None
+
+
+def active_cassette() -> Cassette | None:
+    """The cassette crawler sessions record to or replay from, if any."""
+    return _active
+
+
+@contextmanager
+def recording(slug: str, config: ReplayConfig | None = None) -> Iterator[Cassette | None]:
+    """Record or replay the HTTP traffic of one crawler inside the block.
+
+    In ``live`` mode this does nothing.  A recording is only saved when the
+    block succeeds, so a failed run never replaces a complete recording.
+    """
+    global _active
+    config = config or ReplayConfig.from_environment()
+    if config.mode == 'live':
+        yield None
+        return
+    if config.mode == 'replay':
+        cassette = Cassette.load(config.path(slug), latency_seconds=config.latency_seconds)
+    else:
+        cassette = Cassette(config.path(slug), 'record')
+    previous, _active = _active, cassette
+    try:
+        yield cassette
+    finally:
+        _active = previous
+    if cassette.mode == 'record':
+        cassette.save()
@@ -0,0 +1,202 @@
+"""Crawl each source as often as its output actually changes.
+
+Every run records in ``crawler_run.change_fraction`` how much of the
+crawler's output was added, changed or gone compared with its previous run.
+After a pass, ``update_schedule()`` turns that into a smoothed change rate
+(share of the output changing per day) and sets the crawler's interval so
+that about ``target_change`` of its output changes between two runs:
+
+    interval = target_change / change_rate, within [min_interval, max_interval]
+
+An interval grows by at most ``max_growth`` per run, so one quiet run does
+not push a busy source out to a week.  Intervals and due times live in the
+``crawler_schedule`` table and survive restarts.  ``due_crawlers()`` picks
+the crawlers to run now; crawlers without a schedule row are always due.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+import math
+import os
+from typing import Iterable, Mapping
+
+from db.connection import connection
+from .manifest import CrawlerEntry
+
+
+DEFAULT_MIN_INTERVAL_HOURS = 6
+DEFAULT_MAX_INTERVAL_HOURS = 7 * 24
+DEFAULT_TARGET_CHANGE = 0.1
+SECONDS_PER_DAY = 86400
+NEVER = datetime.min.replace(tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class SchedulePolicy:
+    min_interval: timedelta = timedelta(hours=DEFAULT_MIN_INTERVAL_HOURS)
+    max_interval: timedelta = timedelta(hours=DEFAULT_MAX_INTERVAL_HOURS)
+    default_interval: timedelta = timedelta(days=1)
+    target_change: float = DEFAULT_TARGET_CHANGE
+    # Weight of the newest observation in the smoothed change rate.
+    smoothing: float = 0.3
+    max_growth: float = 2.0
+
+    def __post_init__(self):
+        if not timedelta(0) < self.min_interval <= self.max_interval:
+            raise ValueError('schedule intervals must satisfy 0 < min_interval <= max_interval')
+        if not 0 < self.target_change <= 1:
+            raise ValueError(f'target_change must be in (0, 1], got {self.target_change!r}')
+
+    @classmethod
+    def from_environment(cls) -> 'SchedulePolicy':
+        return cls(
+            min_interval=timedelta(hours=float(os.getenv('CRAWLER_MIN_INTERVAL_HOURS', DEFAULT_MIN_INTERVAL_HOURS))),
+            max_interval=timedelta(hours=float(os.getenv('CRAWLER_MAX_INTERVAL_HOURS', DEFAULT_MAX_INTERVAL_HOURS))),
+            target_change=float(os.getenv('CRAWLER_TARGET_CHANGE', DEFAULT_TARGET_CHANGE)),
+        )
+
+    def clamp(self, seconds: float) -> float:
+        return min(max(seconds, self.min_interval.total_seconds()), self.max_interval.total_seconds())
+
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    crawler: str
+    interval_seconds: float
+    change_rate: float | None
+    last_run_at: datetime | None
+    next_run_at: datetime
+
+
+@dataclass(frozen=True)
+class RunObservation:
+    crawler: str
+    started_at: datetime
+    succeeded: bool
+    change_fraction: float | None
+
+
+def adaptive_enabled() -> bool:
+    """Whether the scheduler runs due crawlers instead of one daily full pass."""
+    return os.getenv('CRAWLER_SCHEDULE', '').strip().lower() == 'adaptive'
+
+
+def next_entry(
+    previous: ScheduleEntry | None,
+    observation: RunObservation,
+    policy: SchedulePolicy,
+) -> ScheduleEntry:
+    """Schedule a crawler's next run from its latest run."""
+    interval = previous.interval_seconds if previous else policy.clamp(policy.default_interval.total_seconds())
+    change_rate = previous.change_rate if previous else None
+    run_at = observation.started_at
+
+    if not observation.succeeded:
+        # Retry broken crawlers at the usual daily pace, not after a week.
+        retry = min(interval, policy.clamp(policy.default_interval.total_seconds()))
+        return ScheduleEntry(observation.crawler, interval, change_rate, run_at, run_at + timedelta(seconds=retry))
+
+    if observation.change_fraction is not None:
+        if previous and previous.last_run_at:
+            elapsed = (run_at - previous.last_run_at).total_seconds()
+        else:
+            elapsed = interval
+        elapsed_days = max(elapsed, policy.min_interval.total_seconds()) / SECONDS_PER_DAY
+        observed = min(observation.change_fraction, 1.0) / elapsed_days
+        if change_rate is None:
+            change_rate = observed
+        else:
+            change_rate = policy.smoothing * observed + (1 - policy.smoothing) * change_rate
+        ideal = policy.target_change / change_rate * SECONDS_PER_DAY if change_rate > 0 else math.inf
+        interval = policy.clamp(min(ideal, interval * policy.max_growth))
+
+    return ScheduleEntry(observation.crawler, interval, change_rate, run_at, run_at + timedelta(seconds=interval))
+
+
+def due_crawlers(
+    entries: Iterable[CrawlerEntry],
+    schedule: Mapping[str, ScheduleEntry],
+    now: datetime,
+) -> list[CrawlerEntry]:
+    """Crawlers to run at ``now``, unscheduled first, then the most overdue."""
+    def due_at(entry: CrawlerEntry) -> datetime:
+        scheduled = schedule.get(entry.slug)
+        return scheduled.next_run_at if scheduled else NEVER
+
+    return sorted((entry for entry in entries if due_at(entry) <= now), key=due_at)
+
+
+def load_schedule() -> dict[str, ScheduleEntry]:
+    with connection(readonly=True) as conn, conn.cursor() as cursor:
+        cursor.execute(
+            'SELECT crawler, interval_seconds, change_rate, last_run_at, next_run_at FROM crawler_schedule'
+        )
+        return {row[0]: ScheduleEntry(*row) for row in cursor.fetchall()}
+
+
+def latest_runs(since: datetime) -> list[RunObservation]:
+    """The newest run of every crawler that started at or after ``since``."""
+    with connection(readonly=True) as conn, conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT DISTINCT ON (crawler) crawler, started_at, status = 'succeeded', change_fraction
+            FROM crawler_run
+            WHERE started_at >= %s
+            ORDER BY crawler, started_at DESC
+            """,
+            (since,),
+        )
+        return [RunObservation(*row) for row in cursor.fetchall()]
+
+
+def with_outcomes(runs: Iterable[RunObservation], outcomes: Mapping[str, bool], since: datetime) -> list[RunObservation]:
+    """Ledger runs, corrected by whether each crawler's process succeeded.
+
+    Crawlers that timed out, crashed or failed to import often leave no
+    ``crawler_run`` row; they are observed as failed runs at ``since``, so
+    they are retried later instead of being due again on every tick.
+    """
+    observed = {run.crawler: run for run in runs}
+    for crawler, succeeded in outcomes.items():
+        run = observed.get(crawler)
+        if run is None:
+            observed[crawler] = RunObservation(crawler, since, succeeded, None)
+        elif run.succeeded and not succeeded:
+            observed[crawler] = replace(run, succeeded=False)
+    return list(observed.values())
+
+
+def update_schedule(
+    since: datetime,
+    policy: SchedulePolicy | None = None,
+    *,
+    outcomes: Mapping[str, bool] | None = None,
+) -> list[ScheduleEntry]:
+    """Reschedule every crawler that ran since ``since`` and return the new entries.
+
+    ``outcomes`` maps the slugs of the crawlers of the pass to whether
+    their process succeeded.
+    """
+    policy = policy or SchedulePolicy.from_environment()
+    schedule = load_schedule()
+    runs = with_outcomes(latest_runs(since), outcomes or {}, since)
+    updated = [next_entry(schedule.get(run.crawler), run, policy) for run in runs]
+    if not updated:
+        return []
+    with connection() as conn, conn.cursor() as cursor:
+        for entry in updated:
+            cursor.execute(
+                """
+                INSERT INTO crawler_schedule (crawler, interval_seconds, change_rate, last_run_at, next_run_at)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (crawler) DO UPDATE
+                SET interval_seconds = EXCLUDED.interval_seconds,
+                    change_rate = EXCLUDED.change_rate,
+                    last_run_at = EXCLUDED.last_run_at,
+                    next_run_at = EXCLUDED.next_run_at,
+                    updated_at = now()
+                """,
+                (entry.crawler, entry.interval_seconds, entry.change_rate, entry.last_run_at, entry.next_run_at),
+            )
+        conn.commit()
+    return updated
@@ -1,12 +1,12 @@
 import random
-import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 def get_access_token():
     url = 'https://www.cultusruzinov.sk/_api/v1/access-tokens'
-    r = requests.get(url)
+    r = http.get(url)
     r.raise_for_status()
     response = r.json()
     key = random.choice(list(response['apps'].keys()))
@@ -14,7 +14,7 @@ def get_access_token():
 
 def get_event_slugs(access_token):
     url = 'https://www.cultusruzinov.sk/_api/wix-one-events-server/web/paginated-events/viewer?offset=0&locale=sk&filterType=2&limit=1000'
-    r = requests.get(url, headers={'authorization': access_token})
+    r = http.get(url, headers={'authorization': access_token})
     r.raise_for_status()
     response = r.json()
     return [event['slug'] for event in response['events']]
@@ -22,7 +22,7 @@ def get_event_slugs(access_token):
 def get_event_data(slug, access_token):
     url = f'https://www.cultusruzinov.sk/_api/wix-one-events-server/html/page-data/{slug}'
     log_message('Fetching event detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url, headers={'authorization': access_token})
+    r = http.get(url, headers={'authorization': access_token})
     r.raise_for_status()
     response = r.json()
     
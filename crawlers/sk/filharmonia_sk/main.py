@@ -1,17 +1,16 @@
 import re
 from datetime import date, datetime
-import requests
-
-from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
+from ...parsing import parse_html
 from observability import log_message
 
 def get_concerts():
     today = date.today()
     month_start = today.replace(day=1)
     url = f'https://www.filharmonia.sk/events-feed?start={month_start.isoformat()}'
-    r = requests.get(url)
+    r = http.get(url)
     concerts = r.json()
     concerts = [{
         'title': c['title'],
@@ -27,8 +26,8 @@ def get_concert_description(url):
     Get concert description from filharmonia.sk
     """
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
-    soup = BeautifulSoup(r.content, 'html.parser')
+    r = http.get(url)
+    soup = parse_html(r)
     div = soup.find('div', class_='region-content')
     text = div.get_text('\n').strip()
     # Clean up whitespace
@@ -40,6 +39,7 @@ class FilharmoniaCrawler(BaseCrawler):
         slug='filharmonia_sk',
         source='Slovenská filharmónia',
         source_url='http://www.filharmonia.sk',
+        incremental=True,
         columns=['title', 'date', 'time_from', 'time_to', 'url'],
         front_fields=[
             ('venue', 'Slovenská filharmónia'),
@@ -53,7 +53,10 @@ class FilharmoniaCrawler(BaseCrawler):
         return get_concerts()
 
     def transform(self, df):
-        df['description'] = df['url'].apply(get_concert_description)
+        known = self.known_events()
+        needs = [known.needs_details(url, date) for url, date in zip(df['url'], df['date'])]
+        descriptions = iter(http.fetch_many(df['url'][needs], get_concert_description))
+        df['description'] = [next(descriptions) if need else None for need in needs]
         return df
 
 
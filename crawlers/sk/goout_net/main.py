@@ -1,7 +1,7 @@
-import requests
 from datetime import datetime
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 def validate_schedule(schedule):
     """
@@ -66,6 +66,7 @@ class GooutCrawler(BaseCrawler):
         source_url='https://goout.net',
         columns=['title', 'venue', 'city', 'date', 'time_from', 'time_to', 'url', 'description'],
         dedupe_subset=['title', 'date', 'time_from'],
+        bulk_upload=True,
         front_fields=[
             ('source_url', 'https://goout.net'),
             ('source', 'GoOut'),
@@ -74,7 +75,7 @@ class GooutCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://goout.net/services/entities/v1/schedules?languages%5B%5D=sk&categories%5B%5D=concerts&tags%5B%5D=classical&grouped=true&notScheduleTags%5B%5D=online&sort=popularity%3Adesc&limit=24&countryIsos%5B%5D=sk&include=events%2Cvenues%2Cimages%2Csales%2Ccities%2Cparents%2Cperformers'
-        r = requests.get(url)
+        r = http.get(url)
         response = r.json()
         return extract_concert_data(response)
 
@@ -1,11 +1,11 @@
 import time
 import datetime
 
-import requests
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from ...extractors import extract_city, extract_date, extract_time
 
 def convert_date(date_str):
@@ -76,7 +76,7 @@ class KonvergencieCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://www.konvergencie.sk/vstupenky/'
-        r = requests.get(url)
+        r = http.get(url)
         soup = BeautifulSoup(r.content, 'html.parser')
 
         concerts = soup.find_all('div', class_='tt-evt-li')
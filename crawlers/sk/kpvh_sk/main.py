@@ -1,11 +1,11 @@
 import re
 from datetime import date as date_cls
 
-import requests
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 from ...extractors import extract_date, extract_time
 from ...formaters import format_date
@@ -68,7 +68,7 @@ def extract_composers(url):
     if not url:
         return []
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
+    r = http.get(url)
     soup = BeautifulSoup(r.content, 'html.parser')
     
     content = soup.find('div', class_='mt-pricelist')
@@ -94,7 +94,7 @@ class KpvhCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://www.kpvh.sk/sezona-2025-2026/'
-        r = requests.get(url)
+        r = http.get(url)
         soup = BeautifulSoup(r.content, 'html.parser')
 
         concert_divs = soup.find_all('div', class_='mt-i cf')
@@ -1,8 +1,8 @@
-import requests
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 URL = 'https://kultura.trnava.sk/podujatie/trnavske-organove-dni-2026'
 
@@ -41,7 +41,7 @@ class KulturaTrnavaCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        r = requests.get(URL)
+        r = http.get(URL)
         soup = BeautifulSoup(r.content, 'html.parser')
 
         anchors = soup.find_all('a', class_='js-ical', attrs={'data-date': True, 'data-name': True})
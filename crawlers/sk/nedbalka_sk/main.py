@@ -1,9 +1,9 @@
 from datetime import date as date_cls
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 MONTH_TO_NUMBER = {
     'január': 1,
@@ -62,7 +62,7 @@ class NedbalkaCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://www.nedbalka.sk/aktuality/koncerty-musica_litera/'
-        r = requests.get(url)
+        r = http.get(url)
         soup = BeautifulSoup(r.content, 'html.parser')
         return extract_concerts(soup)
 
@@ -1,10 +1,10 @@
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 from ...extractors import extract_date, extract_time
 from ...formaters import format_date
@@ -17,7 +17,7 @@ def extract_event_url(concert):
 def crawl_event_urls():
     url = 'https://podujatia.pkopresov.sk/'
     log_message('Fetching listing', event='crawler_url_fetch', url=url)
-    r = requests.get(url, timeout=20)
+    r = http.get(url, timeout=20)
     soup = BeautifulSoup(r.text, 'html.parser')
     posts_widget = soup.find('div', class_='elementor-element', attrs={'data-widget_type': 'tootoot-event-list.tiles'})
     
@@ -29,7 +29,7 @@ def crawl_event_urls():
     while True:
         url = f'https://podujatia.pkopresov.sk/wp-json/elementor-pro/v1/posts-widget?post_id=1100&element_id={data_id}&page={page}'
         log_message('Fetching listing page', event='crawler_url_fetch', url=url)
-        r = requests.get(url, timeout=20)
+        r = http.get(url, timeout=20)
         data = r.json()
         soup = BeautifulSoup(data['content'], 'html.parser')
         event_elements = soup.find_all('div', class_='tt-evt-li__event-info')
@@ -45,7 +45,7 @@ def crawl_event_urls():
 
 def extract_event_info(url):
     log_message('Fetching event detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url, timeout=20)
+    r = http.get(url, timeout=20)
     soup = BeautifulSoup(r.text, 'html.parser')
     script = soup.find('script', type='application/ld+json')
     if script is None:
@@ -1,7 +1,7 @@
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 from ...extractors import clean_string
 
@@ -40,7 +40,7 @@ def extract_concert_performances(concert_url):
     if not concert_url.startswith('https://predpredaj.zoznam.sk/sk/listky/'):
         return []
 
-    r = requests.get(concert_url, timeout=20)
+    r = http.get(concert_url, timeout=20)
     soup = BeautifulSoup(r.content, 'html.parser')
     
     title_tag = soup.find('h1')
@@ -112,7 +112,7 @@ class PredpredajCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://predpredaj.zoznam.sk/sk/kategoria/koncert/'
-        r = requests.get(url, timeout=20)
+        r = http.get(url, timeout=20)
         soup = BeautifulSoup(r.text, 'html.parser')
         concerts = soup.find_all('article')
 
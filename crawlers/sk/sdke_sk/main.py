@@ -1,8 +1,8 @@
 from datetime import datetime, timedelta
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 def extract_data_ids():
@@ -15,7 +15,7 @@ def extract_data_ids():
         current_month_str = current_month.strftime('%Y%m')
         url = f"{base_url}{current_month_str}"
         log_message('Fetching programme', event='crawler_url_fetch', url=url)
-        r = requests.get(url)
+        r = http.get(url)
         soup = BeautifulSoup(r.content, 'html.parser')
         spans_with_data_id = soup.find_all('span', attrs={'data-id': True})
         data_id_values.extend([span['data-id'] for span in spans_with_data_id])
@@ -27,7 +27,7 @@ def extract_data_ids():
 def extract_concert_data(data_id):
     url = f"https://www.sdke.sk/sk/api/{data_id}"
     log_message('Fetching event API', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
+    r = http.get(url)
     return r.json()
 
 def extract_type(path):
@@ -77,7 +77,7 @@ def extract_date_and_time(date_str):
 
 def extract_description(url):
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
+    r = http.get(url)
     soup = BeautifulSoup(r.text, 'html.parser')
     description = soup.find('div', class_='field--name-field-play-description').get_text().strip()
     return description
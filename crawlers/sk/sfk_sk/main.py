@@ -1,9 +1,9 @@
 import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 def validate_concert(concert):
@@ -54,7 +54,7 @@ def extract_concert_info(concert):
     
 def extract_description(url):
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
+    r = http.get(url)
     soup = BeautifulSoup(r.text, 'html.parser')
     div = soup.find('div', class_='richtext', attrs={'aria-readonly': 'false'})
     description = div.get_text().strip()
@@ -77,7 +77,7 @@ class SfkCrawler(BaseCrawler):
         current_date = datetime.date.today().strftime('%Y-%m-%d')
         end_date = (datetime.date.today() + datetime.timedelta(days=365)).strftime('%Y-%m-%d')
         url = f'https://www.sfk.sk/sk-sk/svc/rest/Event?start={current_date}&end={end_date}'
-        r = requests.get(url, headers={'Accept': 'application/json'})
+        r = http.get(url, headers={'Accept': 'application/json'})
 
         r_json = r.json()
         i = 0
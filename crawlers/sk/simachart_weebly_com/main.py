@@ -1,11 +1,11 @@
 import re
 from datetime import date as date_cls
 
-import requests
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 from ...extractors import clean_string, extract_city, extract_time
 
@@ -66,7 +66,7 @@ class SimachartCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        r = requests.get(URL)
+        r = http.get(URL)
         soup = BeautifulSoup(r.content, 'html.parser')
         return extract_concerts(soup)
 
@@ -2,17 +2,17 @@ import json
 import html
 import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 import pandas as pd
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 def extract_description(url):
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
+    r = http.get(url)
     soup = BeautifulSoup(r.text, 'html.parser')
     program = soup.find('div', class_='program')
     return program.text.strip()
@@ -38,7 +38,7 @@ class SkozilinaCrawler(BaseCrawler):
             url = f'https://skozilina.sk/kalendar/month/{current_year}-{current_month:02d}'
 
             log_message('Fetching concerts', event='crawler_url_fetch', url=url)
-            r = requests.get(url)
+            r = http.get(url)
             soup = BeautifulSoup(r.content, 'html.parser')
             script_tags = soup.find_all('script', type='application/ld+json')
             if len(script_tags) <= 1:
@@ -2,12 +2,12 @@ import time
 import datetime
 from concurrent.futures import ThreadPoolExecutor
 
-import requests
 import urllib3
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 def convert_date(date_str):
@@ -45,7 +45,7 @@ def get_concert_data(url: str):
     """
     Get concert data from snd.sk
     """
-    r = requests.get(url, verify=False)
+    r = http.get(url, verify=False)
     soup = BeautifulSoup(r.content, 'lxml')
     events = []
     divs = soup.find_all('div', class_='calendar-events')
@@ -58,7 +58,7 @@ def get_concert_data(url: str):
 
 def extract_description(url):
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url, verify=False, timeout=20)
+    r = http.get(url, verify=False, timeout=20)
     soup = BeautifulSoup(r.text, 'html.parser')
     description = soup.find('meta', attrs={'property': 'og:description'})
     if description and description.get('content'):
@@ -1,8 +1,8 @@
-import requests
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 from ...formaters import clean_string
 
@@ -45,7 +45,7 @@ def extract_concert_info(concert):
     
 def extract_description(url):
     log_message('Fetching concert detail', event='crawler_url_fetch', url=url)
-    r = requests.get(url)
+    r = http.get(url)
     soup = BeautifulSoup(r.content, 'html.parser')
     description = soup.find('div', class_='longtext').text.strip()
     description = clean_string(description)
@@ -67,7 +67,7 @@ class StateOperaCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://www.stateopera.sk/sk/program?filter=0'
-        r = requests.get(url)
+        r = http.get(url)
         soup = BeautifulSoup(r.content, 'html.parser')
 
         concert_divs = soup.find_all('div', attrs={'data-filter': True})
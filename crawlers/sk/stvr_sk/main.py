@@ -1,11 +1,11 @@
 import re
 from datetime import date as date_cls
 
-import requests
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 URL = 'https://devin.stvr.sk/clanky/koncerty-live'
 BASE_NAME = 'Cyklus Organových koncertov pod pyramídou'
@@ -116,11 +116,11 @@ class StvrCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        r = requests.get(URL)
+        r = http.get(URL)
         soup = BeautifulSoup(r.content, 'html.parser')
         concerts = []
         for url in extract_article_links(soup):
-            r = requests.get(url)
+            r = http.get(url)
             article_soup = BeautifulSoup(r.content, 'html.parser')
             concert = extract_concert(article_soup, url)
             if concert is not None:
@@ -1,11 +1,11 @@
 import esprima
 from bs4 import BeautifulSoup
-import requests
 import re
 
 import pandas as pd
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 ALREADY_PARSED_ORGANIZERS = [
@@ -76,7 +76,7 @@ def get_slug(df_out, title):
 
 def get_classical_concerts():
     url = 'https://tpskprodcdn.azureedge.net/Grid/Data?v=1&lang=SK'
-    r = requests.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+    r = http.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
     text = r.text
     ast = esprima.parse(text)
     
@@ -138,6 +138,7 @@ class TicketportalCrawler(BaseCrawler):
         source_url='https://www.ticketportal.sk',
         columns=['title', 'date', 'time_from', 'venue', 'city', 'url', 'organizer_url', 'description'],
         upload_target='potential',
+        bulk_upload=True,
         front_fields=[
             ('source_url', 'https://www.ticketportal.sk'),
             ('source', 'Ticketportal.sk'),
@@ -151,7 +152,7 @@ class TicketportalCrawler(BaseCrawler):
         for _, row in df.iterrows():
             url = f'https://www.ticketportal.sk/event/{row["slug"]}'
             log_message('Processing URL', event='crawler_url_processing', url=url)
-            r = requests.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
+            r = http.get(url, headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"})
             soup = BeautifulSoup(r.text, 'html.parser')
             description = extract_description(soup)
             divs = soup.find_all('div', itemtype='http://schema.org/Event')
@@ -1,6 +1,6 @@
-import requests
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 def validate_concert(concert):
     if concert['Event']['IsSeasonTicketEvent']:
@@ -35,7 +35,7 @@ class TootootCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://api.tootoot.co/api/event/search?categories=548057368d4031089cea31f6&cityId=&page=0&perPage=99'
-        r = requests.get(url)
+        r = http.get(url)
         concerts = r.json()
         concerts = [c for c in concerts if validate_concert(c)]
         return [extract_concert_info(concert) for concert in concerts]
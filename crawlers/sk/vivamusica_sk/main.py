@@ -1,10 +1,10 @@
-import requests
 import re
 from datetime import date as date_cls, datetime
 
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 
 def convert_date(date_str, year):
     """
@@ -42,7 +42,7 @@ def find_concert_links(soup):
     return concert_links
     
 def extract_concert_info(url, year):
-    r = requests.get(url, timeout=20)
+    r = http.get(url, timeout=20)
     soup = BeautifulSoup(r.content, 'html.parser')
     main_text = soup.find('div', class_='main-text') or soup
     
@@ -91,7 +91,7 @@ class VivaMusicaCrawler(BaseCrawler):
 
     def scrape(self):
         url = 'https://www.vivamusica.sk'
-        r = requests.get(url, timeout=20)
+        r = http.get(url, timeout=20)
         soup = BeautifulSoup(r.content, 'html.parser')
         year = extract_program_year(soup)
 
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -111,7 +112,7 @@ def fetch_catalogue(session):
 
 def fetch_description(event_id):
     url = urljoin(SOURCE_URL, f'concert-info/{event_id}')
-    response = requests.get(url, headers=HEADERS, timeout=20)
+    response = http.get(url, headers=HEADERS, timeout=20)
     response.raise_for_status()
     return parse_detail_description(response.text)
 
@@ -162,7 +163,7 @@ def event_record(event, descriptions):
 
 
 def get_concerts():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     try:
         events = fetch_catalogue(session)
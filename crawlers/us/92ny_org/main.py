@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -86,7 +86,7 @@ def card_record_data(card):
 
 
 def scrape_concerts(session=None):
-    session = session or requests.Session()
+    session = session or http.create_session()
     session.headers.update(HEADERS)
     response = session.get(LISTING_URL, timeout=45)
     response.raise_for_status()
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -150,7 +151,7 @@ def fetch_page(session, page, year):
 
 
 def scrape_concerts(session=None):
-    session = session or requests.Session()
+    session = session or http.create_session()
     session.headers.update(HEADERS)
     records = []
     # The index's oldest result is from 2020. Year windows avoid Algolia's
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -37,7 +38,7 @@ def clean_text(value):
 
 
 def new_session():
-    session = requests.Session()
+    session = http.create_session()
     session.headers.update(HEADERS)
     return session
 
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -39,7 +40,7 @@ def clean_html(value):
 
 
 def fetch_content(path):
-    response = requests.get(
+    response = http.get(
         API_URL,
         params={'path': path},
         headers=HEADERS,
@@ -5,6 +5,7 @@ import requests
 from bs4 import BeautifulSoup, Tag
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -221,7 +222,7 @@ class OrchestraLlsEduCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         records = []
         for url, parser in ((UPCOMING_URL, upcoming_records), (PAST_URL, past_records)):
@@ -7,6 +7,7 @@ import requests
 from bs4 import BeautifulSoup, Tag
 
 from ...base import BaseCrawler, CrawlerConfig
+from ... import http
 from observability import log_message
 
 
@@ -182,7 +183,7 @@ class YelenaGrinbergComCrawler(BaseCrawler):
     )
 
     def scrape(self):
-        session = requests.Session()
+        session = http.create_session()
         session.headers.update(HEADERS)
         records = []
         for url in archive_urls(session):
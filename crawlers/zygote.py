@@ -0,0 +1,165 @@
+"""Fork crawler processes from a parent that has already imported their dependencies.
+
+Starting every crawler in a fresh interpreter costs more than many crawlers'
+own work: pandas, bs4, lxml, requests, curl_cffi and dotenv are imported
+again, and ``crawlers.extractors`` reads its city lists again.  A
+``Zygote`` is a process that does all of that once (``PRELOAD_MODULES`` and
+``WARM_UP``) and then forks one child per crawler.  Each crawler still runs
+in its own process, but starts with everything imported, sharing the
+preloaded pages copy-on-write.
+
+The zygote reaps its children itself, so it reports each child's exit code
+and peak RSS (from ``wait4``), also for children that were killed.  It is
+started with ``spawn``, so it holds no threads or sockets of the scheduler.
+"""
+
+import importlib
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+import os
+import signal
+import sys
+import time
+import traceback
+from typing import Any, Callable
+
+
+PRELOAD_MODULES = (
+    'dotenv',
+    'requests',
+    'curl_cffi.requests',
+    'bs4',
+    'lxml.html',
+    'pandas',
+    'psycopg2',
+    'observability',
+    'crawlers.base',
+    'crawlers.dates',
+    'crawlers.extractors',
+    'crawlers.parsing',
+    'crawlers.structured',
+)
+# Cached loaders whose data every child would otherwise read again.
+WARM_UP = (
+    'crawlers.extractors:cities_by_postal_code',
+    'crawlers.extractors:city_matcher',
+)
+POLL_SECONDS = 0.05
+logger = logging.getLogger(__name__)
+
+
+def _preload(modules: tuple[str, ...], warm_up: tuple[str, ...]) -> None:
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError as error:
+            logger.warning(
+                'Could not preload module',
+                extra={'event': 'crawler_zygote_preload_failed', 'module_name': name, 'error_message': str(error)},
+            )
+    for path in warm_up:
+        module_name, function_name = path.split(':')
+        try:
+            getattr(importlib.import_module(module_name), function_name)()
+        except Exception as error:
+            logger.warning(
+                'Could not warm up loader',
+                extra={'event': 'crawler_zygote_preload_failed', 'module_name': path, 'error_message': str(error)},
+            )
+
+
+def _run_child(target: Callable[[str], None], argument: str) -> None:
+    """Body of a forked child; never returns."""
+    code = 1
+    try:
+        target(argument)
+        code = 0
+    except SystemExit as exit:
+        if exit.code is None or isinstance(exit.code, int):
+            code = exit.code or 0
+        else:
+            print(exit.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _serve(connection: Connection, modules: tuple[str, ...], warm_up: tuple[str, ...]) -> None:
+    """Zygote main loop: fork children on request and report how they ended."""
+    _preload(modules, warm_up)
+    children: dict[int, Any] = {}
+    stopping = False
+    while not (stopping and not children):
+        if not stopping and connection.poll(POLL_SECONDS):
+            try:
+                message = connection.recv()
+            except EOFError:
+                # The scheduler is gone and nobody will collect the results.
+                for pid in children:
+                    os.kill(pid, signal.SIGKILL)
+                message = ('stop',)
+            if message[0] == 'run':
+                _, key, target, argument = message
+                pid = os.fork()
+                if pid == 0:
+                    connection.close()
+                    _run_child(target, argument)
+                children[pid] = key
+                connection.send(('started', key, pid))
+            else:
+                stopping = True
+        elif stopping:
+            time.sleep(POLL_SECONDS)
+        while children:
+            pid, status, usage = os.wait4(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            key = children.pop(pid)
+            try:
+                # ru_maxrss is in kilobytes on Linux.
+                connection.send(('exited', key, os.waitstatus_to_exitcode(status), usage.ru_maxrss * 1024))
+            except OSError:
+                pass
+
+
+class Zygote:
+    """Handle on a zygote process.
+
+    ``start()`` asks it to fork a child that runs ``target(argument)``; the
+    replies arrive on ``connection`` as ``('started', key, pid)`` and
+    ``('exited', key, exit_code, peak_rss_bytes)``.
+    """
+
+    def __init__(self, modules: tuple[str, ...] = PRELOAD_MODULES, warm_up: tuple[str, ...] = WARM_UP):
+        context = multiprocessing.get_context('spawn')
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_serve, args=(child_connection, tuple(modules), tuple(warm_up)), name='crawler-zygote'
+        )
+        self.process.start()
+        child_connection.close()
+        self.run_count = 0
+
+    def start(self, key: Any, target: Callable[[str], None], argument: str) -> None:
+        self.connection.send(('run', key, target, argument))
+        self.run_count += 1
+
+    def receive(self) -> tuple:
+        return self.connection.recv()
+
+    def stop(self) -> None:
+        """Let the zygote exit once its running children have exited."""
+        try:
+            self.connection.send(('stop',))
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self.stop()
+        self.process.join()
+        self.process.close()
+        self.connection.close()
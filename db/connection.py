@@ -0,0 +1,196 @@
+"""Shared, bounded Postgres connection pools for application processes.
+
+Crawlers, analyzers, agent tools and the crawler registry borrow connections
+from one pool per process instead of opening a fresh authenticated TLS session
+for every upload or lookup.  Read-only callers use a separate pool whose
+sessions reject writes and may point at a replica through ``DB_READONLY_*``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2 import pool as psycopg2_pool
+
+
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_POOL_TIMEOUT_SECONDS = 60
+DEFAULT_STATEMENT_TIMEOUT_MS = 300_000
+POSTGRES_KEEPALIVES_IDLE_SECONDS = 60
+POSTGRES_KEEPALIVES_INTERVAL_SECONDS = 20
+POSTGRES_KEEPALIVES_COUNT = 3
+
+_PARAMETER_ENVIRONMENT = {
+    "dbname": "DB_NAME",
+    "user": "DB_USER",
+    "password": "DB_PASS",
+    "host": "DB_HOST",
+    "port": "DB_PORT",
+}
+_pools: dict[tuple, BoundedConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _non_negative_int(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError as error:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from error
+    if parsed < 0:
+        raise ValueError(f"{name} must not be negative, got {parsed}")
+    return parsed
+
+
+def connection_parameters(*, readonly: bool = False) -> dict:
+    """Build psycopg2 keyword arguments from the DB_* environment.
+
+    Read-only parameters fall back to the primary settings for every
+    ``DB_READONLY_*`` variable that is not set.
+    """
+    parameters = {key: os.getenv(name) for key, name in _PARAMETER_ENVIRONMENT.items()}
+    if readonly:
+        for key, name in _PARAMETER_ENVIRONMENT.items():
+            override = os.getenv(name.replace("DB_", "DB_READONLY_", 1))
+            if override:
+                parameters[key] = override
+    statement_timeout = _non_negative_int("DB_STATEMENT_TIMEOUT_MS", DEFAULT_STATEMENT_TIMEOUT_MS)
+    options = [f"-c statement_timeout={statement_timeout}"]
+    if readonly:
+        options.append("-c default_transaction_read_only=on")
+    return {
+        **parameters,
+        "keepalives": 1,
+        "keepalives_idle": POSTGRES_KEEPALIVES_IDLE_SECONDS,
+        "keepalives_interval": POSTGRES_KEEPALIVES_INTERVAL_SECONDS,
+        "keepalives_count": POSTGRES_KEEPALIVES_COUNT,
+        "options": " ".join(options),
+    }
+
+
+class BoundedConnectionPool:
+    """Thread-safe pool that waits for a free connection instead of failing.
+
+    At most ``max_connections`` connections are open at once.  Idle
+    connections stay open for the next borrower; broken ones are discarded.
+    A borrower that waits longer than ``timeout`` seconds gets a
+    ``PoolError``, so a thread that borrows again while holding the last
+    connection fails instead of waiting for itself forever.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        timeout: float = DEFAULT_POOL_TIMEOUT_SECONDS,
+        **parameters,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError(f"max_connections must be positive, got {max_connections}")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.closed = False
+        self._parameters = parameters
+        self._idle: list = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def getconn(self):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise psycopg2_pool.PoolError(
+                f"no free connection within {self.timeout:g} seconds "
+                f"(all {self.max_connections} are borrowed)"
+            )
+        try:
+            with self._lock:
+                if self.closed:
+                    raise psycopg2_pool.PoolError("connection pool is closed")
+                while self._idle:
+                    conn = self._idle.pop()
+                    if not conn.closed:
+                        return conn
+            return psycopg2.connect(**self._parameters)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn) -> None:
+        try:
+            if conn.closed:
+                return
+            try:
+                status = conn.info.transaction_status
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    conn.close()
+                    return
+                if status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                conn.close()
+                return
+            with self._lock:
+                if not self.closed:
+                    self._idle.append(conn)
+                    return
+            conn.close()
+        finally:
+            self._slots.release()
+
+    def closeall(self) -> None:
+        with self._lock:
+            self.closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def get_pool(*, readonly: bool = False) -> BoundedConnectionPool:
+    """Return this process's pool for the current environment settings."""
+    parameters = connection_parameters(readonly=readonly)
+    # Forked crawler workers must never share sockets with their parent.
+    key = (os.getpid(), readonly, tuple(sorted(parameters.items())))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            max_connections = _non_negative_int("DB_POOL_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+            if max_connections < 2:
+                # A CrawlerRegistry holds its connection for its lifetime while
+                # the same thread borrows others.
+                raise ValueError(f"DB_POOL_MAX_CONNECTIONS must be at least 2, got {max_connections}")
+            pool = BoundedConnectionPool(
+                max_connections,
+                _non_negative_int("DB_POOL_TIMEOUT_SECONDS", DEFAULT_POOL_TIMEOUT_SECONDS),
+                **parameters,
+            )
+            _pools[key] = pool
+        return pool
+
+
+@contextmanager
+def connection(*, readonly: bool = False) -> Iterator:
+    """Borrow a pooled connection and return it when the block exits.
+
+    An open transaction is rolled back on the way back into the pool, so
+    callers still commit explicitly.
+    """
+    pool = get_pool(readonly=readonly)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def close_pools() -> None:
+    """Close every pool owned by this process."""
+    with _pools_lock:
+        for key, pool in list(_pools.items()):
+            if key[0] == os.getpid() and not pool.closed:
+                pool.closeall()
+            del _pools[key]
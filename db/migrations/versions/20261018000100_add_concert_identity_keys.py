@@ -0,0 +1,114 @@
+"""add unique title/date/url/time_from identity keys to uploaded events
+
+Revision ID: 20261018000100
+Revises: 20260808000200
+Create Date: 2026-10-18 00:01:00
+"""
+
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018000100"
+down_revision: Union[str, None] = "20260808000200"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONCERT_CHILD_TABLES = (
+    "classical_concert_composer",
+    "classical_concert_work",
+    "concert_program_analysis",
+    "classical_concert_change",
+)
+BACKUP_SUFFIX = "_identity_duplicates"
+# Parents before children, so restored rows satisfy foreign keys.
+BACKED_UP_TABLES = ("classical_concert", *CONCERT_CHILD_TABLES, "potential_event")
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _duplicate_ids(connection, table: str) -> list[int]:
+    return connection.execute(
+        sa.text(
+            f"""
+            SELECT id FROM {table} AS duplicate
+            WHERE EXISTS (
+                SELECT 1 FROM {table} AS kept
+                WHERE kept.title = duplicate.title
+                  AND kept.date = duplicate.date
+                  AND kept.url = duplicate.url
+                  AND (kept.time_from = duplicate.time_from
+                       OR kept.time_from IS NULL AND duplicate.time_from IS NULL)
+                  AND kept.id < duplicate.id
+            )
+            ORDER BY id
+            """
+        )
+    ).scalars().all()
+
+
+def _move_to_backup(connection, table: str, column: str, row_id: int) -> None:
+    connection.execute(
+        sa.text(f"INSERT INTO {table}{BACKUP_SUFFIX} SELECT * FROM {table} WHERE {column} = :id"),
+        {"id": row_id},
+    )
+    connection.execute(sa.text(f"DELETE FROM {table} WHERE {column} = :id"), {"id": row_id})
+
+
+def _remove_duplicate_events(connection) -> None:
+    """Keep the oldest row of every (title, date, url, time_from) group.
+
+    Earlier uploads inserted repeated rows from a single scrape batch.  The
+    oldest row is the one the programme analyzer has been working on, so the
+    later copies and their dependent analysis rows are removed.  Same-day
+    repeat performances differ in time_from and are all kept.
+
+    Removed rows are moved to ``<table>_identity_duplicates`` tables, which
+    ``downgrade()`` restores from; drop them once nothing is missed.
+    """
+    for table in BACKED_UP_TABLES:
+        connection.execute(sa.text(f"CREATE TABLE {table}{BACKUP_SUFFIX} AS SELECT * FROM {table} WHERE 1 = 0"))
+    concert_ids = _duplicate_ids(connection, "classical_concert")
+    for concert_id in concert_ids:
+        for table in CONCERT_CHILD_TABLES:
+            _move_to_backup(connection, table, "classical_concert_id", concert_id)
+        _move_to_backup(connection, "classical_concert", "id", concert_id)
+    event_ids = _duplicate_ids(connection, "potential_event")
+    for event_id in event_ids:
+        _move_to_backup(connection, "potential_event", "id", event_id)
+    logger.info(
+        "Moved %d duplicate classical_concert rows %s and %d duplicate potential_event rows %s to *%s tables",
+        len(concert_ids), list(concert_ids), len(event_ids), list(event_ids), BACKUP_SUFFIX,
+    )
+
+
+def _restore_duplicate_events(connection) -> None:
+    for table in BACKED_UP_TABLES:
+        connection.execute(sa.text(f"INSERT INTO {table} SELECT * FROM {table}{BACKUP_SUFFIX}"))
+        connection.execute(sa.text(f"DROP TABLE {table}{BACKUP_SUFFIX}"))
+
+
+def upgrade() -> None:
+    _remove_duplicate_events(op.get_bind())
+    # Events without a start time are still unique per title, date and URL.
+    op.create_unique_constraint(
+        "uq_classical_concert_identity",
+        "classical_concert",
+        ["title", "date", "url", "time_from"],
+        postgresql_nulls_not_distinct=True,
+    )
+    op.create_unique_constraint(
+        "uq_potential_event_identity",
+        "potential_event",
+        ["title", "date", "url", "time_from"],
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_potential_event_identity", "potential_event", type_="unique")
+    op.drop_constraint("uq_classical_concert_identity", "classical_concert", type_="unique")
+    _restore_duplicate_events(op.get_bind())
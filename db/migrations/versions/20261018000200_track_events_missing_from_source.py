@@ -0,0 +1,41 @@
+"""track upcoming events that disappeared from their source
+
+Revision ID: 20261018000200
+Revises: 20261018000100
+Create Date: 2026-10-18 00:02:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018000200"
+down_revision: Union[str, None] = "20261018000100"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "classical_concert",
+        sa.Column("missing_from_source_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_classical_concert_source_url",
+        "classical_concert",
+        ["source", "url"],
+    )
+    op.create_index(
+        "ix_classical_concert_missing_from_source",
+        "classical_concert",
+        ["source"],
+        postgresql_where=sa.text("missing_from_source_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_classical_concert_missing_from_source", table_name="classical_concert")
+    op.drop_index("ix_classical_concert_source_url", table_name="classical_concert")
+    op.drop_column("classical_concert", "missing_from_source_at")
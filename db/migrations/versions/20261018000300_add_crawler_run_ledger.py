@@ -0,0 +1,57 @@
+"""add crawler run ledger
+
+Revision ID: 20261018000300
+Revises: 20261018000200
+Create Date: 2026-10-18 00:03:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018000300"
+down_revision: Union[str, None] = "20261018000200"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawler_run",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column("crawler", sa.String(), nullable=False),
+        sa.Column("source", sa.Text()),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("scrape_seconds", sa.Float()),
+        sa.Column("prepare_seconds", sa.Float()),
+        sa.Column("upload_seconds", sa.Float()),
+        sa.Column("request_count", sa.Integer()),
+        sa.Column("bytes_received", sa.BigInteger()),
+        sa.Column("record_count", sa.Integer()),
+        sa.Column("inserted_count", sa.Integer()),
+        sa.Column("skipped_count", sa.Integer()),
+        sa.Column("peak_memory_bytes", sa.BigInteger()),
+        sa.Column("error_class", sa.String()),
+        sa.Column("error_message", sa.Text()),
+        sa.CheckConstraint("status IN ('succeeded','failed')", name="ck_crawler_run_status"),
+    )
+    op.create_index("ix_crawler_run_started_at", "crawler_run", ["started_at"])
+    op.create_index("ix_crawler_run_crawler_started_at", "crawler_run", ["crawler", "started_at"])
+    op.create_index(
+        "ix_crawler_run_failed",
+        "crawler_run",
+        ["started_at"],
+        postgresql_where=sa.text("status <> 'succeeded'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_crawler_run_failed", table_name="crawler_run")
+    op.drop_index("ix_crawler_run_crawler_started_at", table_name="crawler_run")
+    op.drop_index("ix_crawler_run_started_at", table_name="crawler_run")
+    op.drop_table("crawler_run")
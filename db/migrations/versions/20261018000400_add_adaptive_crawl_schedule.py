@@ -0,0 +1,38 @@
+"""add adaptive crawl schedule
+
+Revision ID: 20261018000400
+Revises: 20261018000300
+Create Date: 2026-10-18 00:04:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "20261018000400"
+down_revision: Union[str, None] = "20261018000300"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("crawler_run", sa.Column("change_fraction", sa.Float(), nullable=True))
+    op.create_table(
+        "crawler_schedule",
+        sa.Column("crawler", sa.String(), primary_key=True),
+        sa.Column("interval_seconds", sa.Float(), nullable=False),
+        sa.Column("change_rate", sa.Float()),
+        sa.Column("last_run_at", sa.DateTime(timezone=True)),
+        sa.Column("next_run_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.CheckConstraint("interval_seconds > 0", name="ck_crawler_schedule_interval"),
+    )
+    op.create_index("ix_crawler_schedule_next_run_at", "crawler_schedule", ["next_run_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_crawler_schedule_next_run_at", table_name="crawler_schedule")
+    op.drop_table("crawler_schedule")
+    op.drop_column("crawler_run", "change_fraction")
@@ -0,0 +1,31 @@
+"""add crawler run budget_exceeded status
+
+Revision ID: 20261018000500
+Revises: 20261018000400
+Create Date: 2026-10-18 00:05:00
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "20261018000500"
+down_revision: Union[str, None] = "20261018000400"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("ck_crawler_run_status", "crawler_run", type_="check")
+    op.create_check_constraint(
+        "ck_crawler_run_status",
+        "crawler_run",
+        "status IN ('succeeded','failed','budget_exceeded')",
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE crawler_run SET status = 'failed' WHERE status = 'budget_exceeded'")
+    op.drop_constraint("ck_crawler_run_status", "crawler_run", type_="check")
+    op.create_check_constraint("ck_crawler_run_status", "crawler_run", "status IN ('succeeded','failed')")
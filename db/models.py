@@ -5,6 +5,7 @@ from sqlalchemy import (
     Column,
     Date,
     DateTime,
+    Float,
     ForeignKey,
     Integer,
     MetaData,
@@ -36,6 +37,14 @@ class ClassicalConcert(Base):
             "country_code_resolved IS NULL OR country_code_resolved ~ '^[A-Z]{2}$'",
             name="ck_classical_concert_country_code_resolved",
         ),
+        UniqueConstraint(
+            "title",
+            "date",
+            "url",
+            "time_from",
+            name="uq_classical_concert_identity",
+            postgresql_nulls_not_distinct=True,
+        ),
         Index("ix_classical_concert_date_time_id", "date", "time_from", "id"),
         Index(
             "ix_classical_concert_country_date_time_id",
@@ -50,6 +59,12 @@ class ClassicalConcert(Base):
             "city_id",
             "date",
         ),
+        Index("ix_classical_concert_source_url", "source", "url"),
+        Index(
+            "ix_classical_concert_missing_from_source",
+            "source",
+            postgresql_where=text("missing_from_source_at IS NOT NULL"),
+        ),
     )
 
     id = Column(Integer, primary_key=True)
@@ -75,6 +90,7 @@ class ClassicalConcert(Base):
     event_status = Column(String, nullable=False, server_default="scheduled")
     event_status_updated_at = Column(DateTime(timezone=True))
     last_verified_at = Column(DateTime(timezone=True))
+    missing_from_source_at = Column(DateTime(timezone=True))
 
 
 class PotentialEvent(Base):
@@ -84,6 +100,14 @@ class PotentialEvent(Base):
             "country_code_resolved IS NULL OR country_code_resolved ~ '^[A-Z]{2}$'",
             name="ck_potential_event_country_code_resolved",
         ),
+        UniqueConstraint(
+            "title",
+            "date",
+            "url",
+            "time_from",
+            name="uq_potential_event_identity",
+            postgresql_nulls_not_distinct=True,
+        ),
         Index("ix_potential_event_city_id", "city_id"),
     )
 
@@ -433,3 +457,52 @@ class CrawlerSourceSeed(Base):
     sha256 = Column(String(64), nullable=False)
     row_count = Column(Integer, nullable=False)
     applied_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class CrawlerRun(Base):
+    __tablename__ = "crawler_run"
+    __table_args__ = (
+        CheckConstraint("status IN ('succeeded', 'failed', 'budget_exceeded')", name="ck_crawler_run_status"),
+        Index("ix_crawler_run_started_at", "started_at"),
+        Index("ix_crawler_run_crawler_started_at", "crawler", "started_at"),
+        Index(
+            "ix_crawler_run_failed",
+            "started_at",
+            postgresql_where=text("status <> 'succeeded'"),
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    crawler = Column(String, nullable=False)
+    source = Column(Text)
+    status = Column(String, nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=False)
+    duration_seconds = Column(Float, nullable=False)
+    scrape_seconds = Column(Float)
+    prepare_seconds = Column(Float)
+    upload_seconds = Column(Float)
+    request_count = Column(Integer)
+    bytes_received = Column(BigInteger)
+    record_count = Column(Integer)
+    inserted_count = Column(Integer)
+    skipped_count = Column(Integer)
+    peak_memory_bytes = Column(BigInteger)
+    error_class = Column(String)
+    error_message = Column(Text)
+    change_fraction = Column(Float)
+
+
+class CrawlerSchedule(Base):
+    __tablename__ = "crawler_schedule"
+    __table_args__ = (
+        CheckConstraint("interval_seconds > 0", name="ck_crawler_schedule_interval"),
+        Index("ix_crawler_schedule_next_run_at", "next_run_at"),
+    )
+
+    crawler = Column(String, primary_key=True)
+    interval_seconds = Column(Float, nullable=False)
+    change_rate = Column(Float)
+    last_run_at = Column(DateTime(timezone=True))
+    next_run_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -1,16 +1,19 @@
 import schedule
 import time
-import importlib
 import logging
 import os
 import sys
-from pathlib import Path
+from datetime import UTC, datetime
 
+from crawlers import scheduling
+from crawlers.executor import ExecutorConfig, run_crawlers
+from crawlers.manifest import load_manifest
 from deployment.scraper_updater import ScraperUpdater, UpdaterConfig
 from observability import configure_logging
 
 
 RUN_JOBS_ON_STARTUP_ENV = "RUN_JOBS_ON_STARTUP"
+DEFAULT_SCHEDULE_TICK_MINUTES = 15
 logger = logging.getLogger(__name__)
 
 
@@ -20,24 +23,12 @@ def should_run_jobs_on_startup():
 
 
 def discover_crawler_modules():
-    """Discover and import all crawler main functions"""
-    crawler_modules = []
-    crawlers_dir = Path(__file__).parent / 'crawlers'
-    
-    for main_file in sorted(crawlers_dir.glob('*/*/main.py')):
-        parts = main_file.relative_to(crawlers_dir).with_suffix('').parts
-        module_path = 'crawlers.' + '.'.join(parts)
-        try:
-            module = importlib.import_module(module_path)
-            if hasattr(module, 'main'):
-                crawler_modules.append(module.main)
-        except ImportError as e:
-            logger.exception(
-                "Failed to import crawler module",
-                extra={"event": "crawler_import_failed", "crawler_module": module_path},
-            )
-    
-    return crawler_modules
+    """Return the module paths of all crawler entry points.
+
+    Paths come from the static crawler manifest; modules are imported only
+    by the crawler processes, so a broken crawler only fails its own run.
+    """
+    return [entry.module for entry in load_manifest()]
 
 def run_job(main_function):
     try:
@@ -48,14 +39,57 @@ def run_job(main_function):
             extra={"event": "job_failed", "job": main_function.__name__},
         )
 
-def scheduler_main() -> None:
-    configure_logging("classical-bot")
-    # Discover all crawler modules
-    crawler_functions = discover_crawler_modules()
-    
+def run_daily_pipeline(updater: ScraperUpdater, crawler_modules: list[str]) -> None:
+    """Run the given crawlers in parallel, then classify potential events."""
     # Classify broad-source potential events after the crawlers.
     from analyzers.analyze_potential_events import main as analyze_potential_events_main
-    crawler_functions.append(analyze_potential_events_main)
+
+    started_at = datetime.now(UTC)
+    updater.begin_daily_pipeline()
+    try:
+        results = run_crawlers(crawler_modules, ExecutorConfig.from_environment())
+        if scheduling.adaptive_enabled():
+            def update_crawl_schedule():
+                # Crawlers killed or crashed before writing a ledger row are rescheduled too.
+                slugs = {entry.module: entry.slug for entry in load_manifest()}
+                outcomes = {
+                    slugs[result.module]: result.status == "succeeded"
+                    for result in results
+                    if result.module in slugs
+                }
+                scheduling.update_schedule(started_at, outcomes=outcomes)
+
+            run_job(update_crawl_schedule)
+        run_job(analyze_potential_events_main)
+    finally:
+        updater.finish_daily_pipeline()
+
+
+def run_due_crawlers(updater: ScraperUpdater) -> None:
+    """Run the crawlers that the adaptive schedule says are due."""
+    try:
+        due = scheduling.due_crawlers(load_manifest(), scheduling.load_schedule(), datetime.now(UTC))
+    except Exception:
+        # Without the database there is nothing to upload to either.
+        logger.exception("Could not load the crawl schedule", extra={"event": "crawl_schedule_failed"})
+        return
+    if not due:
+        return
+    logger.info(
+        "Running due crawlers",
+        extra={"event": "crawl_schedule_due", "crawler_count": len(due)},
+    )
+    run_daily_pipeline(updater, [entry.module for entry in due])
+
+
+def schedule_tick_minutes() -> int:
+    value = os.getenv("CRAWLER_SCHEDULE_TICK_MINUTES", "").strip()
+    return int(value) if value else DEFAULT_SCHEDULE_TICK_MINUTES
+
+
+def scheduler_main() -> None:
+    configure_logging("classical-bot")
+    crawler_modules = discover_crawler_modules()
     updater = ScraperUpdater(UpdaterConfig.from_environment())
     
     if should_run_jobs_on_startup():
@@ -63,31 +97,21 @@ def scheduler_main() -> None:
             "Running all jobs immediately on startup",
             extra={"event": "startup_jobs_enabled"},
         )
-        updater.begin_daily_pipeline()
-        try:
-            for func in crawler_functions:
-                run_job(func)
-        finally:
-            updater.finish_daily_pipeline()
+        run_daily_pipeline(updater, crawler_modules)
     else:
         logger.info(
             "Skipping immediate job run",
             extra={"event": "startup_jobs_skipped"},
         )
     
-    logger.info("Scheduling crawlers", extra={"event": "scheduler_started"})
-    schedule.every().day.at("00:00").do(updater.begin_daily_pipeline)
-    # Schedule all crawlers to run at 2-minute intervals starting at 00:01.
-    for i, func in enumerate(crawler_functions):
-        n = 1 + 2*i
-        start_minute = n % 60
-        start_hour = n // 60
-        schedule_time = f"{start_hour:02d}:{start_minute:02d}"  # Format: 01:00, 01:02, etc.
-        schedule.every().day.at(schedule_time).do(lambda f=func: run_job(f))
-
-    final_job_number = 1 + 2 * len(crawler_functions)
-    final_time = f"{final_job_number // 60:02d}:{final_job_number % 60:02d}"
-    schedule.every().day.at(final_time).do(updater.finish_daily_pipeline)
+    logger.info(
+        "Scheduling crawlers",
+        extra={"event": "scheduler_started", "adaptive": scheduling.adaptive_enabled()},
+    )
+    if scheduling.adaptive_enabled():
+        schedule.every(schedule_tick_minutes()).minutes.do(run_due_crawlers, updater)
+    else:
+        schedule.every().day.at("00:01").do(run_daily_pipeline, updater, crawler_modules)
     schedule.every(5).minutes.do(updater.request_update_check)
     
     while True:
@@ -95,10 +119,19 @@ def scheduler_main() -> None:
         time.sleep(1)
 
 
+def full_pass_main() -> None:
+    """Run every crawler once now, whatever the schedule says."""
+    configure_logging("classical-bot")
+    run_daily_pipeline(ScraperUpdater(UpdaterConfig.from_environment()), discover_crawler_modules())
+
+
 def main() -> None:
     if sys.argv[1:] == ["--scheduler-only"]:
         scheduler_main()
         return
+    if sys.argv[1:] == ["--full-pass"]:
+        full_pass_main()
+        return
     if sys.argv[1:]:
         raise SystemExit(f"Unknown arguments: {' '.join(sys.argv[1:])}")
 
@@ -4,6 +4,7 @@ import json
 import os
 import tempfile
 import unittest
+from contextlib import contextmanager
 from datetime import date, time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -14,6 +15,22 @@ from analyzers import analyze_concert_programs as analyzer
 from automation.codex_auth import CodexAuthRequiredError
 
 
+def pooled(*connections):
+    """Stand in for the pooled get_connection, lending each connection once."""
+    available = iter(connections)
+
+    @contextmanager
+    def borrow():
+        conn = next(available)
+        try:
+            yield conn
+        finally:
+            borrow.returned.append(conn)
+
+    borrow.returned = []
+    return borrow
+
+
 def not_needed_location():
     return {
         "status": "not_needed", "existing_city_id": None,
@@ -66,32 +83,6 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
             )
         persist_error.assert_not_called()
 
-    @patch.object(analyzer.psycopg2, "connect")
-    def test_database_connections_detect_disappeared_clients_quickly(self, connect):
-        with patch.dict(
-            os.environ,
-            {
-                "DB_NAME": "classical",
-                "DB_USER": "bot",
-                "DB_PASS": "secret",
-                "DB_HOST": "postgres",
-                "DB_PORT": "5432",
-            },
-        ):
-            analyzer.get_connection()
-
-        connect.assert_called_once_with(
-            dbname="classical",
-            user="bot",
-            password="secret",
-            host="postgres",
-            port="5432",
-            keepalives=1,
-            keepalives_idle=60,
-            keepalives_interval=20,
-            keepalives_count=3,
-        )
-
     def test_normalize_handles_diacritics_and_punctuation(self):
         self.assertEqual(normalize("  Antonín DVOŘÁK — op. 95 "), "antonin dvorak op 95")
 
@@ -299,6 +290,7 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
         self.assertIn("c.program_analysis_eligible = true", query)
         self.assertIn("c.source_url", query)
         self.assertIn("c.date >= CURRENT_DATE", query)
+        self.assertIn("c.missing_from_source_at IS NULL", query)
         self.assertIn("a.attempts < %s", query)
         self.assertIn("make_interval(days => %s)", query)
         self.assertIn("make_interval(hours => %s)", query)
@@ -600,8 +592,8 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
             patch.object(
                 analyzer,
                 "get_connection",
-                side_effect=[coordinator_conn, worker_conn],
-            ),
+                pooled(coordinator_conn, worker_conn),
+            ) as get_connection,
             patch.object(analyzer, "select_concerts", return_value=[concert]),
             patch.object(analyzer, "validate_model", new_callable=AsyncMock),
             patch.object(analyzer, "run_agent", new_callable=AsyncMock, return_value=result),
@@ -616,15 +608,14 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
         persist_result.assert_not_called()
         coordinator_conn.commit.assert_not_called()
         worker_conn.commit.assert_not_called()
-        coordinator_conn.close.assert_called_once()
-        worker_conn.close.assert_called_once()
+        self.assertEqual(get_connection.returned, [worker_conn, coordinator_conn])
 
     def test_committed_batch_refuses_advisory_lock_contention(self):
         conn = MagicMock()
         with tempfile.TemporaryDirectory() as temporary:
             result_path = Path(temporary) / "batch-result.json"
             with (
-                patch.object(analyzer, "get_connection", return_value=conn),
+                patch.object(analyzer, "get_connection", pooled(conn)) as get_connection,
                 patch.object(analyzer, "acquire_lock", return_value=False),
                 self.assertRaisesRegex(RuntimeError, "already running"),
             ):
@@ -632,7 +623,7 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
             payload = json.loads(result_path.read_text(encoding="utf-8"))
 
         self.assertEqual(payload["status"], "fatal")
-        conn.close.assert_called_once()
+        self.assertEqual(get_connection.returned, [conn])
 
     def test_output_schema_enforces_paired_entities(self):
         programme_group = analyzer.OUTPUT_SCHEMA["properties"]["programme_groups"]["items"]
@@ -1129,7 +1120,7 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
 
         with (
             patch.object(analyzer, "run_agent", new=AsyncMock(side_effect=agent_result)),
-            patch.object(analyzer, "get_connection", side_effect=connections),
+            patch.object(analyzer, "get_connection", pooled(*connections)) as get_connection,
             patch.object(analyzer, "validate_result"),
             patch.object(analyzer, "validate_event_updates", return_value=[]),
             patch.object(analyzer, "validate_location_resolution", return_value=None),
@@ -1155,8 +1146,7 @@ class AnalyzeConcertProgramsTests(unittest.TestCase):
 
         self.assertEqual(results, [0, 0])
         self.assertEqual([call.args[0] for call in persist_result.call_args_list], connections)
-        for connection in connections:
-            connection.close.assert_called_once()
+        self.assertEqual(get_connection.returned, connections)
 
     def test_timeout_interrupts_only_its_turn(self):
         codex = MagicMock()
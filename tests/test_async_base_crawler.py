@@ -0,0 +1,175 @@
+import asyncio
+from collections import Counter
+import json
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from crawlers import http, replay
+from crawlers.async_base import AsyncBaseCrawler
+from crawlers.base import CrawlerConfig
+
+
+LISTING_URL = "https://example.test/events"
+
+
+def detail_url(index):
+    return f"https://example.test/events/{index}"
+
+
+class ListingCrawler(AsyncBaseCrawler):
+    config = CrawlerConfig(
+        slug="async_example",
+        source="Async example",
+        source_url=LISTING_URL,
+        columns=["title", "date", "url"],
+    )
+
+    async def scrape(self):
+        listing = await self.fetch(LISTING_URL)
+        return await self.gather_details(listing.json()["events"], self.parse_detail)
+
+    async def parse_detail(self, url):
+        response = await self.fetch(url)
+        return {**response.json(), "url": url}
+
+
+class StreamingCrawler(ListingCrawler):
+    async def scrape(self):
+        listing = await self.fetch(LISTING_URL)
+        for url in listing.json()["events"]:
+            yield await self.parse_detail(url)
+
+
+def record_site(config, event_count):
+    cassette = replay.Cassette(config.path("async_example"), "record")
+    exchanges = [(LISTING_URL, {"events": [detail_url(index) for index in range(event_count)]})]
+    exchanges += [
+        (detail_url(index), {"title": f"Concert {index}", "date": f"2026-11-{index + 1:02d}"})
+        for index in range(event_count)
+    ]
+    for url, body in exchanges:
+        cassette.record(replay.Exchange.create(
+            "GET", url, None,
+            status_code=200, reason="OK", final_url=url,
+            headers={"Content-Type": "application/json"}, content=json.dumps(body).encode(),
+        ))
+    cassette.save()
+
+
+class AsyncBaseCrawlerTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config = replay.ReplayConfig(mode="replay", directory=Path(directory.name) / "recordings")
+        record_site(self.config, 5)
+        for patcher in (
+            patch.dict(os.environ, {"CRAWL_ARCHIVE_DIR": str(Path(directory.name) / "archive")}),
+            patch.object(replay.ReplayConfig, "from_environment", return_value=self.config),
+            patch("crawlers.base.configure_logging"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ledger = patch("crawlers.base.record_crawler_run")
+        self.record_crawler_run = ledger.start()
+        self.addCleanup(ledger.stop)
+        http.stats.reset()
+
+    def test_run_scrapes_details_concurrently_and_uploads(self):
+        crawler = ListingCrawler()
+
+        with patch.object(ListingCrawler, "upload", return_value=(5, 0)) as upload:
+            records = crawler.run()
+
+        self.assertEqual([record["title"] for record in records], [f"Concert {index}" for index in range(5)])
+        self.assertEqual(records[0]["country_code"], "SK")
+        upload.assert_called_once_with(records)
+        self.assertIsNone(crawler.session)
+        run = self.record_crawler_run.call_args.args[0]
+        self.assertEqual((run.status, run.request_count, run.record_count), ("succeeded", 6, 5))
+
+    def test_async_generator_scrapes_stream_into_chunks(self):
+        crawler = StreamingCrawler()
+        crawler.config = CrawlerConfig(
+            slug="async_example", source="Async example", source_url=LISTING_URL, chunk_size=2
+        )
+
+        with patch.object(StreamingCrawler, "upload", return_value=(2, 0)) as upload:
+            crawler.run()
+
+        self.assertEqual([len(call.args[0]) for call in upload.call_args_list], [2, 2, 1])
+
+
+    def test_async_generators_are_closed_when_the_caller_stops_early(self):
+        # Whether the session was still open when the generator was closed.
+        closed = []
+
+        class EndlessCrawler(ListingCrawler):
+            async def scrape(self):
+                try:
+                    index = 0
+                    while True:
+                        yield {"title": f"Concert {index}", "date": "2026-11-01", "url": detail_url(index)}
+                        index += 1
+                finally:
+                    closed.append(self.session is not None)
+
+        records = EndlessCrawler().scrape_records()
+        first = next(records)
+        records.close()
+
+        self.assertEqual(first["title"], "Concert 0")
+        self.assertEqual(closed, [True])
+
+
+class GatherDetailsTests(unittest.TestCase):
+    def gather(self, urls, fetch, **options):
+        crawler = ListingCrawler()
+
+        async def run():
+            return await crawler.gather_details(urls, fetch, **options)
+
+        return asyncio.run(run())
+
+    def test_bounds_concurrency_overall_and_per_host(self):
+        in_flight = Counter()
+        peaks = Counter()
+
+        async def fetch(url):
+            host = url.split("/")[2]
+            in_flight[host] += 1
+            in_flight["all"] += 1
+            peaks[host] = max(peaks[host], in_flight[host])
+            peaks["all"] = max(peaks["all"], in_flight["all"])
+            await asyncio.sleep(0.001)
+            in_flight[host] -= 1
+            in_flight["all"] -= 1
+            return url
+
+        urls = [f"https://{host}.test/{index}" for index in range(10) for host in ("a", "b", "c")]
+
+        results = self.gather(urls, fetch, concurrency=5, host_concurrency=2)
+
+        self.assertEqual(results, urls)
+        self.assertEqual(peaks["all"], 5)
+        self.assertEqual(max(peaks["a.test"], peaks["b.test"], peaks["c.test"]), 2)
+
+    def test_failures_cancel_the_batch_or_come_back_in_place(self):
+        async def fetch(url):
+            if url.endswith("bad"):
+                raise ValueError("broken page")
+            await asyncio.sleep(0.01)
+            return url
+
+        results = self.gather(["https://a.test/ok", "https://a.test/bad"], fetch, return_exceptions=True)
+
+        self.assertEqual(results[0], "https://a.test/ok")
+        self.assertIsInstance(results[1], ValueError)
+        with self.assertRaisesRegex(ValueError, "broken page"):
+            self.gather(["https://a.test/bad"] + [f"https://a.test/{index}" for index in range(5)], fetch)
+
+
+if __name__ == "__main__":
+    unittest.main()
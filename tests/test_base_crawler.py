@@ -1,7 +1,30 @@
+import csv
+from datetime import date
+import os
+from pathlib import Path
+import tempfile
 import unittest
 from unittest.mock import patch
 
+import psycopg2
+
+from crawlers.archive import CrawlArchive
 from crawlers.base import BaseCrawler, CrawlerConfig
+from crawlers.classical import DeltaResult, KnownEvents
+
+
+class ArchiveDirectoryMixin:
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.archive_directory = Path(directory.name) / "archive"
+        environment = patch.dict(os.environ, {"CRAWL_ARCHIVE_DIR": str(self.archive_directory)})
+        environment.start()
+        self.addCleanup(environment.stop)
+        ledger = patch("crawlers.base.record_crawler_run")
+        self.record_crawler_run = ledger.start()
+        self.addCleanup(ledger.stop)
 
 
 class FailingCrawler(BaseCrawler):
@@ -21,6 +44,7 @@ class BaseCrawlerLoggingTests(unittest.TestCase):
 
         with (
             patch("crawlers.base.configure_logging"),
+            patch("crawlers.base.record_crawler_run"),
             self.assertLogs("crawlers.base", level="ERROR") as captured,
         ):
             with self.assertRaisesRegex(RuntimeError, "source unavailable"):
@@ -36,5 +60,400 @@ class BaseCrawlerLoggingTests(unittest.TestCase):
         self.assertIsNotNone(record.exc_info)
 
 
+class IncrementalCrawler(BaseCrawler):
+    config = CrawlerConfig(
+        slug="incremental_example",
+        source="Incremental example",
+        source_url="https://example.com/",
+        incremental=True,
+    )
+
+    def scrape(self):
+        known = self.known_events()
+        return [
+            {"title": "Known", "date": "2026-10-20", "url": "https://example.com/1",
+             "fetch_details": known.needs_details("https://example.com/1", "2026-10-20")},
+            {"title": "New", "date": "2026-10-21", "url": "https://example.com/2",
+             "fetch_details": known.needs_details("https://example.com/2", "2026-10-21")},
+        ]
+
+
+class KnownEventsTests(ArchiveDirectoryMixin, unittest.TestCase):
+    def test_matches_database_dates_against_record_strings(self):
+        known = KnownEvents([
+            ("https://example.com/1", date(2026, 10, 20), True),
+            ("https://example.com/2", date(2026, 10, 21), False),
+        ])
+
+        self.assertIn(("https://example.com/1", "2026-10-20"), known)
+        self.assertFalse(known.needs_details("https://example.com/1", "2026-10-20"))
+        self.assertTrue(known.needs_details("https://example.com/2", "2026-10-21"))
+        self.assertTrue(known.needs_details("https://example.com/3", "2026-10-21"))
+
+    @patch("crawlers.base.configure_logging")
+    @patch("crawlers.base.load_known_events")
+    def test_run_preloads_known_events_once_before_scrape(self, load_known_events, _configure_logging):
+        load_known_events.return_value = KnownEvents([
+            ("https://example.com/1", date(2026, 10, 20), True),
+        ])
+        crawler = IncrementalCrawler()
+
+        with (
+            patch.object(crawler, "prepare_records", side_effect=lambda records: records),
+            patch.object(crawler, "upload", return_value=(1, 1)),
+        ):
+            records = crawler.run()
+
+        load_known_events.assert_called_once_with("Incremental example", "classical_concert")
+        self.assertEqual([record["fetch_details"] for record in records], [False, True])
+
+
+    @patch("crawlers.base.configure_logging")
+    @patch("crawlers.base.load_known_events")
+    def test_known_events_keep_their_previous_details_in_the_snapshot(self, load_known_events, _configure_logging):
+        load_known_events.return_value = KnownEvents([
+            ("https://example.com/1", date(2026, 10, 20), True),
+        ])
+        CrawlArchive.from_environment().save("incremental_example", [
+            {"country_code": "SK", "title": "Known", "date": "2026-10-20", "url": "https://example.com/1",
+             "description": "Full programme"},
+        ])
+        crawler = IncrementalCrawler()
+
+        with (
+            patch.object(crawler, "scrape", return_value=[
+                {"title": "Known", "date": "2026-10-20", "url": "https://example.com/1", "description": None},
+            ]),
+            patch.object(crawler, "upload", return_value=(0, 1)),
+        ):
+            records = crawler.run()
+
+        self.assertEqual(records[0]["description"], "Full programme")
+        self.assertEqual(crawler.last_diff.counts()["unchanged_count"], 1)
+        self.assertEqual(self.record_crawler_run.call_args.args[0].change_fraction, 0.0)
+
+
+class StreamingCrawler(BaseCrawler):
+    def __init__(self, csv_path, record_count):
+        self.config = CrawlerConfig(
+            slug="streaming_example",
+            source="Streaming example",
+            source_url="https://example.com/",
+            columns=["title", "date", "url"],
+            dedupe_subset=["title", "date"],
+            front_fields=[("source", "Streaming example")],
+            csv_path=csv_path,
+            chunk_size=2,
+        )
+        self.record_count = record_count
+        self.scraped = 0
+        self.uploaded = []
+
+    def scrape(self):
+        for index in range(self.record_count):
+            self.scraped += 1
+            # Every third record repeats the previous one in a later chunk.
+            number = index - 1 if index % 3 == 2 else index
+            yield {"title": f"Concert {number}", "date": "2026-10-20", "url": f"https://example.com/{number}"}
+
+    def upload(self, records):
+        self.uploaded.append((self.scraped, [record["title"] for record in records]))
+        return len(records), 0
+
+
+class StreamingRunTests(ArchiveDirectoryMixin, unittest.TestCase):
+    def test_uploads_chunks_while_scraping_and_dedupes_across_chunks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = str(Path(directory) / "streaming.csv")
+            crawler = StreamingCrawler(csv_path, record_count=6)
+
+            with (
+                patch("crawlers.base.configure_logging"),
+                self.assertLogs("crawlers.base", level="INFO") as captured,
+            ):
+                crawler.run()
+
+            with open(csv_path, newline="", encoding="utf-8") as csv_file:
+                rows = list(csv.DictReader(csv_file))
+
+        self.assertEqual(
+            crawler.uploaded,
+            [(2, ["Concert 0", "Concert 1"]), (4, ["Concert 3"]), (6, ["Concert 4"])],
+        )
+        self.assertEqual([row["title"] for row in rows], ["Concert 0", "Concert 1", "Concert 3", "Concert 4"])
+        self.assertEqual(rows[0]["source"], "Streaming example")
+        events = {record.event: record for record in captured.records}
+        self.assertEqual(events["crawler_scrape_completed"].record_count, 6)
+        self.assertEqual(events["crawler_csv_saved"].record_count, 4)
+        self.assertEqual(events["crawler_upload_completed"].inserted_count, 4)
+        snapshot = CrawlArchive(self.archive_directory).load_latest("streaming_example")
+        self.assertEqual([record["title"] for record in snapshot], [row["title"] for row in rows])
+
+    def test_logs_csv_columns_that_first_appear_after_the_header(self):
+        records = [
+            {"title": "Recital", "date": "2026-10-20", "url": "https://example.com/1"},
+            {"title": "Gala", "date": "2026-10-21", "url": "https://example.com/2"},
+            {"title": "Matinee", "date": "2026-10-22", "url": "https://example.com/3", "venue": "Hall"},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = str(Path(directory) / "streaming.csv")
+            crawler = StreamingCrawler(csv_path, record_count=0)
+            crawler.config = CrawlerConfig(
+                slug="streaming_example", source="Streaming example", source_url="https://example.com/",
+                csv_path=csv_path, chunk_size=2,
+            )
+
+            with (
+                patch("crawlers.base.configure_logging"),
+                patch.object(crawler, "scrape", return_value=records),
+                self.assertLogs("crawlers.base", level="INFO") as captured,
+            ):
+                crawler.run()
+
+            with open(csv_path, newline="", encoding="utf-8") as csv_file:
+                rows = list(csv.DictReader(csv_file))
+
+        self.assertEqual([row["title"] for row in rows], ["Recital", "Gala", "Matinee"])
+        dropped = [record for record in captured.records if record.event == "crawler_csv_columns_dropped"]
+        self.assertEqual([record.columns for record in dropped], [["venue"]])
+        self.assertEqual(crawler.uploaded[-1][1], ["Matinee"])
+
+    def test_dedupes_across_chunks_like_a_single_batch(self):
+        records = [
+            {"title": "Recital", "date": "2026-10-20", "url": None},
+            {"title": "Recital", "date": "2026-10-20", "url": "None"},
+            {"title": "Recital", "date": "2026-10-20", "url": None},
+        ]
+        crawler = StreamingCrawler(None, record_count=0)
+        crawler.config = CrawlerConfig(
+            slug="streaming_example", source="Streaming example", source_url="https://example.com/",
+            dedupe_subset=["title", "date", "url"], chunk_size=1,
+        )
+
+        with (
+            patch("crawlers.base.configure_logging"),
+            patch.object(crawler, "scrape", return_value=records),
+            patch.object(crawler, "upload", return_value=(1, 0)) as upload,
+            self.assertLogs("crawlers.base", level="INFO"),
+        ):
+            crawler.run()
+
+        streamed = [record for call in upload.call_args_list for record in call.args[0]]
+        self.assertEqual([record["url"] for record in streamed], [None, "None"])
+        self.assertEqual(streamed, crawler.prepare_records(records))
+
+    def test_rejects_non_positive_chunk_size(self):
+        with self.assertRaises(ValueError):
+            CrawlerConfig(slug="x", source="x", source_url="https://example.com/", chunk_size=0)
+
+
+class SnapshotCrawler(BaseCrawler):
+    config = CrawlerConfig(
+        slug="snapshot_example",
+        source="Snapshot example",
+        source_url="https://example.com/",
+        front_fields=[("source", "Snapshot example")],
+    )
+
+    def __init__(self, records):
+        self.records = records
+
+    def scrape(self):
+        return self.records
+
+    def upload(self, records):
+        return len(records), 0
+
+
+class SnapshotRunTests(ArchiveDirectoryMixin, unittest.TestCase):
+    @patch("crawlers.base.configure_logging")
+    def test_each_run_is_archived_and_diffed_against_the_previous_one(self, _configure_logging):
+        first = [
+            {"title": "Recital", "date": date(2026, 10, 20), "url": "https://example.com/1"},
+            {"title": "Gala", "date": date(2026, 10, 21), "url": "https://example.com/2"},
+        ]
+        second = [
+            {"title": "Recital", "date": date(2026, 10, 20), "url": "https://example.com/1"},
+            {"title": "Gala (new cast)", "date": date(2026, 10, 21), "url": "https://example.com/2"},
+            {"title": "Matinee", "date": date(2026, 10, 22), "url": "https://example.com/3"},
+        ]
+
+        first_run = SnapshotCrawler(first)
+        with self.assertLogs("crawlers.base", level="INFO"):
+            first_run.run()
+        # Nothing to compare the first run with, so it has no change rate.
+        self.assertIsNone(first_run.last_diff)
+        self.assertIsNone(self.record_crawler_run.call_args.args[0].change_fraction)
+        crawler = SnapshotCrawler(second)
+        with self.assertLogs("crawlers.base", level="INFO") as captured:
+            crawler.run()
+
+        self.assertEqual(len(CrawlArchive(self.archive_directory).runs("snapshot_example")), 2)
+        self.assertEqual(
+            crawler.last_diff.counts(),
+            {"added_count": 1, "changed_count": 1, "disappeared_count": 0, "unchanged_count": 1},
+        )
+        saved = next(record for record in captured.records if record.event == "crawler_snapshot_saved")
+        self.assertEqual(saved.changed_count, 1)
+
+    @patch("crawlers.base.configure_logging")
+    def test_runs_filtered_since_the_last_success_are_not_archived_or_diffed(self, _configure_logging):
+        full = [
+            {"title": "Recital", "date": date(2026, 10, 20), "url": "https://example.com/1"},
+            {"title": "Gala", "date": date(2026, 10, 21), "url": "https://example.com/2"},
+        ]
+        with self.assertLogs("crawlers.base", level="INFO"):
+            SnapshotCrawler(full).run()
+
+        class ChangedPagesCrawler(SnapshotCrawler):
+            def scrape(self):
+                self.last_successful_run()
+                return self.records
+
+        crawler = ChangedPagesCrawler(full[:1])
+        with self.assertLogs("crawlers.base", level="INFO"):
+            crawler.run()
+
+        self.assertTrue(crawler.filtered_since_last_run)
+        self.assertIsNone(crawler.last_diff)
+        self.assertIsNone(self.record_crawler_run.call_args.args[0].change_fraction)
+        archive = CrawlArchive(self.archive_directory)
+        self.assertEqual(len(archive.runs("snapshot_example")), 1)
+        self.assertEqual(len(archive.load_latest("snapshot_example")), 2)
+        self.assertEqual(archive.last_success("snapshot_example"), crawler.run_started_at)
+
+    @patch("crawlers.base.configure_logging")
+    def test_successful_runs_are_recorded(self, _configure_logging):
+        crawler = SnapshotCrawler([])
+        self.assertIsNone(crawler.last_successful_run())
+
+        with self.assertLogs("crawlers.base", level="INFO"):
+            crawler.run()
+
+        self.assertEqual(crawler.last_successful_run(), crawler.run_started_at)
+
+        failing = SnapshotCrawler(None)
+        with self.assertLogs("crawlers.base", level="INFO"), self.assertRaises(TypeError):
+            failing.run()
+        self.assertEqual(failing.last_successful_run(), crawler.run_started_at)
+        self.assertFalse(list(Path(".").glob("data/snapshot_example.csv")))
+
+
+@patch("crawlers.base.configure_logging")
+class RunLedgerTests(ArchiveDirectoryMixin, unittest.TestCase):
+    def test_records_phases_counts_and_traffic_of_a_run(self, _configure_logging):
+        crawler = SnapshotCrawler([
+            {"title": "Recital", "date": date(2026, 10, 20), "url": "https://example.com/1"},
+            {"title": "Quartet", "date": date(2026, 10, 21), "url": "https://example.com/2"},
+        ])
+        crawler.upload = lambda records: (1, 1)
+
+        with patch("crawlers.base.http.stats.snapshot") as snapshot, self.assertLogs("crawlers.base", level="INFO"):
+            snapshot.side_effect = [
+                {"request_count": 5, "bytes_received": 100},
+                # Baseline of the scrape budget.
+                {"request_count": 5, "bytes_received": 100},
+                {"request_count": 8, "bytes_received": 1100},
+            ]
+            crawler.run()
+
+        run = self.record_crawler_run.call_args.args[0]
+        self.assertIs(run, crawler.current_run)
+        self.assertEqual(run.crawler, "snapshot_example")
+        self.assertEqual(run.status, "succeeded")
+        self.assertEqual(set(run.phase_seconds), {"scrape", "prepare", "upload"})
+        self.assertGreaterEqual(run.duration_seconds, sum(run.phase_seconds.values()))
+        self.assertEqual((run.request_count, run.bytes_received), (3, 1000))
+        self.assertEqual((run.record_count, run.inserted_count, run.skipped_count), (2, 1, 1))
+        self.assertGreater(run.peak_memory_bytes, 0)
+        self.assertIsNone(run.error_class)
+
+    def test_records_the_error_class_of_a_failed_run(self, _configure_logging):
+        with self.assertLogs("crawlers.base", level="INFO"), self.assertRaises(TypeError):
+            SnapshotCrawler(None).run()
+
+        run = self.record_crawler_run.call_args.args[0]
+        self.assertEqual(run.status, "failed")
+        self.assertEqual(run.error_class, "TypeError")
+        self.assertIsNone(run.inserted_count)
+
+    def test_streaming_runs_time_each_phase(self, _configure_logging):
+        with tempfile.TemporaryDirectory() as directory, self.assertLogs("crawlers.base", level="INFO"):
+            StreamingCrawler(str(Path(directory) / "events.csv"), 5).run()
+
+        run = self.record_crawler_run.call_args.args[0]
+        self.assertEqual(set(run.phase_seconds), {"scrape", "prepare", "upload"})
+        self.assertEqual((run.record_count, run.inserted_count), (4, 4))
+
+    def test_ledger_failure_does_not_fail_the_run(self, _configure_logging):
+        self.record_crawler_run.side_effect = psycopg2.OperationalError("no database")
+
+        with self.assertLogs("crawlers.base", level="WARNING") as captured:
+            records = SnapshotCrawler([]).run()
+
+        self.assertEqual(records, [])
+        self.assertIn("crawler_run_record_failed", [record.event for record in captured.records])
+
+
+class DeltaCrawler(SnapshotCrawler):
+    config = CrawlerConfig(
+        slug="delta_example",
+        source="Delta example",
+        source_url="https://example.com/",
+        delta_upload=True,
+    )
+
+
+def delta_records(count):
+    return [
+        {"title": f"Concert {index}", "date": date(2026, 11, index + 1), "url": f"https://example.com/{index}"}
+        for index in range(count)
+    ]
+
+
+@patch("crawlers.base.configure_logging")
+@patch("crawlers.base.upload_concert_delta", return_value=DeltaResult(updated_count=1))
+class DeltaRunTests(ArchiveDirectoryMixin, unittest.TestCase):
+    def test_uploads_the_diff_and_archives_after_the_upload(self, upload_concert_delta, _configure_logging):
+        with self.assertLogs("crawlers.base", level="INFO"):
+            DeltaCrawler(delta_records(3)).run()
+        with self.assertLogs("crawlers.base", level="INFO") as captured:
+            DeltaCrawler(delta_records(2)).run()
+
+        diff = upload_concert_delta.call_args.args[0]
+        self.assertEqual(len(diff.disappeared), 1)
+        self.assertEqual(upload_concert_delta.call_args.args[1], "Delta example")
+        self.assertTrue(upload_concert_delta.call_args.kwargs["mark_missing"])
+        completed = next(record for record in captured.records if record.event == "crawler_upload_completed")
+        self.assertEqual(completed.updated_count, 1)
+        self.assertEqual(len(CrawlArchive(self.archive_directory).runs("delta_example")), 2)
+
+    def test_does_not_mark_missing_events_after_a_partial_scrape(self, upload_concert_delta, _configure_logging):
+        with self.assertLogs("crawlers.base", level="INFO"):
+            DeltaCrawler(delta_records(20)).run()
+        with self.assertLogs("crawlers.base", level="WARNING") as captured:
+            DeltaCrawler(delta_records(4)).run()
+
+        self.assertFalse(upload_concert_delta.call_args.kwargs["mark_missing"])
+        self.assertEqual(captured.records[0].event, "crawler_missing_marking_skipped")
+
+    def test_failed_upload_is_not_archived(self, upload_concert_delta, _configure_logging):
+        with self.assertLogs("crawlers.base", level="INFO"):
+            DeltaCrawler(delta_records(3)).run()
+        baseline = CrawlArchive(self.archive_directory).runs("delta_example")
+        upload_concert_delta.side_effect = RuntimeError("database unavailable")
+
+        with self.assertLogs("crawlers.base", level="INFO"), self.assertRaises(RuntimeError):
+            DeltaCrawler(delta_records(2)).run()
+
+        self.assertEqual(CrawlArchive(self.archive_directory).runs("delta_example"), baseline)
+
+    def test_requires_a_classical_non_streaming_crawler(self, _upload_concert_delta, _configure_logging):
+        with self.assertRaisesRegex(ValueError, "delta_upload"):
+            CrawlerConfig(slug="x", source="X", source_url="https://x", delta_upload=True, chunk_size=10)
+        with self.assertRaisesRegex(ValueError, "delta_upload"):
+            CrawlerConfig(slug="x", source="X", source_url="https://x", delta_upload=True, upload_target="potential")
+
+
 if __name__ == "__main__":
     unittest.main()
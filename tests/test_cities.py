@@ -2,7 +2,13 @@ import math
 import unittest
 from unittest.mock import MagicMock
 
-from crawlers.cities import clean_city_raw, normalize_city_key, resolve_city
+from crawlers.cities import (
+    CityResolution,
+    CityResolver,
+    clean_city_raw,
+    normalize_city_key,
+    resolve_city,
+)
 
 
 class CityResolutionTests(unittest.TestCase):
@@ -32,5 +38,86 @@ class CityResolutionTests(unittest.TestCase):
         self.assertIsNone(resolve_city(cursor, "Springfield"))
 
 
+class FakeAliasCursor:
+    """Answer CityResolver queries from an in-memory city_alias table."""
+
+    def __init__(self, aliases):
+        self.aliases = list(aliases)
+        self.queries = []
+        self._result = None
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        if "COUNT(*)" in query:
+            ids = [alias[0] for alias in self.aliases]
+            self._result = [(len(ids), max(ids, default=None))]
+        else:
+            self._result = [alias for alias in self.aliases if alias[0] > params[0]]
+
+    def fetchone(self):
+        return self._result[0]
+
+    def fetchall(self):
+        return self._result
+
+
+PRAGUE = (1, "Prague", "Praha", "CZ")
+HUKVALDY = (12, "Hukvaldy", "Hukvaldy", "CZ")
+
+
+class CityResolverTests(unittest.TestCase):
+    def test_matches_scoped_then_global_precedence(self):
+        cursor = FakeAliasCursor([
+            (1, "praha", None, *PRAGUE),
+            (2, "praha 1", None, *PRAGUE),
+            (3, "hukvaldyvstupné 400 kč", "Festival", *HUKVALDY),
+            (4, "springfield", None, 20, "Springfield", "Springfield", "US"),
+            (5, "springfield", None, 21, "Springfield", "Springfield", "US"),
+            (6, "praha", "Other", *HUKVALDY),
+            (7, "praha", "Other", 30, "Prague", "Praha", "CZ"),
+        ])
+        resolver = CityResolver()
+        resolver.refresh(cursor)
+
+        self.assertEqual(
+            resolver.resolve("Hukvaldyvstupné 400 Kč", "Festival"),
+            CityResolution(*HUKVALDY),
+        )
+        self.assertIsNone(resolver.resolve("Hukvaldyvstupné 400 Kč"))
+        self.assertEqual(resolver.resolve(" PRAHA ", "Festival"), CityResolution(*PRAGUE))
+        # An ambiguous scoped alias falls back to the global alias.
+        self.assertEqual(resolver.resolve("Praha", "Other"), CityResolution(*PRAGUE))
+        self.assertIsNone(resolver.resolve("Springfield"))
+        self.assertIsNone(resolver.resolve(None))
+
+    def test_refresh_loads_only_new_aliases(self):
+        cursor = FakeAliasCursor([(1, "praha", None, *PRAGUE)])
+        resolver = CityResolver()
+
+        self.assertTrue(resolver.refresh(cursor))
+        self.assertFalse(resolver.refresh(cursor))
+        cursor.aliases.append((2, "hukvaldy", None, *HUKVALDY))
+        cursor.queries.clear()
+        self.assertTrue(resolver.refresh(cursor))
+
+        self.assertEqual(resolver.resolve("Hukvaldy"), CityResolution(*HUKVALDY))
+        self.assertEqual(resolver.resolve("Praha"), CityResolution(*PRAGUE))
+        self.assertEqual(len(cursor.queries), 2)
+
+    def test_refresh_reloads_after_aliases_are_removed(self):
+        cursor = FakeAliasCursor([
+            (1, "praha", None, *PRAGUE),
+            (2, "hukvaldy", None, *HUKVALDY),
+        ])
+        resolver = CityResolver()
+        resolver.refresh(cursor)
+        cursor.aliases = [(2, "hukvaldy", None, *HUKVALDY), (3, "brno", None, 5, "Brno", "Brno", "CZ")]
+
+        self.assertTrue(resolver.refresh(cursor))
+
+        self.assertIsNone(resolver.resolve("Praha"))
+        self.assertEqual(resolver.resolve("Brno").city_id, 5)
+
+
 if __name__ == "__main__":
     unittest.main()
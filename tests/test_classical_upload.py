@@ -0,0 +1,196 @@
+from datetime import date, time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from crawlers import classical
+from crawlers.archive import diff_records
+from crawlers.cities import CityResolution
+
+
+def concert(title, url="https://example.com/event", city="Bratislava", time_from=None):
+    return {
+        "title": title,
+        "date": "2026-10-18",
+        "time_from": time_from,
+        "source": "Example",
+        "source_url": "https://example.com",
+        "city": city,
+        "venue": "Hall",
+        "url": url,
+    }
+
+
+class UploadConcertsTests(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.cursor = self.connection.cursor.return_value
+        self.cursor.__enter__.return_value = self.cursor
+        self.pooled_connection = patch.object(classical, "connection")
+        connection = self.pooled_connection.start()
+        connection.return_value.__enter__.return_value = self.connection
+        self.addCleanup(self.pooled_connection.stop)
+
+    @patch.object(classical, "city_resolver")
+    def test_row_path_skips_duplicates_within_the_batch(self, city_resolver):
+        city_resolver.resolve.return_value = None
+        self.cursor.fetchone.return_value = None
+
+        result = classical.upload_concerts([
+            concert("A", time_from="15:00"),
+            concert("A", time_from="15:00:00"),
+            concert("A", time_from="19:30"),
+            concert("B"),
+            concert("B"),
+        ])
+
+        # The matinee and the evening performance are separate events.
+        self.assertEqual(result, (3, 2))
+        selects = [
+            call for call in self.cursor.execute.call_args_list
+            if call.args[0].startswith("SELECT id")
+        ]
+        self.assertEqual([call.args[1][3] for call in selects], ["15:00", "19:30", None])
+        self.assertIn("time_from IS NOT DISTINCT FROM", selects[0].args[0])
+
+    @patch.object(classical, "execute_values")
+    @patch.object(classical, "city_resolver")
+    def test_bulk_path_merges_batch_in_one_statement(self, city_resolver, execute_values):
+        city_resolver.resolve.return_value = CityResolution(7, "Bratislava", "Bratislava", "SK")
+        execute_values.return_value = [(1,), (2,)]
+
+        result = classical.upload_potential_concerts(
+            [concert("A"), concert("B"), concert("C")], bulk=True
+        )
+
+        self.assertEqual(result, (2, 1))
+        execute_values.assert_called_once()
+        sql, rows = execute_values.call_args.args[1:3]
+        self.assertIn("INSERT INTO potential_event", sql)
+        self.assertIn("ON CONFLICT (title, date, url, time_from) DO NOTHING", sql)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][classical.CONCERT_COLUMNS.index("city_id")], 7)
+        city_resolver.refresh.assert_called_once_with(self.cursor)
+        city_resolver.resolve.assert_called_with("Bratislava", "Example")
+        self.connection.commit.assert_called_once_with()
+
+    @patch.object(classical, "city_resolver")
+    @patch.object(classical, "execute_values")
+    def test_bulk_path_does_not_commit_failed_batch(self, execute_values, _city_resolver):
+        execute_values.side_effect = RuntimeError("server closed the connection")
+
+        with self.assertRaisesRegex(RuntimeError, "server closed"):
+            classical.bulk_upload_concerts([concert("A", city=None)])
+
+        self.connection.commit.assert_not_called()
+
+    def test_bulk_path_skips_empty_batches(self):
+        self.assertEqual(classical.bulk_upload_concerts([]), (0, 0))
+        classical.connection.assert_not_called()
+
+
+def event(title="A", day="2026-11-01", time_from="19:00:00", venue="Hall", url="https://example.com/a"):
+    return {"title": title, "date": day, "time_from": time_from, "venue": venue, "url": url}
+
+
+def stored(concert_id, title="A", day=date(2026, 11, 1), time_from=time(19), venue="Hall",
+           url="https://example.com/a", missing=False):
+    return (concert_id, title, day, url, time_from, None, venue, missing)
+
+
+@patch.object(classical, "_insert_concerts", side_effect=lambda _cursor, rows: len(rows))
+@patch.object(classical, "execute_values")
+class UploadConcertDeltaTests(unittest.TestCase):
+    today = date(2026, 10, 18)
+
+    def setUp(self):
+        self.connection = MagicMock()
+        self.cursor = self.connection.cursor.return_value
+        self.cursor.__enter__.return_value = self.cursor
+        self.cursor.fetchall.return_value = []
+        pooled_connection = patch.object(classical, "connection")
+        connection = pooled_connection.start()
+        connection.return_value.__enter__.return_value = self.connection
+        self.addCleanup(pooled_connection.stop)
+
+    def upload(self, previous, current, **kwargs):
+        return classical.upload_concert_delta(
+            diff_records(previous, current), "Example", today=self.today, **kwargs
+        )
+
+    def statements(self, prefix):
+        return [call.args for call in self.cursor.execute.call_args_list if call.args[0].startswith(prefix)]
+
+    def test_updates_fields_changed_at_the_source_and_records_them(self, execute_values, insert):
+        self.cursor.fetchall.return_value = [stored(5)]
+
+        result = self.upload([event()], [event(time_from="20:00:00")])
+
+        self.assertEqual(result, classical.DeltaResult(updated_count=1))
+        update, changes = execute_values.call_args_list
+        self.assertIn("UPDATE classical_concert AS c", update.args[1])
+        self.assertEqual(update.args[2], [(5, date(2026, 11, 1), time(20), None, "Hall")])
+        (change,) = changes.args[2]
+        self.assertEqual(change[:2], (5, "time_from"))
+        self.assertEqual((change[2].adapted, change[3].adapted), ("19:00", "20:00"))
+        self.assertEqual(change[-1], "crawler")
+        insert.assert_called_once_with(self.cursor, [])
+        self.connection.commit.assert_called_once_with()
+
+    def test_keeps_values_edited_in_the_database(self, execute_values, _insert):
+        self.cursor.fetchall.return_value = [stored(5, venue="Small hall")]
+
+        result = self.upload([event()], [event(venue="Hall", time_from="19:00:00")])
+
+        self.assertEqual(result.updated_count, 0)
+        execute_values.assert_not_called()
+
+    def test_rescheduled_event_keeps_its_row(self, execute_values, insert):
+        self.cursor.fetchall.return_value = [stored(5)]
+
+        result = self.upload([event()], [event(day="2026-11-08")])
+
+        self.assertEqual((result.updated_count, result.inserted_count, result.missing_count), (1, 0, 0))
+        self.assertEqual(execute_values.call_args_list[0].args[2][0][:2], (5, date(2026, 11, 8)))
+        insert.assert_called_once_with(self.cursor, [])
+
+    def test_renamed_event_is_inserted_and_the_old_row_marked_missing(self, execute_values, insert):
+        self.cursor.fetchall.return_value = [stored(5)]
+
+        result = self.upload([event()], [event(title="A (new cast)")])
+
+        self.assertEqual((result.inserted_count, result.missing_count), (1, 1))
+        execute_values.assert_not_called()
+        self.assertEqual(insert.call_args.args[1][0]["title"], "A (new cast)")
+        self.assertEqual(self.statements("UPDATE classical_concert SET missing_from_source_at = now()")[0][1], ([5],))
+
+    def test_marks_only_upcoming_disappeared_events_missing(self, _execute_values, _insert):
+        self.cursor.fetchall.return_value = [
+            stored(5),
+            stored(6, url="https://example.com/b", day=date(2026, 10, 1)),
+        ]
+        previous = [event(), event(url="https://example.com/b", day="2026-10-01")]
+
+        result = self.upload(previous, [])
+
+        self.assertEqual(result.missing_count, 1)
+        self.assertEqual(self.statements("UPDATE classical_concert SET missing_from_source_at = now()")[0][1], ([5],))
+
+    def test_mark_missing_false_leaves_disappeared_events(self, _execute_values, _insert):
+        self.cursor.fetchall.return_value = [stored(5)]
+
+        result = self.upload([event()], [], mark_missing=False)
+
+        self.assertEqual(result.missing_count, 0)
+        self.assertEqual(self.statements("UPDATE classical_concert SET missing"), [])
+
+    def test_clears_missing_flag_when_an_event_reappears(self, _execute_values, _insert):
+        self.cursor.fetchall.return_value = [stored(5, missing=True)]
+
+        result = self.upload([], [event()])
+
+        self.assertEqual((result.reappeared_count, result.inserted_count, result.skipped_count), (1, 1, 0))
+        self.assertEqual(self.statements("UPDATE classical_concert SET missing_from_source_at = NULL")[0][1], ([5],))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import importlib
+import unittest
+
+import sqlalchemy as sa
+
+
+migration = importlib.import_module(
+    "db.migrations.versions.20261018000100_add_concert_identity_keys"
+)
+
+
+class ConcertIdentityMigrationTests(unittest.TestCase):
+    def setUp(self):
+        self.engine = sa.create_engine("sqlite://")
+        self.connection = self.engine.connect()
+        for statement in (
+            "CREATE TABLE classical_concert (id INTEGER PRIMARY KEY, title TEXT NOT NULL, date TEXT NOT NULL, url TEXT NOT NULL, time_from TEXT)",
+            "CREATE TABLE potential_event (id INTEGER PRIMARY KEY, title TEXT NOT NULL, date TEXT NOT NULL, url TEXT NOT NULL, time_from TEXT)",
+            *(
+                f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, classical_concert_id INTEGER NOT NULL)"
+                for table in migration.CONCERT_CHILD_TABLES
+            ),
+        ):
+            self.connection.exec_driver_sql(statement)
+
+    def tearDown(self):
+        self.connection.close()
+        self.engine.dispose()
+
+    def test_keeps_oldest_event_of_each_identity_and_backs_up_the_rest(self):
+        self.connection.exec_driver_sql(
+            "INSERT INTO classical_concert VALUES "
+            "(1, 'A', '2026-10-18', 'u', '19:00'), (2, 'A', '2026-10-18', 'u', '19:00'), "
+            "(3, 'A', '2026-10-19', 'u', '19:00'), (4, 'A', '2026-10-18', 'u', '19:00'), "
+            "(5, 'A', '2026-10-18', 'u', '15:00'), (6, 'A', '2026-10-18', 'u', NULL), "
+            "(7, 'A', '2026-10-18', 'u', NULL)"
+        )
+        self.connection.exec_driver_sql(
+            "INSERT INTO potential_event VALUES "
+            "(1, 'B', '2026-10-18', 'u', NULL), (2, 'B', '2026-10-18', 'u', NULL)"
+        )
+        for table in migration.CONCERT_CHILD_TABLES:
+            self.connection.exec_driver_sql(
+                f"INSERT INTO {table} VALUES (1, 1), (2, 2), (3, 4)"
+            )
+
+        with self.assertLogs("alembic.runtime.migration") as captured:
+            migration._remove_duplicate_events(self.connection)
+
+        self.assertIn("[2, 4, 7]", captured.output[0])
+        self.assertEqual(
+            self.connection.exec_driver_sql(
+                "SELECT id FROM classical_concert ORDER BY id"
+            ).fetchall(),
+            # The 15:00 matinee is a separate performance, not a duplicate.
+            [(1,), (3,), (5,), (6,)],
+        )
+        self.assertEqual(
+            self.connection.exec_driver_sql("SELECT id FROM potential_event").fetchall(),
+            [(1,)],
+        )
+        for table in migration.CONCERT_CHILD_TABLES:
+            with self.subTest(table=table):
+                self.assertEqual(
+                    self.connection.exec_driver_sql(
+                        f"SELECT classical_concert_id FROM {table}"
+                    ).fetchall(),
+                    [(1,)],
+                )
+
+        migration._restore_duplicate_events(self.connection)
+
+        self.assertEqual(
+            self.connection.exec_driver_sql("SELECT id FROM classical_concert ORDER BY id").fetchall(),
+            [(1,), (2,), (3,), (4,), (5,), (6,), (7,)],
+        )
+        self.assertEqual(
+            self.connection.exec_driver_sql("SELECT id FROM potential_event ORDER BY id").fetchall(),
+            [(1,), (2,)],
+        )
+        for table in migration.CONCERT_CHILD_TABLES:
+            with self.subTest(table=table):
+                self.assertEqual(
+                    self.connection.exec_driver_sql(
+                        f"SELECT id, classical_concert_id FROM {table} ORDER BY id"
+                    ).fetchall(),
+                    [(1, 1), (2, 2), (3, 4)],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+from datetime import UTC, date, datetime, time, timedelta
+from pathlib import Path
+import tempfile
+import unittest
+
+from crawlers.archive import CrawlArchive, diff_records
+
+
+def event(title, day, url, **values):
+    return {"title": title, "date": day, "url": url, **values}
+
+
+class DiffRecordsTests(unittest.TestCase):
+    def test_classifies_added_changed_disappeared_and_unchanged_rows(self):
+        previous = [
+            event("Recital", "2026-10-20", "https://example.com/1", time_from="19:00:00"),
+            event("Gala", "2026-10-21", "https://example.com/2"),
+            event("Matinee", "2026-10-22", "https://example.com/3"),
+        ]
+        current = [
+            event("Recital", date(2026, 10, 20), "https://example.com/1", time_from=time(19, 30)),
+            event("Gala", date(2026, 10, 21), "https://example.com/2"),
+            event("Premiere", date(2026, 10, 23), "https://example.com/4"),
+        ]
+
+        diff = diff_records(previous, current)
+
+        self.assertEqual([record["title"] for record in diff.added], ["Premiere"])
+        self.assertEqual([change.current["title"] for change in diff.changed], ["Recital"])
+        self.assertEqual(diff.changed[0].fields, ["time_from"])
+        self.assertEqual([record["title"] for record in diff.disappeared], ["Matinee"])
+        self.assertEqual([record["title"] for record in diff.unchanged], ["Gala"])
+
+    def test_performances_sharing_a_page_and_date_are_told_apart_by_title(self):
+        previous = [
+            event("Matinee", "2026-10-20", "https://example.com/day"),
+            event("Evening", "2026-10-20", "https://example.com/day"),
+        ]
+        current = [event("Evening", "2026-10-20", "https://example.com/day")]
+
+        diff = diff_records(previous, current)
+
+        self.assertEqual([record["title"] for record in diff.disappeared], ["Matinee"])
+
+
+class CrawlArchiveTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.archive = CrawlArchive(Path(directory.name), keep_runs=2)
+
+    def test_snapshots_are_compressed_append_only_and_pruned(self):
+        started = datetime(2026, 10, 18, 1, 0, tzinfo=UTC)
+        for offset in range(3):
+            self.archive.save(
+                "example_sk",
+                [event(f"Run {offset}", date(2026, 10, 20), "https://example.com/1")],
+                run_at=started + timedelta(hours=offset),
+            )
+
+        runs = self.archive.runs("example_sk")
+        self.assertEqual([path.name for path in runs], [
+            "20261018T020000000000Z.jsonl.gz",
+            "20261018T030000000000Z.jsonl.gz",
+        ])
+        self.assertEqual(runs[0].read_bytes()[:2], b"\x1f\x8b")
+        self.assertEqual(
+            self.archive.load_latest("example_sk"),
+            [event("Run 2", "2026-10-20", "https://example.com/1")],
+        )
+        with self.assertRaises(FileExistsError):
+            self.archive.save("example_sk", [], run_at=started + timedelta(hours=2))
+
+    def test_failed_writes_leave_no_snapshot(self):
+        with self.assertRaises(RuntimeError):
+            with self.archive.writer("example_sk") as writer:
+                writer.write([event("Recital", "2026-10-20", "https://example.com/1")])
+                raise RuntimeError("scrape failed")
+
+        self.assertEqual(self.archive.runs("example_sk"), [])
+        self.assertIsNone(self.archive.load_latest("example_sk"))
+        self.assertEqual(list(Path(self.archive.directory).rglob("*")), [Path(self.archive.directory) / "example_sk"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from crawlers import bench, http, replay
+from crawlers.base import BaseCrawler, CrawlerConfig
+from crawlers.manifest import CrawlerEntry
+from crawlers.parsing import parse_html
+
+
+PROGRAM_URL = "https://example.test/program"
+
+
+class RecordedCrawler(BaseCrawler):
+    config = CrawlerConfig(
+        slug="recorded_test",
+        source="Recorded",
+        source_url=PROGRAM_URL,
+        columns=["title", "date", "url"],
+        dedupe_subset=["title", "date", "url"],
+    )
+
+    def scrape(self):
+        soup = parse_html(http.get(PROGRAM_URL))
+        return [
+            {"title": item.get_text(), "date": item["data-date"], "url": PROGRAM_URL}
+            for item in soup.select("li")
+        ]
+
+
+def entry():
+    return CrawlerEntry(
+        slug="recorded_test", module=__name__, country_code="SK", upload_target="classical", source="Recorded"
+    )
+
+
+def result(**overrides):
+    measured = {
+        "slug": "recorded_test",
+        "record_count": 10,
+        "request_count": 3,
+        "wall_seconds": 1.0,
+        "cpu_seconds": 0.8,
+        "peak_rss_mb": 100.0,
+        "fast_path_hints": [],
+    }
+    measured.update(overrides)
+    return measured
+
+
+class MeasureCrawlerTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config = replay.ReplayConfig(mode="replay", directory=Path(directory.name))
+
+    def record(self, body):
+        cassette = replay.Cassette(self.config.path("recorded_test"), "record")
+        cassette.record(replay.Exchange.create(
+            "GET", PROGRAM_URL, None,
+            status_code=200, reason="OK", final_url=None,
+            headers={"Content-Type": "text/html; charset=utf-8"}, content=body,
+        ))
+        cassette.save()
+
+    def test_measures_scrape_and_prepare_against_the_recording(self):
+        self.record(b'<ul><li data-date="2026-11-02">Bach</li><li data-date="2026-11-03">Suk</li></ul>')
+
+        measured = bench.measure_crawler(entry(), self.config, trace_memory=True)
+
+        self.assertNotIn("error", measured)
+        self.assertEqual(measured["record_count"], 2)
+        self.assertEqual(measured["request_count"], 1)
+        self.assertEqual(measured["bytes_parsed"], 80)
+        self.assertEqual(measured["fast_path_hints"], [])
+        for metric in ("wall_seconds", "cpu_seconds", "peak_rss_mb", "peak_traced_mb"):
+            self.assertGreater(measured[metric], 0)
+
+    def test_detail_pages_fetched_in_transform_are_replayed(self):
+        class DetailCrawler(RecordedCrawler):
+            def scrape(self):
+                return [{"title": "Bach", "date": "2026-11-02", "url": PROGRAM_URL}]
+
+            def transform(self, df):
+                df["description"] = [parse_html(http.get(url)).get_text() for url in df["url"]]
+                return df
+
+        self.record(b"<p>Goldberg Variations</p>")
+
+        with patch.object(bench, "_crawler_class", return_value=DetailCrawler):
+            measured = bench.measure_crawler(entry(), self.config)
+
+        self.assertNotIn("error", measured)
+        self.assertEqual(measured["record_count"], 1)
+        self.assertEqual(measured["request_count"], 1)
+
+    def test_reports_errors_instead_of_raising(self):
+        measured = bench.measure_crawler(entry(), self.config)
+
+        self.assertIn("FileNotFoundError", measured["error"])
+
+
+class RegressionTests(unittest.TestCase):
+    def test_flags_slowdowns_beyond_the_threshold(self):
+        baseline = {"crawlers": [result()]}
+
+        regressions = bench.find_regressions([result(wall_seconds=1.4, cpu_seconds=0.9)], baseline)
+
+        self.assertEqual(
+            regressions,
+            [{"slug": "recorded_test", "metric": "wall_seconds", "baseline": 1.0, "current": 1.4}],
+        )
+
+    def test_ignores_small_absolute_differences(self):
+        baseline = {"crawlers": [result(wall_seconds=0.01, cpu_seconds=0.01)]}
+
+        self.assertEqual(bench.find_regressions([result(wall_seconds=0.04, cpu_seconds=0.04)], baseline), [])
+
+    def test_flags_extra_requests_lost_records_memory_and_new_errors(self):
+        baseline = {"crawlers": [result(), result(slug="other")]}
+        current = [
+            result(request_count=4, record_count=9, peak_rss_mb=200.0),
+            {"slug": "other", "error": "ReplayMissError: No recorded response"},
+        ]
+
+        metrics = [(item["slug"], item["metric"]) for item in bench.find_regressions(current, baseline)]
+
+        self.assertEqual(
+            metrics,
+            [
+                ("recorded_test", "request_count"),
+                ("recorded_test", "record_count"),
+                ("recorded_test", "peak_rss_mb"),
+                ("other", "error"),
+            ],
+        )
+
+    def test_report_orders_by_cpu_and_lists_fast_path_candidates(self):
+        results = [
+            result(slug="fast", cpu_seconds=0.1),
+            {"slug": "broken", "error": "ValueError: bad"},
+            result(slug="slow", cpu_seconds=2.0, fast_path_hints=["parse_html"]),
+        ]
+
+        report = bench.build_report(results, ["unrecorded"])
+
+        self.assertEqual([item["slug"] for item in report["crawlers"]], ["slow", "fast", "broken"])
+        self.assertEqual(
+            report["fast_path_candidates"],
+            [{"slug": "slow", "cpu_seconds": 2.0, "hints": ["parse_html"]}],
+        )
+        self.assertEqual(report["without_recording"], ["unrecorded"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from crawlers import budget, http
+from crawlers.archive import CrawlArchive
+from crawlers.base import BaseCrawler, CrawlerConfig
+from crawlers.budget import BudgetExceeded, CrawlBudget
+from crawlers.classical import DeltaResult
+from crawlers.ledger import CrawlerRun
+
+
+PAGE_URL = "https://example.com/events?page={}"
+
+
+def response(content=b"<html></html>"):
+    result = requests.Response()
+    result.status_code = 200
+    result._content = content
+    result._content_consumed = True
+    return result
+
+
+class PagingCrawler(BaseCrawler):
+    """Yields one record per listing page and never runs out of pages."""
+
+    config = CrawlerConfig(
+        slug="paging_example",
+        source="Paging example",
+        source_url=PAGE_URL.format(1),
+        max_requests=3,
+    )
+
+    def scrape(self):
+        session = http.create_session(use_cache=False, rate_limit=False)
+        page = 1
+        while True:
+            session.get(PAGE_URL.format(page))
+            yield {"title": f"Concert {page}", "date": "2026-11-01", "url": PAGE_URL.format(page)}
+            page += 1
+
+
+class DetailCrawler(BaseCrawler):
+    """Skips detail pages that fail, like most crawlers with a detail pool."""
+
+    config = CrawlerConfig(
+        slug="detail_example",
+        source="Detail example",
+        source_url="https://example.com/",
+        max_bytes=20,
+    )
+
+    def scrape(self):
+        records = []
+        for index in range(10):
+            try:
+                http.get(f"https://example.com/event/{index}")
+            except requests.RequestException:
+                continue
+            records.append({"title": f"Concert {index}", "date": "2026-11-01", "url": str(index)})
+        return records
+
+
+class TransformDetailCrawler(BaseCrawler):
+    """Fetches detail pages in transform(), keeping events whose page failed."""
+
+    config = CrawlerConfig(
+        slug="transform_detail_example",
+        source="Transform detail example",
+        source_url="https://example.com/",
+        max_requests=2,
+    )
+
+    def scrape(self):
+        return [{"title": f"Concert {index}", "date": "2026-11-01", "url": str(index)} for index in range(5)]
+
+    def transform(self, df):
+        urls = df["url"].map("https://example.com/event/{}".format)
+        pages = http.fetch_many(urls, concurrency=1, return_exceptions=True)
+        df["description"] = [None if isinstance(page, Exception) else page.text for page in pages]
+        return df
+
+
+class CrawlBudgetTests(unittest.TestCase):
+    def test_stops_at_the_request_limit_and_keeps_raising(self):
+        stats = http.HttpStats()
+        tracker = budget.BudgetTracker(CrawlBudget(max_requests=2), stats)
+
+        tracker.check()
+        stats.record(100, 0.1)
+        stats.record(100, 0.1)
+
+        with self.assertRaisesRegex(BudgetExceeded, "max_requests=2") as raised:
+            tracker.check()
+        self.assertEqual(raised.exception.limit, "max_requests")
+        with self.assertRaises(BudgetExceeded):
+            tracker.check()
+
+    def test_config_limits_override_the_environment(self):
+        environment = {"CRAWLER_MAX_SECONDS": "0", "CRAWLER_MAX_REQUESTS": "500", "CRAWLER_MAX_BYTES": "1e6"}
+        config = CrawlerConfig(slug="example", source="Example", source_url="https://example.com/", max_requests=50)
+
+        with patch.dict(os.environ, environment):
+            self.assertEqual(CrawlBudget.for_crawler(config), CrawlBudget(None, 50, 1_000_000))
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(CrawlBudget.for_crawler(config).max_seconds, budget.DEFAULT_MAX_SECONDS)
+
+    def test_config_rejects_non_positive_budgets(self):
+        with self.assertRaisesRegex(ValueError, "max_seconds"):
+            CrawlerConfig(slug="example", source="Example", source_url="https://example.com/", max_seconds=0)
+
+    def test_interrupts_a_call_that_overruns_the_wall_time(self):
+        started = time.monotonic()
+        with patch.object(budget, "HARD_STOP_GRACE_SECONDS", 0):
+            with self.assertRaises(BudgetExceeded):
+                with budget.enforcing(CrawlBudget(max_seconds=0.05), http.HttpStats()):
+                    time.sleep(5)
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertIsNone(budget.active_budget())
+
+    def test_ledger_records_partial_runs(self):
+        run = CrawlerRun("example", "Example")
+
+        run.finish(budget_exceeded=BudgetExceeded("max_bytes", "crawler budget max_bytes=20 used up (25)"))
+
+        self.assertEqual((run.status, run.error_class), ("budget_exceeded", "BudgetExceeded"))
+
+
+class BudgetSalvageTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.archive_directory = Path(directory.name) / "archive"
+        for patcher in (
+            patch.dict(os.environ, {"CRAWL_ARCHIVE_DIR": str(self.archive_directory)}),
+            patch("crawlers.base.configure_logging"),
+            patch.object(requests.Session, "request", return_value=response(b"0123456789")),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ledger = patch("crawlers.base.record_crawler_run")
+        self.record_crawler_run = ledger.start()
+        self.addCleanup(ledger.stop)
+
+    def test_endless_pagination_uploads_what_it_collected(self):
+        crawler = PagingCrawler()
+
+        with (
+            patch.object(PagingCrawler, "upload", return_value=(3, 0)) as upload,
+            self.assertLogs("crawlers.base", level="WARNING") as captured,
+        ):
+            records = crawler.run()
+
+        self.assertEqual([record["title"] for record in records], ["Concert 1", "Concert 2", "Concert 3"])
+        upload.assert_called_once_with(records)
+        self.assertEqual(captured.records[0].event, "crawler_budget_exceeded")
+        self.assertEqual(captured.records[0].budget_limit, "max_requests")
+        run = self.record_crawler_run.call_args.args[0]
+        self.assertEqual((run.status, run.record_count, run.request_count), ("budget_exceeded", 3, 3))
+        # The next run must not treat pages skipped this time as already seen.
+        self.assertIsNone(CrawlArchive.from_environment().last_success("paging_example"))
+
+    def test_partial_runs_do_not_become_the_next_diff_baseline(self):
+        crawler = PagingCrawler()
+
+        with (
+            patch.object(PagingCrawler, "upload", return_value=(3, 0)),
+            self.assertLogs("crawlers.base", level="WARNING"),
+        ):
+            crawler.run()
+
+        self.assertEqual(CrawlArchive.from_environment().runs("paging_example"), [])
+
+    def test_partial_delta_runs_keep_the_previous_baseline(self):
+        archive = CrawlArchive.from_environment()
+        baseline = archive.save("paging_example", [{"title": "Concert 1", "date": "2026-11-01", "url": "a"}])
+        crawler = PagingCrawler()
+        crawler.config = CrawlerConfig(
+            slug="paging_example", source="Paging example", source_url=PAGE_URL.format(1),
+            max_requests=3, delta_upload=True,
+        )
+
+        with (
+            patch("crawlers.base.upload_concert_delta", return_value=DeltaResult(inserted_count=3)) as upload,
+            self.assertLogs("crawlers.base", level="WARNING"),
+        ):
+            crawler.run()
+
+        self.assertFalse(upload.call_args.kwargs["mark_missing"])
+        self.assertEqual(archive.runs("paging_example"), [baseline])
+
+    def test_crawlers_that_skip_failed_pages_return_early(self):
+        crawler = DetailCrawler()
+
+        with (
+            patch.object(DetailCrawler, "upload", return_value=(2, 0)) as upload,
+            self.assertLogs("crawlers.base", level="WARNING"),
+        ):
+            records = crawler.run()
+
+        self.assertEqual(len(records), 2)
+        upload.assert_called_once()
+        self.assertEqual(crawler.budget_exceeded.limit, "max_bytes")
+        self.assertEqual(self.record_crawler_run.call_args.args[0].status, "budget_exceeded")
+
+    def test_detail_requests_in_transform_count_against_the_budget(self):
+        crawler = TransformDetailCrawler()
+
+        with (
+            patch.object(TransformDetailCrawler, "upload", return_value=(5, 0)),
+            self.assertLogs("crawlers.base", level="WARNING"),
+        ):
+            records = crawler.run()
+
+        self.assertEqual([record["description"] for record in records], ["0123456789"] * 2 + [None] * 3)
+        self.assertEqual(self.record_crawler_run.call_args.args[0].status, "budget_exceeded")
+
+    def test_chunked_runs_salvage_uploaded_chunks(self):
+        crawler = PagingCrawler()
+        crawler.config = CrawlerConfig(
+            slug="paging_example", source="Paging example", source_url=PAGE_URL.format(1),
+            max_requests=5, chunk_size=2,
+        )
+
+        with (
+            patch.object(PagingCrawler, "upload", return_value=(2, 0)) as upload,
+            self.assertLogs("crawlers.base", level="WARNING"),
+        ):
+            crawler.run()
+
+        self.assertEqual([len(call.args[0]) for call in upload.call_args_list], [2, 2, 1])
+        self.assertEqual(self.record_crawler_run.call_args.args[0].status, "budget_exceeded")
+        self.assertEqual(CrawlArchive.from_environment().runs("paging_example"), [])
+        self.assertEqual(list((self.archive_directory / "paging_example").glob(".*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
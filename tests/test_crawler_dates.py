@@ -0,0 +1,119 @@
+from datetime import date, datetime, time
+import unittest
+from zoneinfo import ZoneInfo
+
+from crawlers import dates
+from crawlers.dates import month_number, parse_date, parse_dates, parse_datetime, parse_time
+
+
+REFERENCE = date(2026, 10, 18)
+
+
+def iso_dates(text, lang):
+    return [value.isoformat() for value in parse_dates(text, lang, reference=REFERENCE)]
+
+
+class ParseDatesTests(unittest.TestCase):
+    def test_reads_numeric_and_named_months_per_language(self):
+        cases = [
+            ("19. júna 2026 o 19.00 hod.", "sk"),
+            ("pátek 19. června 2026", "cs"),
+            ("Fr., 19.6.2026", "de"),
+            ("vendredi 19 juin 2026", "fr"),
+            ("venerdì 19 giugno 2026", "it"),
+            ("fredag 19. juni 2026", "no"),
+            ("Friday, June 19th, 2026", "en"),
+            ("2026. június 19., péntek", "hu"),
+            ("piątek, 19 czerwca 2026", "pl"),
+            ("viernes 19 de junio de 2026", "es"),
+            ("2026-06-19T19:30:00+02:00", "en"),
+            ("19/06/2026", "it"),
+            ("19.06.26", "cz"),
+        ]
+        for text, lang in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_date(text, lang, reference=REFERENCE), date(2026, 6, 19))
+
+    def test_expands_lists_and_ranges(self):
+        self.assertEqual(iso_dates("19. & 20.6.2015", "de"), ["2015-06-19", "2015-06-20"])
+        self.assertEqual(iso_dates("19., 20. a 22. júna 2026", "sk"), ["2026-06-19", "2026-06-20", "2026-06-22"])
+        self.assertEqual(iso_dates("Sa 19. – Mo 21. Juni 2026", "de"), ["2026-06-19", "2026-06-20", "2026-06-21"])
+        self.assertEqual(iso_dates("du 19 au 21 juin 2026", "fr"), ["2026-06-19", "2026-06-20", "2026-06-21"])
+        self.assertEqual(iso_dates("December 3-5, 2026", "en"), ["2026-12-03", "2026-12-04", "2026-12-05"])
+        self.assertEqual(iso_dates("30. 6. – 2. 7. 2026", "sk"), ["2026-06-30", "2026-07-01", "2026-07-02"])
+        self.assertEqual(iso_dates("30. - 2. 7. 2026", "sk"), ["2026-06-30", "2026-07-01", "2026-07-02"])
+
+    def test_range_across_new_year_takes_the_year_from_its_end(self):
+        self.assertEqual(
+            iso_dates("30.12. - 2.1.2027", "de"),
+            ["2026-12-30", "2026-12-31", "2027-01-01", "2027-01-02"],
+        )
+
+    def test_long_ranges_keep_only_their_ends(self):
+        self.assertEqual(iso_dates("1. 1. – 31. 12. 2027", "sk"), ["2027-01-01", "2027-12-31"])
+
+    def test_missing_year_is_the_next_upcoming_occurrence(self):
+        self.assertEqual(parse_date("So 15. 11.", "sk", reference=REFERENCE), date(2026, 11, 15))
+        self.assertEqual(parse_date("Mi 2. 9.", "de", reference=REFERENCE), date(2026, 9, 2))
+        self.assertEqual(parse_date("5. März", "de", reference=REFERENCE), date(2027, 3, 5))
+
+    def test_ignores_text_without_a_valid_date(self):
+        self.assertEqual(parse_dates("Vstupné 15 €, 19:30", "sk", reference=REFERENCE), ())
+        self.assertIsNone(parse_date("31. 2. 2027", "sk", reference=REFERENCE))
+
+    def test_rejects_unknown_languages(self):
+        with self.assertRaisesRegex(ValueError, "unsupported date language 'xx'"):
+            parse_date("19. 6. 2026", "xx")
+
+    def test_month_number(self):
+        self.assertEqual(month_number("Jänner", "de"), 1)
+        self.assertEqual(month_number("júna", "sk"), 6)
+        self.assertEqual(month_number("juna", "sk"), 6)
+        self.assertIsNone(month_number("Juni", "fr"))
+
+
+class ParseTimeTests(unittest.TestCase):
+    def test_reads_clock_formats(self):
+        cases = [
+            ("Sa., 20.6.2026, 19:30 Uhr", "de", time(19, 30)),
+            ("20.06. 19.30", "de", time(19, 30)),
+            ("Mi 11.11. 20 Uhr", "de", time(20)),
+            ("19 juin 2026 à 20h30", "fr", time(20, 30)),
+            ("Samedi 1er mars - 18h", "fr", time(18)),
+            ("June 19, 2026 7:30 pm", "en", time(19, 30)),
+            ("Thu 26 Nov, 12:00am", "en", time(0)),
+            ("19/12/2026 ore 18", "it", time(18)),
+            ("fredag 5. mars kl. 19.30", "no", time(19, 30)),
+        ]
+        for text, lang, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_time(text, lang), expected)
+
+    def test_date_parts_are_not_read_as_times(self):
+        self.assertIsNone(parse_time("Mi 11.11.2026", "de"))
+        self.assertIsNone(parse_time("19. 6. 2026", "sk"))
+
+
+class ParseDatetimeTests(unittest.TestCase):
+    def setUp(self):
+        dates.clear_cache()
+
+    def test_combines_first_date_and_time_in_the_timezone(self):
+        self.assertEqual(
+            parse_datetime("Sa., 20.6.2026, 19:30 Uhr", "de", "Europe/Vienna"),
+            datetime(2026, 6, 20, 19, 30, tzinfo=ZoneInfo("Europe/Vienna")),
+        )
+        self.assertEqual(parse_datetime("20. 6. 2026", "sk"), datetime(2026, 6, 20))
+        self.assertIsNone(parse_datetime("Vstupné zdarma", "sk"))
+
+    def test_repeated_strings_are_parsed_once(self):
+        for _ in range(3):
+            parse_datetime("Sa., 20.6.2026, 19:30 Uhr", "de", "Europe/Vienna")
+            parse_date("Sa., 20.6.2026, 19:30 Uhr", "de")
+
+        info = dates.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+from pathlib import Path
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from crawlers import executor
+from crawlers.executor import ExecutorConfig, run_crawlers
+
+
+def fake_crawler(module):
+    if module.startswith("orphan:"):
+        Path(module.removeprefix("orphan:")).write_text(str(os.getpid()))
+        # Let the zygote report the start before it dies.
+        time.sleep(0.2)
+        os.kill(os.getppid(), signal.SIGKILL)
+        time.sleep(30)
+    if module == "crash":
+        raise SystemExit(3)
+    if module == "hang":
+        time.sleep(30)
+    if module == "abort":
+        os.abort()
+    if module == "preloaded":
+        from crawlers import extractors
+
+        preloaded = "pandas" in sys.modules and extractors.city_matcher.cache_info().currsize == 1
+        raise SystemExit(0 if preloaded else 5)
+
+
+def running(pid):
+    # Orphans are reaped by init, which may leave them as zombies for a while.
+    try:
+        return "zombie" not in Path(f"/proc/{pid}/status").read_text()
+    except FileNotFoundError:
+        return False
+
+
+class RunCrawlersTests(unittest.TestCase):
+    def test_isolates_failures_and_returns_results_in_input_order(self):
+        with self.assertLogs("crawlers.executor") as captured:
+            results = run_crawlers(
+                ["ok", "crash", "abort", "ok"],
+                ExecutorConfig(max_workers=2, timeout_seconds=10),
+                target=fake_crawler,
+            )
+
+        self.assertEqual([result.module for result in results], ["ok", "crash", "abort", "ok"])
+        self.assertEqual(
+            [result.status for result in results],
+            ["succeeded", "failed", "failed", "succeeded"],
+        )
+        self.assertEqual(results[1].exit_code, 3)
+        self.assertLess(results[2].exit_code, 0)
+        summary = captured.records[-1]
+        self.assertEqual(summary.event, "crawler_pass_completed")
+        self.assertEqual(summary.failed_count, 2)
+
+    def test_terminates_crawlers_over_the_time_limit(self):
+        started = time.monotonic()
+
+        with self.assertLogs("crawlers.executor"):
+            results = run_crawlers(
+                ["hang", "ok"],
+                ExecutorConfig(max_workers=2, timeout_seconds=0.5),
+                target=fake_crawler,
+            )
+
+        self.assertEqual([result.status for result in results], ["timed_out", "succeeded"])
+        self.assertLess(time.monotonic() - started, 10)
+
+    def test_kills_the_children_of_a_zygote_that_died(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        pid_file = Path(directory.name) / "pid"
+
+        with self.assertLogs("crawlers.executor"):
+            results = run_crawlers(
+                [f"orphan:{pid_file}", "ok", "ok"],
+                ExecutorConfig(max_workers=1, timeout_seconds=30, preload=False),
+                target=fake_crawler,
+            )
+
+        self.assertEqual([result.status for result in results], ["failed", "succeeded", "succeeded"])
+        deadline = time.monotonic() + 5
+        while running(int(pid_file.read_text())) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(running(int(pid_file.read_text())))
+
+    def test_child_entry_point_exits_nonzero_when_the_crawler_raises(self):
+        with (
+            patch.object(executor.importlib, "import_module") as import_module,
+            self.assertLogs("crawlers.executor", level="ERROR"),
+        ):
+            import_module.return_value.main.side_effect = RuntimeError("source unavailable")
+            with self.assertRaises(SystemExit) as raised:
+                executor.run_crawler_module("crawlers.sk.example.main")
+
+        self.assertEqual(raised.exception.code, 1)
+
+    def test_children_start_with_preloaded_modules_and_report_peak_rss(self):
+        with self.assertLogs("crawlers.executor") as captured:
+            results = run_crawlers(["preloaded"], ExecutorConfig(max_workers=1, timeout_seconds=30), target=fake_crawler)
+
+        self.assertEqual(results[0].status, "succeeded")
+        self.assertGreater(results[0].peak_rss_bytes, 0)
+        self.assertGreater(captured.records[0].peak_rss_mb, 0)
+
+    def test_replaces_the_zygote_after_its_run_limit(self):
+        config = ExecutorConfig(max_workers=2, timeout_seconds=10, runs_per_worker=2, preload=False)
+
+        with patch.object(executor, "Zygote", wraps=executor.Zygote) as zygote, self.assertLogs("crawlers.executor"):
+            results = run_crawlers(["ok"] * 5, config, target=fake_crawler)
+
+        self.assertEqual([result.status for result in results], ["succeeded"] * 5)
+        self.assertEqual(zygote.call_count, 3)
+
+    def test_reads_limits_from_environment(self):
+        environment = {
+            "CRAWLER_WORKERS": "16",
+            "CRAWLER_TIMEOUT_SECONDS": "90",
+            "CRAWLER_RUNS_PER_WORKER": "20",
+            "CRAWLER_PRELOAD": "0",
+        }
+        with patch.dict(os.environ, environment):
+            config = ExecutorConfig.from_environment()
+
+        self.assertEqual(
+            config, ExecutorConfig(max_workers=16, timeout_seconds=90, runs_per_worker=20, preload=False)
+        )
+        with patch.dict(os.environ, {"CRAWLER_WORKERS": "0"}):
+            with self.assertRaises(ValueError):
+                ExecutorConfig.from_environment()
+
+
+if __name__ == "__main__":
+    unittest.main()
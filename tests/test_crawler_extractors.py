@@ -0,0 +1,68 @@
+import csv
+import unittest
+
+from crawlers import extractors
+from crawlers.extractors import CityMatcher, extract_city
+
+
+def linear_extract_city(text):
+    """The original per-row scan that extract_city() must agree with."""
+    with open(extractors.DATA_DIRECTORY / "cities_with_postal_code.csv", encoding="utf-8") as csv_file:
+        postal_rows = list(csv.DictReader(csv_file))
+    with open(extractors.DATA_DIRECTORY / "cities_by_population.csv", encoding="utf-8") as csv_file:
+        population_rows = list(csv.DictReader(csv_file))
+    postal_code = extractors.extract_postal_code(text)
+    if postal_code:
+        for row in postal_rows:
+            if row["postal_code"] == postal_code and row["city"] in text:
+                return row["city"]
+        for key, value in extractors.SPECIAL_CITIES.items():
+            if postal_code.startswith(key):
+                return value
+    for row in population_rows:
+        if row["city"] in text:
+            return row["city"]
+    return None
+
+
+class CityMatcherTests(unittest.TestCase):
+    def test_returns_the_earliest_listed_name_found_anywhere(self):
+        matcher = CityMatcher(["Nitra", "Nové Mesto nad Váhom", "Nové Mesto", "Mesto"])
+
+        self.assertEqual(matcher.find("Kino, Nové Mesto nad Váhom a Nitra"), "Nitra")
+        self.assertEqual(matcher.find("Kino, Nové Mesto nad Váhom"), "Nové Mesto nad Váhom")
+        self.assertEqual(matcher.find("Nové Mesto pod Šiatrom"), "Nové Mesto")
+        self.assertEqual(matcher.find("Staré Mesto"), "Mesto")
+        self.assertIsNone(matcher.find("Trnava"))
+
+    def test_matches_names_inside_other_names(self):
+        matcher = CityMatcher(["Ban", "Banská Bystrica", "ská"])
+
+        self.assertEqual(matcher.find("Banská Bystrica"), "Ban")
+        self.assertEqual(matcher.find("Banská"), "Ban")
+        self.assertEqual(matcher.find("Baská"), "ská")
+
+
+class ExtractCityTests(unittest.TestCase):
+    def test_agrees_with_the_linear_scan(self):
+        texts = [
+            "Dom kultúry, Hlavná 5, 080 01 Prešov",
+            "Kostol sv. Martina, 81101 Bratislava",
+            "Kultúrny dom, 04001",
+            "Mestské divadlo, 97201",
+            "Synagóga Žilina",
+            "Koncertná sieň Slovenskej filharmónie",
+            "Zámok Bojnice",
+            "",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(extract_city(text), linear_extract_city(text))
+
+    def test_uses_postal_code_before_population(self):
+        self.assertEqual(extract_city("Evanjelický kostol, 040 01 Košice"), "Košice")
+        self.assertEqual(extract_city("Amfiteáter, 97201"), "Bojnice")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from crawlers import http
+
+
+def response(status_code=200, content=b"ok"):
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = content
+    result._content_consumed = True
+    return result
+
+
+class CrawlerSessionTests(unittest.TestCase):
+    def setUp(self):
+        http.stats.reset()
+
+    @patch.object(requests.Session, "request")
+    def test_applies_default_timeout_and_records_traffic(self, request):
+        request.return_value = response(content=b"12345")
+        session = http.create_session({"User-Agent": "ClassicalBot"})
+
+        session.get("https://example.com/")
+        session.get("https://example.com/slow", timeout=90)
+
+        self.assertEqual(request.call_args_list[0].kwargs["timeout"], http.DEFAULT_TIMEOUT)
+        self.assertEqual(request.call_args_list[1].kwargs["timeout"], 90)
+        self.assertEqual(session.headers["User-Agent"], "ClassicalBot")
+        snapshot = http.stats.snapshot()
+        self.assertEqual(snapshot["request_count"], 2)
+        self.assertEqual(snapshot["bytes_received"], 10)
+
+    def test_retries_rate_limits_and_server_errors(self):
+        retry = http.create_session().get_adapter("https://example.com/").max_retries
+
+        self.assertEqual(retry.total, http.DEFAULT_RETRIES)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertIn(503, retry.status_forcelist)
+        self.assertTrue(retry.respect_retry_after_header)
+
+    def test_shared_session_is_reused(self):
+        self.assertIs(http.get_session(), http.get_session())
+
+
+class FetchManyTests(unittest.TestCase):
+    def test_returns_results_in_input_order(self):
+        urls = [f"https://example.com/{index}" for index in range(20)]
+
+        results = http.fetch_many(urls, lambda url: url.rsplit("/", 1)[1], concurrency=4)
+
+        self.assertEqual(results, [str(index) for index in range(20)])
+
+    def test_can_return_failures_in_place(self):
+        def fetch(url):
+            if url.endswith("bad"):
+                raise requests.ConnectionError("refused")
+            return url
+
+        results = http.fetch_many(["a", "bad", "c"], fetch, return_exceptions=True)
+
+        self.assertEqual(results[0], "a")
+        self.assertIsInstance(results[1], requests.ConnectionError)
+        self.assertEqual(results[2], "c")
+        with self.assertRaises(requests.ConnectionError):
+            http.fetch_many(["bad"], fetch)
+
+    def test_rejects_invalid_concurrency(self):
+        with self.assertRaisesRegex(ValueError, "concurrency"):
+            http.fetch_many(["a"], concurrency=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawlers import http
+from crawlers.http_cache import HttpCache, HttpCacheConfig
+
+
+def response(request, status_code=200, content=b"", headers=None):
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = content
+    result._content_consumed = True
+    result.headers.update(headers or {})
+    result.url = request.url
+    result.request = request
+    return result
+
+
+class HttpCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = HttpCache(
+            HttpCacheConfig(Path(self.directory.name), max_bytes=10_000, ttl_seconds=3600)
+        )
+        http.stats.reset()
+
+    def session(self, *responses):
+        sent = []
+        replies = iter(responses)
+
+        def send(adapter, request, **kwargs):
+            sent.append(dict(request.headers))
+            status_code, content, headers = next(replies)
+            return response(request, status_code, content, headers)
+
+        patcher = patch.object(HTTPAdapter, "send", send)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return http.create_session(cache=self.cache, rate_limit=False), sent
+
+    def test_serves_not_modified_responses_from_disk(self):
+        session, sent = self.session(
+            (200, b"<html>programme</html>", {"ETag": '"v1"', "Content-Type": "text/html"}),
+            (304, b"", {"ETag": '"v1"'}),
+        )
+
+        first = session.get("https://example.com/event/1")
+        second = session.get("https://example.com/event/1")
+
+        self.assertNotIn("If-None-Match", sent[0])
+        self.assertEqual(sent[1]["If-None-Match"], '"v1"')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.text, first.text)
+        self.assertTrue(second.from_cache)
+        snapshot = http.stats.snapshot()
+        self.assertEqual(snapshot["cache_hits"], 1)
+        self.assertEqual(snapshot["bytes_received"], len(b"<html>programme</html>"))
+
+    def test_changed_pages_replace_the_stored_copy(self):
+        session, sent = self.session(
+            (200, b"old", {"Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}),
+            (200, b"new", {"Last-Modified": "Fri, 16 Oct 2026 10:00:00 GMT"}),
+            (304, b"", {}),
+        )
+
+        session.get("https://example.com/event/1")
+        session.get("https://example.com/event/1")
+        latest = session.get("https://example.com/event/1")
+
+        self.assertEqual(sent[2]["If-Modified-Since"], "Fri, 16 Oct 2026 10:00:00 GMT")
+        self.assertEqual(latest.content, b"new")
+
+    def test_skips_responses_without_validators_and_non_get_requests(self):
+        session, sent = self.session(
+            (200, b"fresh", {}),
+            (200, b"fresh", {}),
+            (200, b"posted", {"ETag": '"p"'}),
+            (200, b"posted", {"ETag": '"p"'}),
+        )
+
+        session.get("https://example.com/list")
+        session.get("https://example.com/list")
+        session.post("https://example.com/api", data={"page": 1})
+        session.post("https://example.com/api", data={"page": 1})
+
+        self.assertTrue(all("If-None-Match" not in headers for headers in sent))
+        self.assertEqual(list(Path(self.directory.name).glob("*/*.body")), [])
+
+    def test_keys_on_language_and_skips_requests_with_cookies(self):
+        request = requests.Request("GET", "https://example.com/event/1").prepare()
+        english = self.cache.key(request)
+        request.headers["Accept-Language"] = "de"
+        german = self.cache.key(request)
+        request.headers["Cookie"] = "session=abc"
+
+        self.assertNotEqual(english, german)
+        self.assertIsNone(self.cache.key(request))
+
+    def test_expired_entries_are_not_revalidated(self):
+        session, sent = self.session(
+            (200, b"body", {"ETag": '"v1"'}),
+            (200, b"body", {"ETag": '"v1"'}),
+        )
+        session.get("https://example.com/event/1")
+        old = time.time() - 7200
+        for path in Path(self.directory.name).glob("*/*"):
+            os.utime(path, (old, old))
+
+        session.get("https://example.com/event/1")
+
+        self.assertNotIn("If-None-Match", sent[1])
+
+    def test_evicts_least_recently_used_entries_over_the_size_limit(self):
+        cache = HttpCache(HttpCacheConfig(Path(self.directory.name), max_bytes=250, ttl_seconds=3600))
+        request = requests.Request("GET", "https://example.com/").prepare()
+        keys = []
+        for index in range(3):
+            request.prepare_url(f"https://example.com/{index}", None)
+            key = cache.key(request)
+            cache.store(key, response(request, content=b"x" * 100, headers={"ETag": f'"{index}"'}))
+            stamp = time.time() - 100 + index
+            for path in Path(self.directory.name).glob(f"*/{key}.*"):
+                os.utime(path, (stamp, stamp))
+            keys.append(key)
+
+        cache.evict()
+
+        self.assertEqual(cache.conditional_headers(keys[0]), {})
+        self.assertEqual(cache.conditional_headers(keys[2]), {"If-None-Match": '"2"'})
+
+    def test_is_disabled_unless_configured(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(HttpCacheConfig.from_environment())
+        with patch.dict(os.environ, {"CRAWLER_HTTP_CACHE": "true", "CRAWLER_HTTP_CACHE_MAX_MB": "5"}):
+            config = HttpCacheConfig.from_environment()
+        self.assertEqual(config.max_bytes, 5 * 1024 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import dataclasses
+from pathlib import Path
+import tempfile
+import textwrap
+import unittest
+from unittest.mock import patch
+
+from crawlers import manifest
+from crawlers.base import CrawlerConfig
+
+
+def write_crawler(root, country, slug, body):
+    path = Path(root) / country / slug / "main.py"
+    path.parent.mkdir(parents=True)
+    path.write_text(textwrap.dedent(body), encoding="utf-8")
+    return path
+
+
+class InspectCrawlerTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name) / "crawlers"
+        self.cache_path = Path(directory.name) / "manifest.json"
+
+    def test_reads_literals_and_module_constants(self):
+        path = write_crawler(self.root, "cz", "fok_cz", """
+            SOURCE_NAME = 'FOK'
+
+            class FokCrawler(BaseCrawler):
+                config = CrawlerConfig(
+                    slug='fok_cz',
+                    source=SOURCE_NAME,
+                    source_url='https://www.fok.cz',
+                    country_code='cz',
+                    upload_target='potential',
+                )
+            """)
+
+        entry = manifest.inspect_crawler(path, self.root)
+
+        self.assertEqual(
+            entry,
+            manifest.CrawlerEntry("fok_cz", "crawlers.cz.fok_cz.main", "CZ", "potential", "FOK"),
+        )
+
+    def test_applies_crawler_config_defaults(self):
+        path = write_crawler(self.root, "sk", "example_sk", """
+            config = CrawlerConfig(slug='example_sk', source='Example', source_url='https://example.sk')
+            """)
+
+        entry = manifest.inspect_crawler(path, self.root)
+
+        self.assertEqual((entry.country_code, entry.upload_target), ("SK", "classical"))
+
+    def test_defaults_match_crawler_config(self):
+        fields = {field.name: field.default for field in dataclasses.fields(CrawlerConfig)}
+
+        for name in ("country_code", "upload_target"):
+            self.assertEqual(manifest.CONFIG_DEFAULTS[name], fields[name])
+
+    def test_dynamic_configs_are_listed_under_their_directory(self):
+        write_crawler(self.root, "sk", "dynamic_sk", """
+            config = CrawlerConfig(slug=make_slug(), source='Dynamic', source_url='https://example.sk')
+            """)
+
+        with self.assertLogs("crawlers.manifest", level="ERROR"):
+            entries = manifest.load_manifest(self.root, self.cache_path)
+
+        self.assertEqual([entry.module for entry in entries], ["crawlers.sk.dynamic_sk.main"])
+        self.assertEqual(entries[0].slug, "dynamic_sk")
+
+    def test_only_changed_crawlers_are_inspected_again(self):
+        write_crawler(self.root, "sk", "one_sk", """
+            config = CrawlerConfig(slug='one_sk', source='One', source_url='https://one.sk')
+            """)
+        write_crawler(self.root, "sk", "two_sk", """
+            config = CrawlerConfig(slug='two_sk', source='Two', source_url='https://two.sk')
+            """)
+        manifest.load_manifest(self.root, self.cache_path)
+        write_crawler(self.root, "at", "three_at", """
+            config = CrawlerConfig(slug='three_at', source='Three', source_url='https://three.at', country_code='AT')
+            """)
+
+        with patch.object(manifest, "inspect_crawler", wraps=manifest.inspect_crawler) as inspect:
+            entries = manifest.load_manifest(self.root, self.cache_path)
+
+        self.assertEqual(inspect.call_count, 1)
+        self.assertEqual([entry.slug for entry in entries], ["three_at", "one_sk", "two_sk"])
+
+
+class RepositoryManifestTests(unittest.TestCase):
+    def test_every_crawler_config_is_statically_readable(self):
+        slugs = []
+        for main_file in sorted(manifest.CRAWLERS_DIRECTORY.glob("*/*/main.py")):
+            with self.subTest(crawler=str(main_file)):
+                slugs.append(manifest.inspect_crawler(main_file).slug)
+
+        self.assertEqual(len(slugs), len(set(slugs)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from bs4 import SoupStrainer
+
+from crawlers.parsing import parse_html
+
+
+PAGE = """<html><head><meta charset="windows-1250"></head><body>
+<article class="event"><a href="/1">Koncert č. 1</a></article>
+<article class="event"><a href="/2">Recitál</a></article>
+<footer><a href="/kontakt">Kontakt</a></footer>
+</body></html>"""
+
+
+class FakeResponse:
+    content = PAGE.encode("windows-1250")
+
+
+class ParseHtmlTests(unittest.TestCase):
+    def test_uses_lxml_and_keeps_soup_selectors(self):
+        soup = parse_html(PAGE)
+
+        self.assertEqual(soup.builder.NAME, "lxml")
+        self.assertEqual([link["href"] for link in soup.select("article.event a")], ["/1", "/2"])
+        self.assertEqual(soup.find("footer").get_text(strip=True), "Kontakt")
+
+    def test_decodes_response_bytes_with_the_page_charset(self):
+        soup = parse_html(FakeResponse())
+
+        self.assertEqual(soup.select_one("article a").get_text(), "Koncert č. 1")
+
+    def test_parse_only_keeps_matching_elements(self):
+        soup = parse_html(PAGE, parse_only=SoupStrainer("article"))
+
+        self.assertEqual(len(soup.find_all("a")), 2)
+        self.assertIsNone(soup.find("footer"))
+
+    def test_parser_can_be_overridden(self):
+        self.assertEqual(parse_html(PAGE, "html.parser").builder.NAME, "html.parser")
+        with patch.dict(os.environ, {"CRAWLER_HTML_PARSER": "html.parser"}):
+            self.assertEqual(parse_html(PAGE).builder.NAME, "html.parser")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import io
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawlers import http, politeness
+from crawlers.politeness import DomainRateLimiter, RateLimitConfig, RobotsCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def limiter(clock, crawl_delays=None, directory=None, **config):
+    crawl_delays = crawl_delays or {}
+    robots = RobotsCache(directory, fetch=lambda origin: crawl_delays.get(origin))
+    return DomainRateLimiter(
+        RateLimitConfig(directory=directory, **config), robots=robots, clock=clock, sleep=MagicMock()
+    )
+
+
+class RegisteredDomainTests(unittest.TestCase):
+    def test_groups_subdomains_of_one_registered_domain(self):
+        self.assertEqual(politeness.registered_domain("https://tickets.example.co.uk/a"), "example.co.uk")
+        self.assertEqual(politeness.registered_domain("https://www.example.co.uk:8443/"), "example.co.uk")
+        self.assertEqual(politeness.registered_domain("http://localhost:8000/"), "localhost")
+
+
+class DomainRateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_allows_a_burst_then_spaces_requests_per_domain(self):
+        rate_limiter = limiter(self.clock, rate_per_second=2, burst=3)
+
+        delays = [rate_limiter.reserve("https://www.example.com/page") for _ in range(5)]
+
+        self.assertEqual(delays, [0.0, 0.0, 0.0, 0.5, 1.0])
+        self.assertEqual(rate_limiter.reserve("https://other.org/"), 0.0)
+        self.assertEqual(rate_limiter.reserve("https://cdn.example.com/image"), 1.5)
+
+    def test_crawl_delay_slows_the_domain_without_bursts(self):
+        rate_limiter = limiter(self.clock, {"https://slow.example": 5})
+
+        delays = [rate_limiter.reserve("https://slow.example/event") for _ in range(3)]
+
+        self.assertEqual(delays, [0.0, 5.0, 10.0])
+
+    def test_retry_after_pauses_the_domain(self):
+        rate_limiter = limiter(self.clock, rate_per_second=2, burst=3)
+
+        rate_limiter.observe("https://www.example.com/", 429, {"Retry-After": "30"})
+
+        self.assertEqual(rate_limiter.reserve("https://api.example.com/"), 30.0)
+        self.assertEqual(rate_limiter.reserve("https://api.example.com/"), 30.5)
+        self.assertEqual(rate_limiter.reserve("https://other.org/"), 0.0)
+
+    def test_ignores_retry_after_on_other_statuses(self):
+        rate_limiter = limiter(self.clock)
+
+        rate_limiter.observe("https://example.com/", 200, {"Retry-After": "30"})
+
+        self.assertEqual(rate_limiter.reserve("https://example.com/"), 0.0)
+
+    def test_zero_rate_disables_limiting(self):
+        rate_limiter = limiter(self.clock, rate_per_second=0)
+
+        self.assertEqual([rate_limiter.reserve("https://example.com/") for _ in range(10)], [0.0] * 10)
+
+    def test_limiters_sharing_a_directory_share_slots_and_robots(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name)
+        first = limiter(self.clock, {"https://example.com": 2}, directory=path)
+        fetch = MagicMock(return_value=None)
+        second = DomainRateLimiter(
+            RateLimitConfig(directory=path), robots=RobotsCache(path, fetch=fetch), clock=self.clock
+        )
+
+        self.assertEqual(first.reserve("https://example.com/"), 0.0)
+        self.assertEqual(second.reserve("https://example.com/"), 2.0)
+        fetch.assert_not_called()
+
+
+    def test_keeps_state_in_memory_when_the_directory_is_not_writable(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        blocked = Path(directory.name) / "file"
+        blocked.write_text("")
+        rate_limiter = limiter(self.clock, {"https://example.com": 2}, directory=blocked / "rate-limits")
+
+        with self.assertLogs("crawlers", level="WARNING") as captured:
+            delays = [rate_limiter.reserve("https://example.com/") for _ in range(2)]
+
+        self.assertEqual(delays, [0.0, 2.0])
+        self.assertEqual(captured.records[0].event, "crawler_rate_limit_state_failed")
+
+    def test_state_is_shared_on_disk_unless_the_directory_is_empty(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(RateLimitConfig.from_environment().directory, politeness.DEFAULT_DIRECTORY)
+        with patch.dict(os.environ, {"CRAWLER_RATE_LIMIT_DIR": ""}):
+            self.assertIsNone(RateLimitConfig.from_environment().directory)
+
+
+class RetryAfterTests(unittest.TestCase):
+    def test_parses_seconds_and_http_dates(self):
+        # Thu, 09 Oct 2025 08:54:20 GMT
+        now = 1_760_000_060.0
+
+        self.assertEqual(politeness.retry_after_seconds({"Retry-After": "120"}), 120.0)
+        self.assertEqual(
+            politeness.retry_after_seconds({"Retry-After": "Thu, 09 Oct 2025 08:54:20 GMT"}, now=now - 60), 60.0
+        )
+        self.assertEqual(
+            politeness.retry_after_seconds({"Retry-After": "86400"}), politeness.MAX_RETRY_AFTER_SECONDS
+        )
+        self.assertIsNone(politeness.retry_after_seconds({"Retry-After": "soon"}))
+        self.assertIsNone(politeness.retry_after_seconds({}))
+
+
+class RobotsTests(unittest.TestCase):
+    def test_reads_crawl_delay_for_our_user_agent(self):
+        body = b"User-agent: *\nCrawl-delay: 3\nDisallow: /admin\n"
+        with patch.object(politeness.urllib.request, "urlopen", return_value=io.BytesIO(body)) as urlopen:
+            self.assertEqual(politeness.fetch_crawl_delay("https://example.com"), 3.0)
+
+        self.assertEqual(urlopen.call_args.args[0].full_url, "https://example.com/robots.txt")
+
+    def test_unreachable_robots_means_no_delay(self):
+        with patch.object(politeness.urllib.request, "urlopen", side_effect=OSError("refused")):
+            self.assertIsNone(politeness.fetch_crawl_delay("https://example.com"))
+
+    def test_caches_lookups_per_origin(self):
+        fetch = MagicMock(return_value=4.0)
+        robots = RobotsCache(fetch=fetch)
+
+        robots.crawl_delay("https://example.com/a")
+        robots.crawl_delay("https://example.com/b")
+        robots.crawl_delay("https://www.example.com/")
+
+        self.assertEqual(fetch.call_count, 2)
+
+
+class SessionTests(unittest.TestCase):
+    def test_every_network_request_waits_for_its_domain(self):
+        rate_limiter = MagicMock()
+
+        def send(adapter, request, **kwargs):
+            response = requests.Response()
+            response.status_code = 429
+            response.headers["Retry-After"] = "5"
+            response.url = request.url
+            response.request = request
+            response._content = b""
+            return response
+
+        with patch.object(HTTPAdapter, "send", send):
+            session = http.create_session(use_cache=False, limiter=rate_limiter, retries=0)
+            session.get("https://example.com/busy")
+
+        rate_limiter.wait.assert_called_once_with("https://example.com/busy")
+        rate_limiter.observe.assert_called_once_with("https://example.com/busy", 429, {"Retry-After": "5"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import asyncio
+import gzip
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+from requests.adapters import BaseAdapter
+
+from crawlers import curl, http, replay
+
+
+class SiteAdapter(BaseAdapter):
+    """Answers every request from a dict of URL -> body and counts the calls."""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append((request.method, request.url, request.body))
+        body = self.pages[request.url]
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response.headers["Set-Cookie"] = "session=secret"
+        response.raw = io.BytesIO(body)
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def session_with(adapter):
+    session = http.create_session(use_cache=False, rate_limit=False)
+    session.mount("https://", adapter)
+    return session
+
+
+class RecordReplayTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.pages = {
+            "https://example.test/program?page=1": "Koncert – 12. 10.".encode("utf-8"),
+            "https://example.test/logo.png": b"\x89PNG\xff\x00",
+        }
+
+    def config(self, mode, latency_seconds=0.0):
+        return replay.ReplayConfig(mode=mode, directory=self.directory, latency_seconds=latency_seconds)
+
+    def record(self):
+        adapter = SiteAdapter(self.pages)
+        session = session_with(adapter)
+        with replay.recording("example", self.config("record")):
+            session.get("https://example.test/program", params={"page": 1})
+            session.get("https://example.test/logo.png")
+            session.post("https://example.test/program?page=1", data={"q": "bach"})
+        return adapter
+
+    def test_replays_recorded_responses_without_network(self):
+        self.record()
+        offline = SiteAdapter({})
+        session = session_with(offline)
+
+        with replay.recording("example", self.config("replay")) as cassette:
+            page = session.get("https://example.test/program", params={"page": 1})
+            logo = session.get("https://example.test/logo.png")
+            search = session.post("https://example.test/program?page=1", data={"q": "bach"})
+
+        self.assertEqual(len(cassette), 3)
+        self.assertEqual(offline.calls, [])
+        self.assertEqual(page.text, "Koncert – 12. 10.")
+        self.assertEqual(page.encoding, "utf-8")
+        self.assertEqual(logo.content, b"\x89PNG\xff\x00")
+        self.assertEqual(search.status_code, 200)
+        self.assertNotIn("Set-Cookie", page.headers)
+
+    def test_recording_is_a_gzipped_file_per_crawler(self):
+        self.record()
+
+        path = self.directory / "example.jsonl.gz"
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), 3)
+        self.assertNotIn(b"secret", gzip.decompress(path.read_bytes()))
+
+    def test_recording_keeps_streamed_bodies_readable(self):
+        session = session_with(SiteAdapter(self.pages))
+
+        with replay.recording("example", self.config("record")):
+            response = session.get("https://example.test/logo.png", stream=True)
+
+        self.assertEqual(response.raw.read(), b"\x89PNG\xff\x00")
+
+    def test_replayed_stream_can_be_read_from_raw(self):
+        self.record()
+        session = session_with(SiteAdapter({}))
+
+        with replay.recording("example", self.config("replay")):
+            response = session.get("https://example.test/logo.png", stream=True)
+
+        self.assertEqual(response.raw.read(), b"\x89PNG\xff\x00")
+        self.assertEqual(b"".join(response.iter_content(4)), b"\x89PNG\xff\x00")
+
+    def test_unrecorded_request_is_a_connection_error(self):
+        self.record()
+        session = session_with(SiteAdapter({}))
+
+        with replay.recording("example", self.config("replay")):
+            with self.assertRaises(requests.ConnectionError) as raised:
+                session.get("https://example.test/program", params={"page": 2})
+
+        self.assertIsInstance(raised.exception, replay.ReplayMissError)
+
+    def test_repeated_requests_replay_in_recorded_order(self):
+        cassette = replay.Cassette(self.directory / "example.jsonl.gz", "record")
+        for body in (b"first", b"second"):
+            cassette.record(replay.Exchange.create(
+                "GET", "https://example.test/", None,
+                status_code=200, reason="OK", final_url=None, headers={}, content=body,
+            ))
+        cassette.save()
+
+        replayed = replay.Cassette.load(self.directory / "example.jsonl.gz")
+        contents = [replayed.play("GET", "https://example.test/").content for _ in range(3)]
+
+        self.assertEqual(contents, [b"first", b"second", b"second"])
+
+    def test_injects_latency_per_request(self):
+        self.record()
+        session = session_with(SiteAdapter({}))
+
+        with patch.object(replay.time, "sleep") as sleep:
+            with replay.recording("example", self.config("replay", latency_seconds=0.25)):
+                session.get("https://example.test/logo.png")
+
+        sleep.assert_called_once_with(0.25)
+
+    def test_failed_recording_keeps_the_previous_one(self):
+        self.record()
+        session = session_with(SiteAdapter(self.pages))
+
+        with self.assertRaises(RuntimeError):
+            with replay.recording("example", self.config("record")):
+                session.get("https://example.test/logo.png")
+                raise RuntimeError("parser bug")
+
+        self.assertEqual(len(replay.Cassette.load(self.directory / "example.jsonl.gz")), 3)
+
+    def test_live_mode_leaves_sessions_alone(self):
+        with replay.recording("example", self.config("live")) as cassette:
+            self.assertIsNone(cassette)
+            self.assertIsNone(replay.active_cassette())
+
+    def test_missing_recording_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            with replay.recording("unknown", self.config("replay")):
+                pass
+
+    def test_reads_mode_from_environment(self):
+        environment = {
+            "CRAWLER_HTTP_MODE": "Replay",
+            "CRAWLER_HTTP_RECORDINGS_DIR": str(self.directory),
+            "CRAWLER_HTTP_REPLAY_LATENCY_MS": "40",
+        }
+        with patch.dict("os.environ", environment):
+            config = replay.ReplayConfig.from_environment()
+
+        self.assertEqual(config, replay.ReplayConfig("replay", self.directory, 0.04))
+        with self.assertRaises(ValueError):
+            replay.ReplayConfig(mode="offline")
+
+
+class CurlReplayTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.config = replay.ReplayConfig(mode="replay", directory=Path(directory.name))
+        cassette = replay.Cassette(self.config.path("example"), "record")
+        cassette.record(replay.Exchange.create(
+            "GET", "https://example.test/events?page=2", None,
+            status_code=200, reason="OK", final_url=None,
+            headers={"Content-Type": "application/json"}, content=b'{"events": []}',
+        ))
+        cassette.save()
+
+    def test_curl_session_replays_requests_recordings(self):
+        with patch.object(curl.curl_requests.Session, "request") as network:
+            with replay.recording("example", self.config):
+                response = curl.CurlSession().get("https://example.test/events", params={"page": 2})
+
+        network.assert_not_called()
+        self.assertEqual(response.json(), {"events": []})
+        self.assertEqual(response.headers["content-type"], "application/json")
+
+    def test_async_curl_session_replays(self):
+        async def fetch():
+            async with curl.AsyncCurlSession() as session:
+                return await session.get("https://example.test/events?page=2")
+
+        with replay.recording("example", self.config):
+            response = asyncio.run(fetch())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'{"events": []}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+from datetime import UTC, datetime, timedelta
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from crawlers import scheduling
+from crawlers.archive import diff_records
+from crawlers.manifest import CrawlerEntry
+from crawlers.scheduling import RunObservation, ScheduleEntry, SchedulePolicy
+
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=UTC)
+DAY = timedelta(days=1)
+
+
+def observation(change_fraction, *, succeeded=True, started_at=NOW):
+    return RunObservation("example", started_at, succeeded, change_fraction)
+
+
+def scheduled(interval=DAY, change_rate=None, last_run_at=NOW - DAY):
+    return ScheduleEntry("example", interval.total_seconds(), change_rate, last_run_at, last_run_at + interval)
+
+
+def entry(slug):
+    return CrawlerEntry(slug, f"crawlers.sk.{slug}.main", "SK", "classical", slug)
+
+
+class NextEntryTests(unittest.TestCase):
+    policy = SchedulePolicy()
+
+    def test_busy_sources_are_crawled_more_often(self):
+        # Half of the output changed within a day: aim for 10% per run.
+        result = scheduling.next_entry(scheduled(), observation(0.5), self.policy)
+
+        self.assertEqual(result.interval_seconds, self.policy.min_interval.total_seconds())
+        self.assertEqual(result.next_run_at, NOW + self.policy.min_interval)
+        self.assertAlmostEqual(result.change_rate, 0.5)
+
+    def test_stable_sources_back_off_gradually_up_to_the_maximum(self):
+        entry = scheduled()
+        intervals = []
+        for _ in range(5):
+            entry = scheduling.next_entry(entry, observation(0.0, started_at=entry.next_run_at), self.policy)
+            intervals.append(entry.interval_seconds / DAY.total_seconds())
+
+        self.assertEqual(intervals, [2, 4, 7, 7, 7])
+
+    def test_interval_follows_the_smoothed_change_rate(self):
+        result = scheduling.next_entry(scheduled(change_rate=0.05), observation(0.01), self.policy)
+
+        # 0.3 * 0.01 + 0.7 * 0.05 = 0.038 per day; 0.1 / 0.038 = 2.6 days,
+        # capped at twice the previous interval.
+        self.assertAlmostEqual(result.change_rate, 0.038)
+        self.assertAlmostEqual(result.interval_seconds, 2 * DAY.total_seconds())
+
+    def test_failed_runs_keep_the_interval_but_retry_within_a_day(self):
+        previous = scheduled(interval=7 * DAY, change_rate=0.0)
+
+        result = scheduling.next_entry(previous, observation(None, succeeded=False), self.policy)
+
+        self.assertEqual(result.interval_seconds, (7 * DAY).total_seconds())
+        self.assertEqual(result.next_run_at, NOW + DAY)
+
+    def test_runs_without_a_diff_keep_their_interval(self):
+        result = scheduling.next_entry(None, observation(None), self.policy)
+
+        self.assertEqual(result.interval_seconds, DAY.total_seconds())
+        self.assertIsNone(result.change_rate)
+
+    def test_policy_reads_bounds_from_environment(self):
+        environment = {"CRAWLER_MIN_INTERVAL_HOURS": "2", "CRAWLER_MAX_INTERVAL_HOURS": "48"}
+        with patch.dict(os.environ, environment):
+            policy = SchedulePolicy.from_environment()
+
+        self.assertEqual((policy.min_interval, policy.max_interval), (timedelta(hours=2), timedelta(hours=48)))
+        with self.assertRaises(ValueError):
+            SchedulePolicy(min_interval=timedelta(days=2), max_interval=DAY)
+
+
+class DueCrawlersTests(unittest.TestCase):
+    def test_unscheduled_first_then_most_overdue(self):
+        schedule = {
+            "late": ScheduleEntry("late", 1, None, None, NOW - timedelta(hours=5)),
+            "later": ScheduleEntry("later", 1, None, None, NOW - timedelta(hours=1)),
+            "waiting": ScheduleEntry("waiting", 1, None, None, NOW + timedelta(hours=1)),
+        }
+
+        due = scheduling.due_crawlers([entry("later"), entry("waiting"), entry("late"), entry("new")], schedule, NOW)
+
+        self.assertEqual([crawler.slug for crawler in due], ["new", "late", "later"])
+
+
+class ChangeFractionTests(unittest.TestCase):
+    def test_change_fraction_counts_added_changed_and_gone_records(self):
+        previous = [
+            {"title": "A", "date": "2026-11-01", "url": "https://example.com/a"},
+            {"title": "B", "date": "2026-11-02", "url": "https://example.com/b"},
+            {"title": "C", "date": "2026-11-03", "url": "https://example.com/c"},
+        ]
+        current = previous[:2] + [{"title": "D", "date": "2026-11-04", "url": "https://example.com/d"}]
+
+        self.assertAlmostEqual(diff_records(previous, current).change_fraction(), 2 / 4)
+        self.assertEqual(diff_records([], []).change_fraction(), 0.0)
+
+
+class UpdateScheduleTests(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.cursor = self.connection.cursor.return_value
+        self.cursor.__enter__.return_value = self.cursor
+        pooled_connection = patch.object(scheduling, "connection")
+        connection = pooled_connection.start()
+        connection.return_value.__enter__.return_value = self.connection
+        self.addCleanup(pooled_connection.stop)
+
+    def test_upserts_the_next_run_of_every_crawler_that_ran(self):
+        self.cursor.fetchall.side_effect = [
+            [("example", DAY.total_seconds(), None, NOW - DAY, NOW)],
+            [("example", NOW, True, 0.0)],
+        ]
+
+        updated = scheduling.update_schedule(NOW - timedelta(hours=1), SchedulePolicy())
+
+        self.assertEqual(updated[0].next_run_at, NOW + 2 * DAY)
+        upsert = self.cursor.execute.call_args_list[-1]
+        self.assertIn("ON CONFLICT (crawler) DO UPDATE", upsert.args[0])
+        self.assertEqual(upsert.args[1][0], "example")
+        self.connection.commit.assert_called_once_with()
+
+    def test_reschedules_crawlers_that_timed_out_without_a_ledger_row(self):
+        self.cursor.fetchall.side_effect = [
+            [("hanging", DAY.total_seconds(), None, NOW - DAY, NOW)],
+            [("crashed_late", NOW, True, 0.0)],
+        ]
+        since = NOW - timedelta(hours=1)
+
+        updated = scheduling.update_schedule(
+            since, SchedulePolicy(), outcomes={"hanging": False, "crashed_late": False, "unscheduled": False}
+        )
+
+        by_crawler = {entry.crawler: entry for entry in updated}
+        self.assertEqual(set(by_crawler), {"hanging", "crashed_late", "unscheduled"})
+        self.assertEqual(by_crawler["hanging"].next_run_at, since + DAY)
+        self.assertEqual(by_crawler["hanging"].last_run_at, since)
+        self.assertEqual(by_crawler["crashed_late"].next_run_at, NOW + DAY)
+        self.assertEqual(by_crawler["unscheduled"].next_run_at, since + DAY)
+
+    def test_does_nothing_without_runs(self):
+        self.cursor.fetchall.side_effect = [[], []]
+
+        self.assertEqual(scheduling.update_schedule(NOW), [])
+        self.connection.commit.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
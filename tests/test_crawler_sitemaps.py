@@ -0,0 +1,123 @@
+from datetime import UTC, datetime
+import gzip
+import io
+import unittest
+from unittest.mock import patch
+
+from crawlers.sitemaps import SitemapEntry, changed_urls, iter_sitemap, parse_lastmod
+
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def urlset(*entries, namespace=NS):
+    body = "".join(
+        f"<url><loc>{loc}</loc>{f'<lastmod>{lastmod}</lastmod>' if lastmod else ''}</url>"
+        for loc, lastmod in entries
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {namespace}>{body}</urlset>'.encode()
+
+
+def sitemap_index(*entries):
+    body = "".join(f"<sitemap><loc>{loc}</loc><lastmod>{lastmod}</lastmod></sitemap>" for loc, lastmod in entries)
+    return f'<?xml version="1.0"?><sitemapindex {NS}>{body}</sitemapindex>'.encode()
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.raw = io.BytesIO(body)
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.raw.close()
+
+
+class FakeSession:
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.requested = []
+
+    def get(self, url, stream=False):
+        self.requested.append(url)
+        body = self.bodies[url]
+        if isinstance(body, Exception):
+            raise body
+        return FakeResponse(body)
+
+
+class IterSitemapTests(unittest.TestCase):
+    def test_follows_indexes_into_gzip_sitemaps_and_filters_by_lastmod(self):
+        session = FakeSession({
+            "https://example.org/sitemap.xml": sitemap_index(
+                ("https://example.org/events.xml.gz", "2026-10-17T08:00:00+00:00"),
+                ("https://example.org/archive.xml", "2024-01-01"),
+            ),
+            "https://example.org/events.xml.gz": gzip.compress(urlset(
+                ("https://example.org/koncert/new", "2026-10-17"),
+                ("https://example.org/koncert/old", "2026-09-01"),
+                ("https://example.org/koncert/undated", None),
+                ("https://example.org/o-nas", "2026-10-17"),
+            )),
+        })
+
+        entries = list(iter_sitemap(
+            "https://example.org/sitemap.xml",
+            session=session,
+            pattern=r"/koncert/",
+            since=datetime(2026, 10, 17, 12, tzinfo=UTC),
+        ))
+
+        self.assertEqual(
+            entries,
+            [
+                SitemapEntry("https://example.org/koncert/new", datetime(2026, 10, 17, tzinfo=UTC)),
+                SitemapEntry("https://example.org/koncert/undated", None),
+            ],
+        )
+        self.assertNotIn("https://example.org/archive.xml", session.requested)
+
+    def test_without_since_every_matching_url_is_returned_once(self):
+        session = FakeSession({
+            "https://example.org/sitemap.xml": urlset(
+                ("https://example.org/a", "2020-01-01"),
+                ("https://example.org/b", None),
+                ("https://example.org/a", "2020-01-01"),
+                namespace="",
+            ),
+        })
+
+        self.assertEqual(
+            changed_urls("https://example.org/sitemap.xml", session=session),
+            ["https://example.org/a", "https://example.org/b"],
+        )
+
+    @patch("crawlers.sitemaps.log_message")
+    def test_broken_child_sitemap_is_skipped(self, log_message):
+        session = FakeSession({
+            "https://example.org/sitemap.xml": sitemap_index(
+                ("https://example.org/broken.xml", "2026-10-17"),
+                ("https://example.org/events.xml", "2026-10-17"),
+            ),
+            "https://example.org/broken.xml": OSError("connection reset"),
+            "https://example.org/events.xml": urlset(("https://example.org/koncert/1", None)),
+        })
+
+        urls = changed_urls("https://example.org/sitemap.xml", session=session)
+
+        self.assertEqual(urls, ["https://example.org/koncert/1"])
+        self.assertEqual(log_message.call_args.kwargs["event"], "crawler_sitemap_failed")
+
+    def test_parse_lastmod(self):
+        self.assertEqual(parse_lastmod("2026-10-17"), datetime(2026, 10, 17, tzinfo=UTC))
+        self.assertEqual(parse_lastmod(" 2026-10-17T10:00Z "), datetime(2026, 10, 17, 10, tzinfo=UTC))
+        self.assertEqual(parse_lastmod("2026-10-17T10:00:00.000+02:00"), datetime(2026, 10, 17, 8, tzinfo=UTC))
+        self.assertIsNone(parse_lastmod("yesterday"))
+
+
+if __name__ == "__main__":
+    unittest.main()
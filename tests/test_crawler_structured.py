@@ -0,0 +1,140 @@
+import json
+import unittest
+from urllib.parse import parse_qs, urlparse
+
+from crawlers.structured import (
+    fetch_tribe_events,
+    fetch_wp_collection,
+    json_ld_records,
+    tribe_event_record,
+)
+
+
+class FakeResponse:
+    def __init__(self, payload, headers=None):
+        self.payload = payload
+        self.headers = headers or {}
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+        query = parse_qs(urlparse(url).query)
+        return self.pages(int(query["page"][0]), query)
+
+
+def tribe_event(index, **overrides):
+    return {
+        "title": f"Koncert &#8211; {index}",
+        "url": f"https://example.org/event/{index}/",
+        "start_date": "2026-11-20 19:30:00",
+        "end_date": "2026-11-20 21:00:00",
+        "all_day": False,
+        "description": "<p>Program:&nbsp;Dvořák</p><p>Suk</p>",
+        "venue": {"venue": "Rudolfinum", "city": "Praha"},
+        "categories": [{"name": "Koncerty"}],
+        **overrides,
+    }
+
+
+class PaginationTests(unittest.TestCase):
+    def test_tribe_pages_are_fetched_after_reading_the_total(self):
+        session = FakeSession(
+            lambda page, _query: FakeResponse({"events": [tribe_event(page)], "total": 3, "total_pages": 3})
+        )
+
+        events = fetch_tribe_events("https://example.org/", session=session, params={"categories": "koncerty"})
+
+        self.assertEqual([event["url"] for event in events], [f"https://example.org/event/{page}/" for page in (1, 2, 3)])
+        self.assertEqual(len(session.urls), 3)
+        query = parse_qs(urlparse(session.urls[0]).query)
+        self.assertEqual(urlparse(session.urls[0]).path, "/wp-json/tribe/events/v1/events")
+        self.assertEqual((query["categories"], query["per_page"]), (["koncerty"], ["50"]))
+
+    def test_wp_collection_requests_only_the_projected_fields(self):
+        session = FakeSession(
+            lambda page, _query: FakeResponse([{"id": page}], headers={"X-WP-TotalPages": "2"})
+        )
+
+        items = fetch_wp_collection(
+            "https://example.org/wp-json/wp/v2/event", session=session, fields=["id", "title", "link"]
+        )
+
+        self.assertEqual(items, [{"id": 1}, {"id": 2}])
+        query = parse_qs(urlparse(session.urls[1]).query)
+        self.assertEqual((query["_fields"], query["per_page"], query["page"]), (["id,title,link"], ["100"], ["2"]))
+
+
+class RecordTests(unittest.TestCase):
+    def test_tribe_event_record(self):
+        self.assertEqual(
+            tribe_event_record(tribe_event(1)),
+            {
+                "title": "Koncert – 1",
+                "date": "2026-11-20",
+                "time_from": "19:30",
+                "time_to": "21:00",
+                "venue": "Rudolfinum",
+                "city": "Praha",
+                "url": "https://example.org/event/1/",
+                "type": "Koncerty",
+                "description": "Program: Dvořák\nSuk",
+            },
+        )
+        all_day = tribe_event_record(tribe_event(2, all_day=True, venue=[], categories=[]))
+        self.assertEqual((all_day["time_from"], all_day["venue"], all_day["type"]), (None, None, None))
+        self.assertIsNone(tribe_event_record(tribe_event(3, start_date="")))
+
+    def test_json_ld_records_from_graph_and_item_lists(self):
+        graph = {
+            "@context": "https://schema.org",
+            "@graph": [
+                {"@type": "WebPage", "name": "Program"},
+                {
+                    "@type": ["MusicEvent"],
+                    "name": "Recitál",
+                    "startDate": "2026-11-20T18:30:00Z",
+                    "endDate": "2026-11-20T20:00:00Z",
+                    "url": "https://example.org/recital",
+                    "location": {
+                        "@type": "Place",
+                        "name": "Zrkadlová sieň",
+                        "address": {"@type": "PostalAddress", "addressLocality": "Bratislava"},
+                    },
+                },
+            ],
+        }
+        item_list = {
+            "@type": "ItemList",
+            "itemListElement": [
+                {"@type": "ListItem", "item": {"@type": "Event", "name": "Matiné", "startDate": "2026-11-22"}},
+            ],
+        }
+        page = (
+            f'<script type="application/ld+json">{json.dumps(graph)}</script>'
+            f'<script type="application/ld+json">{json.dumps(item_list)}</script>'
+            '<script type="application/ld+json">{not json</script>'
+        )
+
+        records = json_ld_records(page, tz="Europe/Bratislava", url="https://example.org/program")
+
+        self.assertEqual(
+            [(record["title"], record["date"], record["time_from"], record["time_to"]) for record in records],
+            [("Recitál", "2026-11-20", "19:30", "21:00"), ("Matiné", "2026-11-22", None, None)],
+        )
+        self.assertEqual((records[0]["venue"], records[0]["city"]), ("Zrkadlová sieň", "Bratislava"))
+        self.assertEqual(records[1]["url"], "https://example.org/program")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from psycopg2 import extensions
+
+from db import connection as db_connection
+
+
+DB_ENVIRONMENT = {
+    "DB_NAME": "classical",
+    "DB_USER": "bot",
+    "DB_PASS": "secret",
+    "DB_HOST": "postgres",
+    "DB_PORT": "5432",
+}
+
+
+def fake_connection(status=extensions.TRANSACTION_STATUS_IDLE):
+    conn = MagicMock()
+    conn.closed = 0
+    conn.info.transaction_status = status
+    return conn
+
+
+class ConnectionParameterTests(unittest.TestCase):
+    def test_connections_detect_disappeared_clients_quickly(self):
+        with patch.dict(os.environ, DB_ENVIRONMENT, clear=True):
+            parameters = db_connection.connection_parameters()
+
+        self.assertEqual(
+            parameters,
+            {
+                "dbname": "classical",
+                "user": "bot",
+                "password": "secret",
+                "host": "postgres",
+                "port": "5432",
+                "keepalives": 1,
+                "keepalives_idle": 60,
+                "keepalives_interval": 20,
+                "keepalives_count": 3,
+                "options": "-c statement_timeout=300000",
+            },
+        )
+
+    def test_readonly_sessions_use_replica_overrides_and_reject_writes(self):
+        environment = {
+            **DB_ENVIRONMENT,
+            "DB_READONLY_HOST": "replica",
+            "DB_READONLY_USER": "reader",
+            "DB_STATEMENT_TIMEOUT_MS": "5000",
+        }
+        with patch.dict(os.environ, environment, clear=True):
+            parameters = db_connection.connection_parameters(readonly=True)
+
+        self.assertEqual(parameters["host"], "replica")
+        self.assertEqual(parameters["user"], "reader")
+        self.assertEqual(parameters["password"], "secret")
+        self.assertEqual(
+            parameters["options"],
+            "-c statement_timeout=5000 -c default_transaction_read_only=on",
+        )
+
+    def test_rejects_invalid_statement_timeout(self):
+        with patch.dict(os.environ, {"DB_STATEMENT_TIMEOUT_MS": "soon"}, clear=True):
+            with self.assertRaisesRegex(ValueError, "DB_STATEMENT_TIMEOUT_MS"):
+                db_connection.connection_parameters()
+
+
+@patch.object(db_connection.psycopg2, "connect")
+class BoundedConnectionPoolTests(unittest.TestCase):
+    def test_reuses_idle_connections(self, connect):
+        connect.side_effect = [fake_connection(), fake_connection()]
+        pool = db_connection.BoundedConnectionPool(2, dbname="classical")
+
+        first = pool.getconn()
+        pool.putconn(first)
+
+        self.assertIs(pool.getconn(), first)
+        connect.assert_called_once_with(dbname="classical")
+
+    def test_rolls_back_open_transactions_before_reuse(self, connect):
+        conn = fake_connection(extensions.TRANSACTION_STATUS_INERROR)
+        connect.return_value = conn
+        pool = db_connection.BoundedConnectionPool(1)
+
+        pool.putconn(pool.getconn())
+
+        conn.rollback.assert_called_once_with()
+        self.assertIs(pool.getconn(), conn)
+
+    def test_discards_broken_connections(self, connect):
+        broken = fake_connection(extensions.TRANSACTION_STATUS_UNKNOWN)
+        replacement = fake_connection()
+        connect.side_effect = [broken, replacement]
+        pool = db_connection.BoundedConnectionPool(1)
+
+        pool.putconn(pool.getconn())
+
+        broken.close.assert_called_once_with()
+        self.assertIs(pool.getconn(), replacement)
+
+    def test_waits_for_a_free_connection_at_the_limit(self, connect):
+        connect.side_effect = lambda **_parameters: fake_connection()
+        pool = db_connection.BoundedConnectionPool(1)
+        held = pool.getconn()
+        borrowed = []
+        waiter = threading.Thread(target=lambda: borrowed.append(pool.getconn()))
+
+        waiter.start()
+        waiter.join(0.05)
+        self.assertTrue(waiter.is_alive())
+        pool.putconn(held)
+        waiter.join(1)
+
+        self.assertEqual(borrowed, [held])
+        connect.assert_called_once_with()
+
+    def test_gives_up_waiting_after_the_timeout(self, connect):
+        connect.side_effect = lambda **_parameters: fake_connection()
+        pool = db_connection.BoundedConnectionPool(1, timeout=0.05)
+        held = pool.getconn()
+
+        # A nested borrow on the same thread must not wait for itself forever.
+        with self.assertRaisesRegex(db_connection.psycopg2_pool.PoolError, "within 0.05 seconds"):
+            pool.getconn()
+
+        pool.putconn(held)
+        self.assertIs(pool.getconn(), held)
+
+    def test_rejects_an_empty_pool(self, _connect):
+        with self.assertRaises(ValueError):
+            db_connection.BoundedConnectionPool(0)
+
+    def test_failed_connect_releases_its_slot(self, connect):
+        connect.side_effect = [OSError("refused"), fake_connection()]
+        pool = db_connection.BoundedConnectionPool(1)
+
+        with self.assertRaises(OSError):
+            pool.getconn()
+
+        self.assertIsNotNone(pool.getconn())
+
+
+class PooledConnectionTests(unittest.TestCase):
+    def tearDown(self):
+        db_connection.close_pools()
+
+    @patch.object(db_connection.psycopg2, "connect")
+    def test_context_manager_returns_connection_to_process_pool(self, connect):
+        conn = fake_connection()
+        connect.return_value = conn
+
+        with patch.dict(os.environ, DB_ENVIRONMENT, clear=True):
+            with db_connection.connection() as first:
+                pass
+            with db_connection.connection() as second:
+                pass
+            readonly_pool = db_connection.get_pool(readonly=True)
+            readwrite_pool = db_connection.get_pool()
+
+        self.assertIs(first, conn)
+        self.assertIs(second, conn)
+        connect.assert_called_once()
+        self.assertIsNot(readonly_pool, readwrite_pool)
+
+    def test_rejects_pools_too_small_for_nested_borrows(self):
+        for value in ("0", "1"):
+            environment = {**DB_ENVIRONMENT, "DB_POOL_MAX_CONNECTIONS": value}
+            with self.subTest(value=value), patch.dict(os.environ, environment, clear=True):
+                with self.assertRaisesRegex(ValueError, "at least 2"):
+                    db_connection.get_pool()
+
+    def test_reads_the_borrow_timeout_from_the_environment(self):
+        environment = {**DB_ENVIRONMENT, "DB_POOL_TIMEOUT_SECONDS": "5"}
+        with patch.dict(os.environ, environment, clear=True):
+            pool = db_connection.get_pool()
+
+        self.assertEqual(pool.timeout, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 import os
+import tempfile
+import types
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import main
+from crawlers.executor import CrawlerResult
 
 
 class MainTests(unittest.TestCase):
@@ -37,6 +40,86 @@ class MainTests(unittest.TestCase):
             main.main()
         service_main.assert_called_once_with()
 
+    def test_discovers_crawler_modules_without_importing_them(self):
+        with tempfile.TemporaryDirectory() as directory, patch.dict(
+            os.environ, {"CRAWLER_MANIFEST_PATH": f"{directory}/manifest.json"}
+        ):
+            modules = main.discover_crawler_modules()
+
+        self.assertIn("crawlers.sk.filharmonia_sk.main", modules)
+        self.assertNotIn("crawlers.sk.filharmonia_sk.main", main.sys.modules)
+
+    def test_daily_pipeline_pauses_updates_around_the_parallel_pass(self):
+        updater = MagicMock()
+        calls = []
+        updater.begin_daily_pipeline.side_effect = lambda: calls.append("begin")
+        updater.finish_daily_pipeline.side_effect = lambda: calls.append("finish")
+
+        analyzer = types.ModuleType("analyzers.analyze_potential_events")
+        analyzer.main = lambda: calls.append("potential events")
+
+        with (
+            patch.object(main, "run_crawlers", side_effect=lambda *args: calls.append("crawlers")),
+            patch.dict(main.sys.modules, {"analyzers.analyze_potential_events": analyzer}),
+        ):
+            main.run_daily_pipeline(updater, ["crawlers.sk.example.main"])
+
+        self.assertEqual(calls, ["begin", "crawlers", "potential events", "finish"])
+
+    def test_adaptive_pipeline_reschedules_after_the_crawlers(self):
+        updater = MagicMock()
+        calls = []
+        analyzer = types.ModuleType("analyzers.analyze_potential_events")
+        analyzer.main = lambda: calls.append("potential events")
+        results = [CrawlerResult("crawlers.sk.example.main", "timed_out", None, 1800.0)]
+        manifest = [main.scheduling.CrawlerEntry("example", "crawlers.sk.example.main", "SK", "classical", None)]
+
+        def run_crawlers(*args):
+            calls.append("crawlers")
+            return results
+
+        with (
+            patch.dict(os.environ, {"CRAWLER_SCHEDULE": "adaptive"}),
+            patch.object(main, "run_crawlers", side_effect=run_crawlers),
+            patch.object(main, "load_manifest", return_value=manifest),
+            patch.object(main.scheduling, "update_schedule", side_effect=lambda since, outcomes: calls.append(outcomes)),
+            patch.dict(main.sys.modules, {"analyzers.analyze_potential_events": analyzer}),
+        ):
+            main.run_daily_pipeline(updater, ["crawlers.sk.example.main"])
+
+        self.assertEqual(calls, ["crawlers", {"example": False}, "potential events"])
+
+    def test_runs_only_due_crawlers(self):
+        due = [main.scheduling.CrawlerEntry("example", "crawlers.sk.example.main", "SK", "classical", None)]
+        with (
+            patch.object(main, "load_manifest"),
+            patch.object(main.scheduling, "load_schedule"),
+            patch.object(main.scheduling, "due_crawlers", return_value=due),
+            patch.object(main, "run_daily_pipeline") as run_daily_pipeline,
+        ):
+            main.run_due_crawlers("updater")
+
+        run_daily_pipeline.assert_called_once_with("updater", ["crawlers.sk.example.main"])
+
+    def test_unreadable_schedule_runs_nothing(self):
+        with (
+            patch.object(main, "load_manifest"),
+            patch.object(main.scheduling, "load_schedule", side_effect=RuntimeError("database down")),
+            patch.object(main, "run_daily_pipeline") as run_daily_pipeline,
+            self.assertLogs("main", level="ERROR"),
+        ):
+            main.run_due_crawlers("updater")
+
+        run_daily_pipeline.assert_not_called()
+
+    def test_full_pass_argument_runs_every_crawler_once(self):
+        with (
+            patch.object(main.sys, "argv", ["main.py", "--full-pass"]),
+            patch.object(main, "full_pass_main") as full_pass_main,
+        ):
+            main.main()
+        full_pass_main.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,146 @@
+from datetime import date, time
+import math
+import unittest
+
+import pandas as pd
+
+from crawlers.base import BaseCrawler, CrawlerConfig
+
+
+def crawler(**options):
+    class ExampleCrawler(BaseCrawler):
+        config = CrawlerConfig(
+            slug="example_sk",
+            source="Example",
+            source_url="https://example.sk/",
+            **options,
+        )
+
+    return ExampleCrawler()
+
+
+def concert(**values):
+    record = {
+        "title": "Recital",
+        "date": "2026-10-20",
+        "time_from": "19:00",
+        "url": "https://example.sk/recital",
+    }
+    record.update(values)
+    return record
+
+
+CASES = {
+    "column projection": (
+        {"columns": ["title", "date", "venue"]},
+        [concert(), concert(title="Gala", extra="dropped")],
+    ),
+    "union of record keys": (
+        {},
+        [concert(), {"title": "Second", "city": "Košice"}, concert(description="Programme")],
+    ),
+    "front fields": (
+        {"front_fields": [("venue", "Hall"), ("city", "Bratislava"), ("source", "Example")]},
+        [concert(), concert(title="Gala")],
+    ),
+    "record countries": (
+        {"country_code": None},
+        [concert(country_code="cz"), concert(country_code="AT"), concert(country_code=None)],
+    ),
+    "front field country": (
+        {"country_code": None, "front_fields": [("country_code", "hu")]},
+        [concert()],
+    ),
+    "dedupe subset": (
+        {"dedupe_subset": ["title", "date"]},
+        [concert(), concert(url="https://example.sk/other"), concert(title="Gala"), concert()],
+    ),
+    "dedupe with missing values": (
+        {"dedupe_subset": ["title", "time_from"]},
+        [concert(time_from=float("nan")), concert(time_from=None), concert(time_from=pd.NaT)],
+    ),
+    "missing values": (
+        {},
+        [
+            concert(date=pd.NaT, time_from=float("nan"), description=pd.NA),
+            concert(date=date(2026, 10, 21), time_from=time(19, 30), description="Programme"),
+        ],
+    ),
+    "numbers with gaps": (
+        {"columns": ["title", "date", "url", "price"]},
+        [concert(price=12), concert(), concert(price=None)],
+    ),
+    "list values": (
+        {},
+        [concert(composers=["Bach", "Dvořák"]), concert(title="Gala", composers=None)],
+    ),
+    "no records": ({"columns": ["title", "date"]}, []),
+}
+
+
+def normalized(records):
+    # pandas widens integers with gaps to floats; 12 == 12.0 already holds,
+    # so only NaN needs care here.
+    return [
+        [(column, None if isinstance(value, float) and math.isnan(value) else value) for column, value in record.items()]
+        for record in records
+    ]
+
+
+def outcome(prepare, records):
+    try:
+        return normalized(prepare([dict(record) for record in records]))
+    except Exception as error:
+        return type(error)
+
+
+class PlainRecordEquivalenceTests(unittest.TestCase):
+    def test_plain_path_matches_dataframe_path(self):
+        for name, (options, records) in CASES.items():
+            with self.subTest(case=name):
+                example = crawler(**options)
+
+                expected = outcome(example._prepare_dataframe_records, records)
+
+                self.assertEqual(outcome(example._prepare_plain_records, records), expected)
+
+    def test_errors_match_dataframe_path(self):
+        cases = {
+            "missing country": ({"country_code": None}, [concert()]),
+            "duplicate front field": ({"front_fields": [("title", "Fixed")]}, [concert()]),
+        }
+        for name, (options, records) in cases.items():
+            with self.subTest(case=name):
+                example = crawler(**options)
+
+                self.assertIs(outcome(example._prepare_plain_records, records), ValueError)
+                self.assertIs(outcome(example._prepare_dataframe_records, records), ValueError)
+
+    def test_dataframe_transforms_keep_the_dataframe_path(self):
+        class TransformingCrawler(BaseCrawler):
+            config = CrawlerConfig(slug="t", source="T", source_url="https://example.sk/")
+
+            def transform(self, df):
+                df["title"] = df["title"].str.upper()
+                return df
+
+        self.assertFalse(crawler().uses_dataframe())
+        self.assertTrue(TransformingCrawler().uses_dataframe())
+        self.assertEqual(TransformingCrawler().prepare_records([concert()])[0]["title"], "RECITAL")
+
+    def test_record_transforms_run_on_the_plain_path(self):
+        class RecordCrawler(BaseCrawler):
+            config = CrawlerConfig(slug="r", source="R", source_url="https://example.sk/")
+
+            def transform_records(self, records):
+                return [{**record, "title": record["title"].upper()} for record in records]
+
+        prepared = RecordCrawler().prepare_records([concert()])
+
+        self.assertFalse(RecordCrawler().uses_dataframe())
+        self.assertEqual(prepared[0]["title"], "RECITAL")
+        self.assertEqual(prepared[0]["country_code"], "SK")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,17 +24,17 @@ class SearchDbTests(unittest.TestCase):
             override=True,
         )
 
-    @patch.object(search_db.psycopg2, "connect")
+    @patch.object(search_db, "connection")
     @patch.object(search_db, "load_environment")
-    def test_prod_connection_selects_prod_environment(self, load_environment, connect):
-        connection = MagicMock()
-        connect.return_value = connection
+    def test_prod_connection_selects_prod_environment(self, load_environment, connection):
+        pooled = MagicMock()
+        connection.return_value.__enter__.return_value = pooled
 
-        search_db.get_connection(prod=True)
+        with search_db.get_connection(prod=True) as conn:
+            self.assertIs(conn, pooled)
 
         load_environment.assert_called_once_with(prod=True)
-        connection.set_session.assert_called_once_with(readonly=True)
-
+        connection.assert_called_once_with(readonly=True)
 
 if __name__ == "__main__":
     unittest.main()
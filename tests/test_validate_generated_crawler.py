@@ -9,6 +9,7 @@ from automation.validate_generated_crawler import (
     validate_records,
 )
 from crawlers.base import BaseCrawler, CrawlerConfig
+from crawlers.replay import ReplayMissError
 
 
 def valid_record(**overrides):
@@ -101,6 +102,10 @@ class RecordValidationTests(unittest.TestCase):
     def test_network_errors_are_inconclusive(self):
         self.assertEqual(runtime_failure_kind(TimeoutError("slow")), "inconclusive_runtime")
         self.assertEqual(runtime_failure_kind(RuntimeError("parser bug")), "execution_error")
+        self.assertEqual(
+            runtime_failure_kind(ReplayMissError("No recorded response")),
+            "inconclusive_runtime",
+        )
 
 
 class PreparationTests(unittest.TestCase):